@@ -0,0 +1,84 @@
+"""벤치마크 저장소 조회 성능 측정
+
+가상의 비교 기업 데이터를 대량으로 만들어 업종·매출 범위 조회와 유사 기업 자동 선정 시간을 측정합니다.
+--output을 지정하면 생성한 DB 파일을 남기므로 BENCHMARK_DB_PATH로 앱에서 사용할 수 있습니다.
+
+    python bench/bench_benchmark_store.py --companies 50000 [--output benchmarks.sqlite]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from valuation.benchmarks import (  # noqa: E402
+    METRIC_OPTIONS,
+    SEED_INDUSTRY_MULTIPLES,
+    open_benchmark_store,
+)
+from valuation.peers import PeerIndex  # noqa: E402
+
+
+def synthetic_companies(n, seed=0):
+    """업종별 평균 배수 주변에 분포하는 가상의 비교 기업 n개"""
+    rng = np.random.default_rng(seed)
+    industries = np.array(list(SEED_INDUSTRY_MULTIPLES))
+    industry = rng.choice(industries, size=n)
+    revenue = np.exp(rng.normal(np.log(1e11), 1.2, size=n)).round(-6)
+    margin = np.clip(rng.normal(0.08, 0.04, size=n), 0.005, 0.4)
+    companies = pd.DataFrame({
+        'name': [f'비교기업 {i:06d}' for i in range(n)],
+        'industry': industry,
+        'revenue': revenue,
+        'operating_income': (revenue * margin).round(-6),
+        'net_income': (revenue * margin * 0.75).round(-6),
+        'total_assets': (revenue * rng.uniform(0.6, 1.8, size=n)).round(-6),
+    })
+    noise = rng.lognormal(0, 0.2, size=n)
+    for metric in METRIC_OPTIONS:
+        base = np.array([SEED_INDUSTRY_MULTIPLES[name][metric] for name in industry])
+        companies[f'multiple_{metric}'] = (base * noise).round(2)
+    return companies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=50_000)
+    parser.add_argument('--output', default=None, help='생성할 SQLite 파일 경로 (기본: 메모리)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    store = open_benchmark_store(args.output)
+    store.import_industry_multiples(SEED_INDUSTRY_MULTIPLES)
+    store.import_companies(synthetic_companies(args.companies))
+    print(f"{store.company_count():,}개 기업 적재: {time.perf_counter() - started:.2f}초")
+
+    started = time.perf_counter()
+    peer_index = PeerIndex.from_store(store)
+    print(f"유사 기업 색인 생성: {time.perf_counter() - started:.2f}초")
+
+    queries = {
+        '업종 전체 (영업이익 배수)': lambda: store.peers('제조업', '영업이익'),
+        '업종 + 매출 범위': lambda: store.peers('제조업', '영업이익', revenue_range=(5e10, 2e11)),
+        '업종 + 매출 범위 상위 10개': lambda: store.peers('제조업', '영업이익', revenue_range=(5e10, 2e11), limit=10),
+        '업종 평균 배수': lambda: store.industry_multiple('제조업', '영업이익'),
+        '최근접 유사 기업 10개 (업종)': lambda: peer_index.nearest(1e11, 8e9, 1.2e11, k=10, industry='제조업'),
+        '최근접 유사 기업 10개 (전체)': lambda: peer_index.nearest(1e11, 8e9, 1.2e11, k=10),
+    }
+    for label, query in queries.items():
+        query()
+        runs = 20
+        started = time.perf_counter()
+        for _ in range(runs):
+            result = query()
+        elapsed = (time.perf_counter() - started) / runs
+        rows = len(result) if isinstance(result, pd.DataFrame) else 1
+        print(f"{label:<24} {elapsed * 1000:8.2f}ms  ({rows:,}행)")
+
+
+if __name__ == '__main__':
+    main()
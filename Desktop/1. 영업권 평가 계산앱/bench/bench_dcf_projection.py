@@ -0,0 +1,93 @@
+"""DCF 예측 커널 벤치마크
+
+기존 dcf_page의 셀 단위 forecast_df.loc 루프와 project_cash_flows 커널의 실행 시간을 비교합니다.
+
+    python bench/bench_dcf_projection.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from valuation import forecast_frame, project_cash_flows  # noqa: E402
+
+BASE_YEAR = 2024
+BASE_REVENUE = 10_000_000_000
+GROWTH_RATE = 5.0
+OPERATING_MARGIN = 12.0
+TAX_RATE = 22.0
+DISCOUNT_RATE = 12.0
+
+
+def legacy_projection(forecast_period):
+    """기존 dcf_page의 셀 단위 계산 방식 (비교용)"""
+    forecast_years = [BASE_YEAR + i for i in range(1, forecast_period + 1)]
+    forecast_df = pd.DataFrame(index=range(forecast_period), columns=[
+        '연도', '매출액', '영업이익', '세전이익', '세금', '세후이익',
+        '감가상각비', '자본적지출', '운전자본증감', '잉여현금흐름', '할인계수', '현재가치'
+    ])
+    for i in range(forecast_period):
+        forecast_df.loc[i, '연도'] = forecast_years[i]
+        if i == 0:
+            forecast_df.loc[i, '매출액'] = BASE_REVENUE * (1 + GROWTH_RATE / 100)
+        else:
+            forecast_df.loc[i, '매출액'] = forecast_df.loc[i-1, '매출액'] * (1 + GROWTH_RATE / 100)
+        forecast_df.loc[i, '영업이익'] = forecast_df.loc[i, '매출액'] * OPERATING_MARGIN / 100
+        forecast_df.loc[i, '세전이익'] = forecast_df.loc[i, '영업이익']
+        forecast_df.loc[i, '세금'] = forecast_df.loc[i, '세전이익'] * TAX_RATE / 100
+        forecast_df.loc[i, '세후이익'] = forecast_df.loc[i, '세전이익'] - forecast_df.loc[i, '세금']
+        forecast_df.loc[i, '감가상각비'] = forecast_df.loc[i, '매출액'] * 0.03
+        forecast_df.loc[i, '자본적지출'] = forecast_df.loc[i, '매출액'] * 0.05
+        if i == 0:
+            revenue_increase = forecast_df.loc[i, '매출액'] - BASE_REVENUE
+        else:
+            revenue_increase = forecast_df.loc[i, '매출액'] - forecast_df.loc[i-1, '매출액']
+        forecast_df.loc[i, '운전자본증감'] = revenue_increase * 0.1 if revenue_increase > 0 else 0
+        forecast_df.loc[i, '잉여현금흐름'] = (
+            forecast_df.loc[i, '세후이익'] +
+            forecast_df.loc[i, '감가상각비'] -
+            forecast_df.loc[i, '자본적지출'] -
+            forecast_df.loc[i, '운전자본증감']
+        )
+        forecast_df.loc[i, '할인계수'] = 1 / ((1 + DISCOUNT_RATE / 100) ** (i + 1))
+        forecast_df.loc[i, '현재가치'] = forecast_df.loc[i, '잉여현금흐름'] * forecast_df.loc[i, '할인계수']
+    for col in ['매출액', '영업이익', '세전이익', '세금', '세후이익',
+                '감가상각비', '자본적지출', '운전자본증감', '잉여현금흐름', '현재가치']:
+        forecast_df[col] = forecast_df[col].astype(int)
+    return forecast_df
+
+
+def vectorized_projection(forecast_period):
+    """project_cash_flows 커널 + 표시용 DataFrame 변환"""
+    projection = project_cash_flows(
+        BASE_REVENUE, np.full(forecast_period, GROWTH_RATE), OPERATING_MARGIN, TAX_RATE, DISCOUNT_RATE
+    )
+    projection['year'] = np.arange(BASE_YEAR + 1, BASE_YEAR + forecast_period + 1)
+    return forecast_frame(projection)
+
+
+def best_of(func, number, repeat=5):
+    """repeat회 측정 중 최솟값 기준 1회 실행 시간(초)"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    print(f"{'예측 기간':>8} {'기존 루프(ms)':>14} {'벡터화(ms)':>12} {'배속':>8}")
+    for forecast_period in (5, 10, 30):
+        # 두 방식의 결과가 같은지 먼저 확인 (정수 변환 오차 허용)
+        legacy = legacy_projection(forecast_period)
+        vectorized = vectorized_projection(forecast_period)
+        assert np.allclose(legacy['현재가치'].astype(float), vectorized['현재가치'], atol=1)
+
+        legacy_time = best_of(lambda: legacy_projection(forecast_period), number=20)
+        vectorized_time = best_of(lambda: vectorized_projection(forecast_period), number=200)
+        print(f"{forecast_period:>8} {legacy_time * 1000:>14.3f} {vectorized_time * 1000:>12.3f} "
+              f"{legacy_time / vectorized_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
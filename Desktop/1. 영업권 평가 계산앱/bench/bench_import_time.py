@@ -0,0 +1,138 @@
+"""앱 시작 시 모듈 가져오기 시간 측정 (python -X importtime)
+
+main.py의 최상위 import만 새 프로세스에서 실행해 시작 비용을 재고, 각 페이지 모듈을 처음 열 때 추가되는 비용도 따로 잽니다.
+필수 의존성(streamlit·pandas)을 뺀 시작 비용이 예산을 넘거나 무거운 모듈(plotly.express 등)이 섞이면 종료 코드 1을 반환하며,
+같은 검사를 tests/test_import_time.py가 테스트 스위트에서 실행합니다.
+
+    python bench/bench_import_time.py [--budget-ms 200] [--repeat 3] [--json report.json]
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from views.navigation import PAGES  # noqa: E402
+
+# 시작 단계에서 가져오면 안 되는 모듈 (차트·과학 계산 라이브러리는 페이지에서만)
+# plotly.graph_objects·plotly.io는 streamlit이 테마 설정을 위해 직접 가져오므로 제외
+FORBIDDEN_AT_STARTUP = ['plotly.express', 'scipy', 'matplotlib', 'openpyxl']
+
+# 필수 의존성 자체 비용 (세션 상태에 DataFrame을 두므로 pandas도 포함, 예산에서 제외하고 따로 표시)
+FRAMEWORK_IMPORTS = ['import streamlit as st', 'import pandas as pd']
+
+MARKER = '__import_time_marker__'
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def startup_imports(main_path=os.path.join(APP_DIR, 'main.py')):
+    """main.py 최상위의 import 문 (실행 순서대로)"""
+    with open(main_path, encoding='utf-8') as handle:
+        tree = ast.parse(handle.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure(statements):
+    """문장 묶음별 (누적 시간 ms, 가져온 모듈별 자체 시간 ms) 목록
+
+    묶음 사이에 표시 줄을 넣어 importtime 출력을 나눕니다.
+    """
+    code = f"\nimport sys; sys.stderr.write('{MARKER}\\n')\n".join('\n'.join(group) for group in statements)
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               cwd=APP_DIR, capture_output=True, text=True, check=True)
+    sections = [[]]
+    for line in completed.stderr.splitlines():
+        if line.strip() == MARKER:
+            sections.append([])
+            continue
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            sections[-1].append((name, int(self_us) / 1000, int(cumulative_us) / 1000, len(indent)))
+
+    results = []
+    for entries in sections:
+        top_level = min((entry[3] for entry in entries), default=0)
+        total = sum(cumulative for _, _, cumulative, indent in entries if indent == top_level)
+        modules = {name: self_ms for name, self_ms, _, _ in entries}
+        results.append((total, modules))
+    return results
+
+
+def startup_report(budget_ms=200.0, repeat=3):
+    """시작 단계·페이지별 가져오기 시간과 예산·금지 모듈 검사 결과 (failures가 비어 있으면 통과)"""
+    startup = startup_imports()
+    app_startup = [statement for statement in startup if statement not in FRAMEWORK_IMPORTS]
+    page_modules = {page_id: spec[2] for page_id, spec in PAGES.items()}
+    groups = [FRAMEWORK_IMPORTS, app_startup] + [[f'import {module}'] for module in page_modules.values()]
+
+    runs = [measure(groups) for _ in range(repeat)]
+    best = [min(run[index][0] for run in runs) for index in range(len(groups))]
+    startup_total = best[1]
+    startup_modules = runs[0][1][1]
+
+    failures = []
+    loaded = [name for name in startup_modules
+              if any(name == forbidden or name.startswith(forbidden + '.') for forbidden in FORBIDDEN_AT_STARTUP)]
+    if loaded:
+        failures.append(f"시작 단계에서 무거운 모듈을 가져옵니다: {', '.join(loaded[:5])}")
+    if startup_total > budget_ms:
+        failures.append(f"시작 단계 가져오기 시간이 예산을 넘었습니다: {startup_total:.1f}ms > {budget_ms:.0f}ms")
+
+    return {
+        'framework_ms': best[0],
+        'startup_ms': startup_total,
+        'budget_ms': budget_ms,
+        'startup_imports': startup,
+        'app_startup_imports': app_startup,
+        'startup_modules': startup_modules,
+        'page_modules': page_modules,
+        'pages_ms': dict(zip(page_modules, best[2:])),
+        'failures': failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=200.0,
+                        help='시작 단계에서 앱이 추가로 쓰는 가져오기 시간 상한 (streamlit·pandas 자체 제외)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수 (최솟값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='표시할 무거운 모듈 수')
+    parser.add_argument('--json', default=None, help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    report = startup_report(args.budget_ms, args.repeat)
+    framework_total, startup_total = report['framework_ms'], report['startup_ms']
+    startup_modules = report['startup_modules']
+
+    print(f"streamlit·pandas 자체:  {framework_total:8.1f}ms")
+    print(f"시작 단계 앱 추가분:   {startup_total:8.1f}ms  (예산 {args.budget_ms:.0f}ms, {len(startup_modules)}개 모듈)")
+    print(f"합계:                  {framework_total + startup_total:8.1f}ms")
+    for statement in report['app_startup_imports']:
+        print(f"  {statement}")
+    print(f"\n앱 추가분 중 자체 시간 상위 {args.top}개 모듈")
+    for name, self_ms in sorted(startup_modules.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<48} {self_ms:8.1f}ms")
+
+    print("\n페이지별 첫 방문 추가 시간")
+    for page_id, total in report['pages_ms'].items():
+        print(f"  {page_id:<20} {report['page_modules'][page_id]:<28} {total:8.1f}ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({key: report[key] for key in ('framework_ms', 'startup_ms', 'budget_ms', 'startup_imports',
+                                                    'pages_ms', 'failures')},
+                      handle, ensure_ascii=False, indent=2)
+
+    for failure in report['failures']:
+        print(f"\n[실패] {failure}")
+    return 1 if report['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
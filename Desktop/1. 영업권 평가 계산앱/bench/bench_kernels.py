@@ -0,0 +1,327 @@
+"""평가 커널 마이크로 벤치마크 (기준값 대비 회귀 검사)
+
+초과이익법 현재가치, DCF 예측·영구가치, 시장 배수, 상증법 보충적 평가, 종합 결과 가중평균·가중치 단체 탐색, 시나리오 일괄 비교, 숫자 형식 변환을
+각각 따로 측정해 저장된 기준값(bench/kernel_baselines.json)과 비교합니다.
+허용 오차보다 느려진 커널이 있으면 종료 코드 1을 반환하며, 네트워크 없이 실행됩니다.
+
+    python bench/bench_kernels.py [--tolerance 0.25] [--only dcf] [--json report.json]
+    python bench/bench_kernels.py --update-baseline   # 현재 측정값을 기준값으로 저장
+
+기준값은 측정한 기계에 따라 다르므로 같은 환경(CI 러너 등)에서 만든 값과 비교해야 합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from valuation import (  # noqa: E402
+    DCFInput,
+    DCFStage,
+    ExcessEarningsInput,
+    MarketComparisonInput,
+    StatutoryGoodwillInput,
+    add_scenario,
+    compare_scenarios,
+    default_benchmark_store,
+    excess_earnings_batch,
+    explore_weights,
+    goodwill_batch,
+    implied_dcf_parameter_batch,
+    project_cash_flows,
+    simplex_grid,
+    statutory_goodwill_frame,
+    tornado_analysis,
+    value_dcf,
+    value_excess_earnings,
+    value_market_comparison,
+    weighted_goodwill,
+    yearly_schedules,
+)
+from valuation.dcf import terminal_value  # noqa: E402
+from views.common import format_number, parse_number  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kernel_baselines.json')
+DEFAULT_TOLERANCE = 0.25  # 기준값 대비 허용 비율 (0.25 = 25% 느려질 때까지 허용)
+BATCH_SIZE = 100_000
+SCENARIOS = 10_000
+
+FINANCIAL_DATA = pd.DataFrame({
+    '연도': [2024, 2023, 2022, 2021, 2020],
+    '매출액': [10_000_000_000, 9_000_000_000, 8_000_000_000, 7_500_000_000, 7_000_000_000],
+    '영업이익': [1_200_000_000, 1_000_000_000, 900_000_000, 850_000_000, 800_000_000],
+    '당기순이익': [900_000_000, 800_000_000, 700_000_000, 650_000_000, 600_000_000],
+    '총자산': [5_000_000_000, 4_800_000_000, 4_500_000_000, 4_300_000_000, 4_000_000_000],
+    '총부채': [2_000_000_000, 2_000_000_000, 2_000_000_000, 1_900_000_000, 1_800_000_000],
+    '자본': [3_000_000_000, 2_800_000_000, 2_500_000_000, 2_400_000_000, 2_200_000_000],
+})
+
+
+def _excess_earnings_single():
+    params = ExcessEarningsInput()
+    return lambda: value_excess_earnings(FINANCIAL_DATA, params), 1
+
+
+def _excess_earnings_batch():
+    rng = np.random.default_rng(0)
+    roi = rng.uniform(5, 15, BATCH_SIZE)
+    rates = rng.uniform(8, 16, BATCH_SIZE)
+    years = rng.integers(3, 11, BATCH_SIZE)
+    return lambda: excess_earnings_batch(9e8, 5e9, roi, years, rates), BATCH_SIZE
+
+
+def _dcf_projection_single():
+    return lambda: project_cash_flows(1e10, [5.0] * 5, 12.0, 22.0, 12.0), 1
+
+
+def _dcf_projection_batch():
+    rng = np.random.default_rng(0)
+    growth = rng.uniform(0, 10, (SCENARIOS, 10))
+    margin = rng.uniform(5, 20, SCENARIOS)
+    return lambda: project_cash_flows(1e10, growth, margin, 22.0, 12.0), SCENARIOS
+
+
+def _terminal_value_single():
+    projection = project_cash_flows(1e10, [5.0] * 5, 12.0, 22.0, 12.0)
+    params = DCFInput.constant_growth(5.0, 5)
+    return lambda: terminal_value(projection, params), 1
+
+
+def _dcf_goodwill_batch():
+    rng = np.random.default_rng(0)
+    discount = rng.uniform(8, 16, SCENARIOS)
+    terminal_growth = rng.uniform(0, 3, SCENARIOS)
+    return lambda: goodwill_batch(1e10, np.full((SCENARIOS, 5), 5.0), 12.0, 22.0, discount, terminal_growth), SCENARIOS
+
+
+def _dcf_multistage_batch():
+    # 고성장 5년 → 감속 10년 → 안정 35년, 연도별 비율 일정과 기중 할인
+    params = DCFInput.from_stages([DCFStage(5, 8.0, operating_margin=14.0), DCFStage(10, 8.0, 3.0, operating_margin=12.0),
+                                   DCFStage(35, 3.0, operating_margin=10.0, capex_ratio=4.0)], mid_year=True)
+    schedules = yearly_schedules(asdict(params), len(params.growth_rates))
+    rng = np.random.default_rng(0)
+    discount = rng.uniform(8, 16, SCENARIOS)
+    terminal_growth = rng.uniform(0, 3, SCENARIOS)
+    growth = np.asarray(params.growth_rates)
+    return lambda: goodwill_batch(1e10, growth, 12.0, 22.0, discount, terminal_growth,
+                                  schedules=schedules, mid_year=True), SCENARIOS
+
+
+def _dcf_goal_seek_batch():
+    # 기업별 기준 매출액·순자산가치와 목표 영업권에 맞는 할인율을 한 번에 역산
+    rng = np.random.default_rng(0)
+    revenue = rng.uniform(1e9, 1e11, SCENARIOS)
+    targets = revenue * rng.uniform(0.1, 0.8, SCENARIOS)
+    params = DCFInput.constant_growth(5.0, 5, operating_margin=12.0)
+    return lambda: implied_dcf_parameter_batch(revenue, params, 'discount_rate', targets,
+                                               net_asset_value=revenue * 0.5), SCENARIOS
+
+
+def _market_multiple_single():
+    store = default_benchmark_store()
+    params = MarketComparisonInput(selected_metric='영업이익')
+    return lambda: value_market_comparison(FINANCIAL_DATA, params, '제조업', store), 1
+
+
+def _statutory_frame():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        '회사명': np.repeat(np.arange(SCENARIOS), 5).astype(str),
+        '연도': np.tile(np.arange(2020, 2025), SCENARIOS),
+        '당기순이익': rng.uniform(-1e8, 1e9, SCENARIOS * 5),
+        '자본': rng.uniform(1e8, 5e9, SCENARIOS * 5),
+    })
+    params = StatutoryGoodwillInput()
+    return lambda: statutory_goodwill_frame(data, params), SCENARIOS
+
+
+def _weighted_single():
+    values = [1.1e9, 4.4e9, 5.0e9]
+    weights = [0.3, 0.3, 0.4]
+    return lambda: weighted_goodwill(values, weights), 1
+
+
+def _weighted_batch():
+    rng = np.random.default_rng(0)
+    values = [1.1e9, 4.4e9, 5.0e9]
+    weights = rng.uniform(0, 1, (BATCH_SIZE, 3))
+    return lambda: weighted_goodwill(values, weights), BATCH_SIZE
+
+
+def _tornado_all_methods():
+    # 초과이익법·DCF·시장가치비교법 결과의 매개변수 12개를 ±10%씩 (24개 시나리오)
+    results = {
+        'excess_earnings': value_excess_earnings(FINANCIAL_DATA, ExcessEarningsInput()).as_dict(),
+        'dcf': value_dcf(FINANCIAL_DATA, DCFInput.constant_growth(5.0, 5)).as_dict(),
+        'market_comparison': value_market_comparison(FINANCIAL_DATA, MarketComparisonInput(multiple=8.0)).as_dict(),
+    }
+    return lambda: tornado_analysis(FINANCIAL_DATA, results, 10.0), 1
+
+
+def _scenario_compare():
+    # 초과이익법·DCF·시장가치비교법을 저장한 시나리오 50개 (할인율·배수만 다르게)
+    results = {
+        'excess_earnings': value_excess_earnings(FINANCIAL_DATA, ExcessEarningsInput()).as_dict(),
+        'dcf': value_dcf(FINANCIAL_DATA, DCFInput.constant_growth(5.0, 5)).as_dict(),
+        'market_comparison': value_market_comparison(FINANCIAL_DATA, MarketComparisonInput(multiple=8.0)).as_dict(),
+    }
+    base = add_scenario(None, '기본', results)
+    scenarios = pd.concat([base] * 50, ignore_index=True)
+    scenarios['name'] = [f'시나리오 {i}' for i in range(50)]
+    scenarios['dcf.discount_rate'] = np.linspace(8.0, 15.0, 50)
+    scenarios['market_comparison.multiple'] = np.linspace(5.0, 12.0, 50)
+    return lambda: compare_scenarios(FINANCIAL_DATA, scenarios), 50
+
+
+def _simplex_explore():
+    values = [1.1e9, 4.4e9, 5.0e9]
+    return lambda: explore_weights(values, simplex_grid(3, 0.01), target=4.0e9), 5151
+
+
+def _format_number_batch():
+    values = np.random.default_rng(0).uniform(-1e12, 1e12, BATCH_SIZE)
+    return lambda: [format_number(value) for value in values], BATCH_SIZE
+
+
+def _parse_number_batch():
+    texts = [f"{value:,.0f}" for value in np.random.default_rng(0).uniform(-1e12, 1e12, BATCH_SIZE)]
+    return lambda: [parse_number(text) for text in texts], BATCH_SIZE
+
+
+# 커널 이름 → (설명, 준비 함수) - 준비 함수는 (측정할 함수, 한 번에 처리하는 항목 수)를 반환
+KERNELS = {
+    'excess_earnings.value': ('초과이익법 평가 1건', _excess_earnings_single),
+    'excess_earnings.batch': (f'초과이익법 현재가치 {BATCH_SIZE:,}조합', _excess_earnings_batch),
+    'dcf.projection': ('DCF 5년 현금흐름 예측 1건', _dcf_projection_single),
+    'dcf.projection_batch': (f'DCF 10년 예측 {SCENARIOS:,}시나리오', _dcf_projection_batch),
+    'dcf.terminal_value': ('영구가치 1건', _terminal_value_single),
+    'dcf.goodwill_batch': (f'DCF 영구가치 포함 영업권 {SCENARIOS:,}시나리오', _dcf_goodwill_batch),
+    'dcf.multistage_batch': (f'DCF 3단계 50년 예측 영업권 {SCENARIOS:,}시나리오', _dcf_multistage_batch),
+    'dcf.goal_seek_batch': (f'목표 영업권 할인율 역산 {SCENARIOS:,}개 기업', _dcf_goal_seek_batch),
+    'market.value': ('시장 배수 평가 1건 (업종 배수 조회 포함)', _market_multiple_single),
+    'statutory.frame': (f'상증법 보충적 평가 {SCENARIOS:,}개 기업 (5개 연도)', _statutory_frame),
+    'results.weighted': ('종합 결과 가중평균 1건', _weighted_single),
+    'results.weighted_batch': (f'가중평균 {BATCH_SIZE:,}가중치 조합', _weighted_batch),
+    'results.simplex_explore': ('가중치 단체 0.01 격자 탐색 (방법 3개)', _simplex_explore),
+    'results.tornado': ('토네이도 분석 1건 (방법 3개, 매개변수 12개 ±10%)', _tornado_all_methods),
+    'scenarios.compare': ('시나리오 50개 일괄 비교 (방법 3개)', _scenario_compare),
+    'format.format_number': (f'format_number {BATCH_SIZE:,}개', _format_number_batch),
+    'format.parse_number': (f'parse_number {BATCH_SIZE:,}개', _parse_number_batch),
+}
+
+
+def measure(make, repeat):
+    """함수 1회 실행 시간의 최솟값 (ms)과 처리 항목 수"""
+    func, items = make()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return best * 1000, items
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(terse=True),
+    }
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def compare(ms, baseline_ms, tolerance):
+    """기준값 대비 상태 (신규/회귀/개선/유지)"""
+    if baseline_ms is None:
+        return '신규'
+    ratio = ms / baseline_ms
+    if ratio > 1 + tolerance:
+        return '회귀'
+    if ratio < 1 / (1 + tolerance):
+        return '개선'
+    return '유지'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='기준값보다 이 비율 이상 느려지면 회귀로 판단 (기본 0.25)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준값 JSON 파일 경로')
+    parser.add_argument('--update-baseline', action='store_true', help='측정값을 기준값 파일에 저장')
+    parser.add_argument('--only', default=None, help='이름에 이 문자열이 들어간 커널만 측정')
+    parser.add_argument('--repeat', type=int, default=7, help='반복 측정 횟수 (최솟값 사용)')
+    parser.add_argument('--retries', type=int, default=2, help='회귀로 보이는 커널을 다시 측정할 횟수 (일시적인 부하 제외)')
+    parser.add_argument('--json', default=None, help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    baseline_kernels = baseline.get('kernels', {})
+    selected = {name: spec for name, spec in KERNELS.items() if not args.only or args.only in name}
+
+    results = {}
+    print(f"{'커널':<26}{'설명':<32}{'시간(ms)':>12}{'기준(ms)':>12}{'비율':>8}  상태")
+    for name, (description, make) in selected.items():
+        ms, items = measure(make, args.repeat)
+        baseline_ms = baseline_kernels.get(name, {}).get('ms')
+        status = compare(ms, baseline_ms, args.tolerance)
+        for _ in range(args.retries if status == '회귀' else 0):
+            ms = min(ms, measure(make, args.repeat)[0])
+            status = compare(ms, baseline_ms, args.tolerance)
+            if status != '회귀':
+                break
+        results[name] = {
+            'description': description,
+            'ms': ms,
+            'items': items,
+            'ns_per_item': ms * 1e6 / items,
+            'baseline_ms': baseline_ms,
+            'ratio': ms / baseline_ms if baseline_ms else None,
+            'status': status,
+        }
+        ratio = f"{ms / baseline_ms:.2f}x" if baseline_ms else '-'
+        baseline_text = f"{baseline_ms:.4f}" if baseline_ms else '-'
+        print(f"{name:<26}{description:<32}{ms:>12.4f}{baseline_text:>12}{ratio:>8}  {status}")
+
+    regressions = [name for name, result in results.items() if result['status'] == '회귀']
+    if baseline and baseline.get('environment') != environment():
+        print("\n[참고] 기준값을 측정한 환경이 현재와 다릅니다:", baseline.get('environment'))
+
+    if args.update_baseline:
+        kernels = dict(baseline_kernels)
+        kernels.update({name: {'ms': result['ms'], 'items': result['items']} for name, result in results.items()})
+        with open(args.baseline, 'w', encoding='utf-8') as handle:
+            json.dump({'environment': environment(), 'kernels': kernels}, handle, ensure_ascii=False, indent=2)
+            handle.write('\n')
+        print(f"\n기준값 저장: {args.baseline}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'environment': environment(),
+                'tolerance': args.tolerance,
+                'kernels': results,
+                'regressions': regressions,
+            }, handle, ensure_ascii=False, indent=2)
+
+    if regressions and not args.update_baseline:
+        print(f"\n[실패] 허용 오차({args.tolerance:.0%})보다 느려진 커널: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
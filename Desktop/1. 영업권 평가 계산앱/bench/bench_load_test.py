@@ -0,0 +1,261 @@
+"""동시 사용자 부하 테스트 (streamlit.testing.v1.AppTest)
+
+가상 세션 N개가 한 프로세스(Streamlit 서버 하나와 같은 조건)에서 동시에
+기업 정보 입력 → 초과이익법 → DCF → 시장가치비교법 → 종합 결과 → 보고서 흐름을 실행하고,
+재실행(rerun) 지연 시간의 p50/p95/p99와 최대 메모리 사용량(RSS)을 보고합니다.
+PRD 5.3 목표(페이지 로딩 3초, 계산 5초)를 p95가 넘거나 흐름 중 오류가 나면 종료 코드 1을 반환하므로 배포 전 검사로 쓸 수 있습니다.
+
+    python bench/bench_load_test.py [--sessions 50] [--iterations 1] [--ramp-up 0] [--think-time 0] [--json report.json]
+
+기본값은 모든 세션이 쉬지 않고 동시에 누르는 최악의 경우입니다. AppTest 자체의 실행 비용도 지연 시간에 포함됩니다.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from streamlit.runtime import Runtime  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import calc_hash  # noqa: E402
+
+from valuation import open_session_store  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+APP_PATH = os.path.join(APP_DIR, 'main.py')
+
+# PRD 5.3 성능 목표
+PAGE_LOAD_TARGET = 3.0  # 초
+CALCULATION_TARGET = 5.0  # 초
+CONCURRENT_USERS_TARGET = 50
+
+PAGE_LOAD = '페이지 로딩'
+CALCULATION = '계산'
+PERCENTILES = (50, 95, 99)
+EXPECTED_METHODS = ('excess_earnings', 'dcf', 'market_comparison')
+
+# 업로드한 것으로 간주할 재무 데이터 (AppTest는 파일 업로드를 지원하지 않으므로 세션 저장소에 미리 넣어 둠)
+SAMPLE_FINANCIAL_DATA = pd.DataFrame({
+    '연도': [2024, 2023, 2022],
+    '매출액': [10_000_000_000, 9_000_000_000, 8_000_000_000],
+    '영업이익': [1_200_000_000, 1_000_000_000, 900_000_000],
+    '당기순이익': [900_000_000, 800_000_000, 700_000_000],
+    '총자산': [5_000_000_000, 4_800_000_000, 4_500_000_000],
+    '총부채': [2_000_000_000, 2_000_000_000, 2_000_000_000],
+    '자본': [3_000_000_000, 2_800_000_000, 2_500_000_000],
+})
+
+
+def click(label):
+    """라벨이 label인 버튼을 누르는 동작"""
+    def action(at):
+        next(button for button in at.button if button.label == label).click()
+    action.__name__ = label
+    return action
+
+
+def save_company_info(at):
+    """기업 정보 입력 페이지에서 회사명을 입력하고 저장"""
+    next(text_input for text_input in at.text_input if text_input.label == '회사명').input('부하 테스트 기업')
+    click('저장')(at)
+
+
+# (구분, 페이지 ID, 동작) - 동작이 없으면 페이지를 처음 여는 단계
+FLOW = [
+    (PAGE_LOAD, 'company_info', None),
+    (CALCULATION, 'company_info', save_company_info),
+    (PAGE_LOAD, 'excess_earnings', None),
+    (CALCULATION, 'excess_earnings', click('평가 계산')),
+    (PAGE_LOAD, 'dcf', None),
+    (CALCULATION, 'dcf', click('기본 DCF 계산')),
+    (PAGE_LOAD, 'market_comparison', None),
+    (CALCULATION, 'market_comparison', click('평가 계산')),
+    (PAGE_LOAD, 'results', None),
+    (PAGE_LOAD, 'report', None),
+]
+
+
+def open_page(at, page_id):
+    """AppTest.switch_page는 파일 경로만 받으므로 URL 경로의 페이지 해시를 직접 지정"""
+    at._page_hash = calc_hash(page_id)
+
+
+def share_test_runtime():
+    """모든 가상 세션이 처음 만들어진 가짜 런타임 하나를 쓰도록 고정
+
+    AppTest는 실행할 때마다 전역 Runtime을 가짜로 바꿨다가 None으로 되돌리므로,
+    여러 세션을 동시에 실행하면 서로의 런타임을 지웁니다. 실제 서버처럼 런타임 하나를 공유하게 합니다.
+    """
+    shared = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            shared.setdefault('runtime', cls._instance)
+        if 'runtime' not in shared:
+            raise RuntimeError("Runtime hasn't been created!")
+        return shared['runtime']
+
+    def exists(cls):
+        return cls._instance is not None or 'runtime' in shared
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_session(session_db_path, iterations, timeout, start, delay=0.0, think_time=0.0):
+    """가상 세션 하나의 전체 흐름 실행, (구분, 단계, 지연 초) 목록과 오류 목록 반환
+
+    delay만큼 기다렸다가 시작하고, 단계 사이에 think_time만큼 쉽니다 (지연 시간에는 포함하지 않음).
+    """
+    session_id = uuid.uuid4().hex
+    open_session_store(session_db_path).save(session_id, {
+        'company_data': {'name': '', 'industry': '', 'business_number': '',
+                         'financial_data': SAMPLE_FINANCIAL_DATA.copy()},
+        'valuation_results': {},
+    })
+
+    samples, errors = [], []
+    start.wait()
+    time.sleep(delay)
+    for _ in range(iterations):
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        at.query_params['sid'] = session_id
+        for kind, page_id, action in FLOW:
+            if think_time and samples:
+                time.sleep(think_time)
+            step = f"{page_id}:{action.__name__ if action else 'open'}"
+            try:
+                if action is None:
+                    open_page(at, page_id)
+                else:
+                    action(at)
+                began = time.perf_counter()
+                at.run()
+                samples.append((kind, step, time.perf_counter() - began))
+            except Exception as error:  # 시간 초과·요소 없음 등은 오류로 집계하고 계속 진행
+                errors.append(f"{step}: {error}")
+                continue
+            if at.exception:
+                errors.append(f"{step}: {at.exception[0].value}")
+
+        missing = [method for method in EXPECTED_METHODS if method not in at.session_state.valuation_results]
+        if missing:
+            errors.append(f"평가 결과 누락: {', '.join(missing)}")
+    return samples, errors
+
+
+def summarize(latencies):
+    """지연 시간 목록의 건수·백분위·최댓값 (ms)"""
+    values = np.asarray(latencies) * 1000
+    summary = {'count': int(values.size)}
+    if values.size:
+        summary.update({f"p{q}": float(np.percentile(values, q)) for q in PERCENTILES})
+        summary['max'] = float(values.max())
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=CONCURRENT_USERS_TARGET, help='동시 가상 세션 수')
+    parser.add_argument('--iterations', type=int, default=1, help='세션별 전체 흐름 반복 횟수')
+    parser.add_argument('--ramp-up', type=float, default=0.0,
+                        help='세션 시작을 고르게 나눌 기간 (초, 0이면 모든 세션이 동시에 시작)')
+    parser.add_argument('--think-time', type=float, default=0.0, help='단계 사이 사용자 대기 시간 (초)')
+    parser.add_argument('--timeout', type=float, default=120.0, help='재실행 한 번의 최대 대기 시간 (초)')
+    parser.add_argument('--json', default=None, help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        session_db_path = os.path.join(workdir, 'sessions.sqlite')
+        os.environ['SESSION_DB_PATH'] = session_db_path
+        share_test_runtime()
+        baseline_rss = peak_rss_mb()
+
+        start = threading.Barrier(args.sessions)
+        began = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+            futures = [executor.submit(run_session, session_db_path, args.iterations, args.timeout, start,
+                                       index * args.ramp_up / args.sessions, args.think_time)
+                       for index in range(args.sessions)]
+            outcomes = [future.result() for future in futures]
+        elapsed = time.perf_counter() - began
+
+    samples = [sample for session_samples, _ in outcomes for sample in session_samples]
+    errors = [error for _, session_errors in outcomes for error in session_errors]
+    summaries = {
+        kind: summarize([latency for sample_kind, _, latency in samples if sample_kind == kind])
+        for kind in (PAGE_LOAD, CALCULATION)
+    }
+    summaries['전체'] = summarize([latency for _, _, latency in samples])
+    steps = {}
+    for _, step, latency in samples:
+        steps.setdefault(step, []).append(latency)
+    step_summaries = {step: summarize(latencies) for step, latencies in steps.items()}
+    rss = peak_rss_mb()
+
+    print(f"동시 세션 {args.sessions}개 × 흐름 {args.iterations}회 (시작 분산 {args.ramp_up:g}초, 단계 간 대기 {args.think_time:g}초), "
+          f"재실행 {len(samples):,}건, 총 {elapsed:.1f}초")
+    print(f"\n{'구분':<12}{'건수':>8}" + ''.join(f"{f'p{q}':>10}" for q in PERCENTILES) + f"{'최대':>10}  (ms)")
+    for kind, summary in summaries.items():
+        if summary['count']:
+            print(f"{kind:<12}{summary['count']:>8}" + ''.join(f"{summary[f'p{q}']:>10.0f}" for q in PERCENTILES)
+                  + f"{summary['max']:>10.0f}")
+    print("\n단계별 p95 (ms)")
+    for step, summary in step_summaries.items():
+        print(f"  {step:<40}{summary['p95']:>10.0f}")
+    if rss is not None:
+        print(f"\n최대 RSS: {rss:.0f}MB (시작 전 {baseline_rss:.0f}MB, 세션당 약 {(rss - baseline_rss) / args.sessions:.1f}MB)")
+
+    failures = []
+    for kind, target in ((PAGE_LOAD, PAGE_LOAD_TARGET), (CALCULATION, CALCULATION_TARGET)):
+        p95 = summaries[kind].get('p95')
+        if p95 is not None and p95 > target * 1000:
+            failures.append(f"{kind} p95 {p95:.0f}ms가 목표 {target:.0f}초를 넘었습니다.")
+    if errors:
+        failures.append(f"흐름 실행 중 오류 {len(errors)}건 (첫 오류: {errors[0]})")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'sessions': args.sessions,
+                'iterations': args.iterations,
+                'ramp_up_s': args.ramp_up,
+                'think_time_s': args.think_time,
+                'elapsed_s': elapsed,
+                'latency_ms': summaries,
+                'steps_ms': step_summaries,
+                'peak_rss_mb': rss,
+                'baseline_rss_mb': baseline_rss,
+                'errors': errors,
+                'failures': failures,
+            }, handle, ensure_ascii=False, indent=2)
+
+    for failure in failures:
+        print(f"\n[실패] {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""테스트 공통 설정 (앱 디렉터리·bench 스크립트 경로와 예시 재무 데이터)"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, os.path.join(APP_DIR, 'bench'))
+
+
+@pytest.fixture
+def financial_data():
+    """3개 연도 예시 재무 데이터 (단위: 원)"""
+    return pd.DataFrame({
+        '연도': [2022, 2023, 2024],
+        '매출액': [8_000_000_000, 9_000_000_000, 10_000_000_000],
+        '영업이익': [900_000_000, 1_000_000_000, 1_200_000_000],
+        '당기순이익': [700_000_000, 800_000_000, 900_000_000],
+        '총자산': [4_500_000_000, 4_800_000_000, 5_000_000_000],
+        '총부채': [2_000_000_000, 2_000_000_000, 2_000_000_000],
+        '자본': [2_500_000_000, 2_800_000_000, 3_000_000_000],
+    })
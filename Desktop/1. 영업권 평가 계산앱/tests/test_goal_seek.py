@@ -0,0 +1,67 @@
+"""목표 영업권 역산 테스트 (역산 값을 다시 넣으면 목표 재현, 해가 없으면 NaN)"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from valuation import (
+    DCFInput,
+    DCFStage,
+    MarketComparisonInput,
+    ValuationError,
+    implied_dcf_parameter,
+    implied_market_multiple,
+    solve_bracketed,
+    value_dcf,
+    value_market_comparison,
+)
+
+
+def test_solve_bracketed_elementwise():
+    targets = np.array([2.0, 9.0, 50.0])
+    solution, converged, iterations = solve_bracketed(lambda x: x ** 2, targets, 0.0, 5.0)
+    assert solution[:2] == pytest.approx(np.sqrt(targets[:2]))
+    # 구간 [0, 5] 밖의 해는 NaN
+    assert np.isnan(solution[2])
+    assert list(converged) == [True, True, False]
+    assert 0 < iterations < 100
+
+
+@pytest.mark.parametrize('parameter', ['discount_rate', 'terminal_growth_rate', 'growth_rate', 'operating_margin'])
+def test_implied_dcf_parameter_round_trip(financial_data, parameter):
+    params = DCFInput.from_stages([DCFStage(3, 10.0), DCFStage(4, 6.0, end_growth_rate=3.0)])
+    base = value_dcf(financial_data, params).value
+    targets = np.array([base * 0.8, base, base * 1.2])
+    result = implied_dcf_parameter(financial_data, params, parameter, targets)
+    assert result.converged.all()
+
+    for target, value in zip(targets, result.values):
+        if parameter == 'growth_rate':
+            shift = value - np.mean(params.growth_rates)
+            trial = replace(params, growth_rates=[rate + shift for rate in params.growth_rates])
+        elif parameter == 'operating_margin':
+            # 단일 값으로 역산하므로 단계별 영업이익률 일정 대신 적용
+            trial = replace(params, operating_margin=value, operating_margins=None)
+        else:
+            trial = replace(params, **{parameter: value})
+        assert value_dcf(financial_data, trial).value == pytest.approx(target, rel=1e-6)
+
+
+def test_unreachable_target_is_nan(financial_data):
+    params = DCFInput.constant_growth(5.0, 5)
+    result = implied_dcf_parameter(financial_data, params, 'discount_rate', [1e15], bounds=(5.0, 30.0))
+    assert np.isnan(result.values[0])
+    assert not result.converged[0]
+
+
+def test_implied_market_multiple_round_trip(financial_data):
+    params = MarketComparisonInput(selected_metric='영업이익')
+    result = implied_market_multiple(financial_data, params, [1e9, 3e9])
+    for target, multiple in zip([1e9, 3e9], result.values):
+        value = value_market_comparison(financial_data, replace(params, multiple=multiple)).value
+        assert value == pytest.approx(target, rel=1e-6)
+
+
+def test_exit_multiple_requires_exit_method(financial_data):
+    with pytest.raises(ValuationError):
+        implied_dcf_parameter(financial_data, DCFInput.constant_growth(5.0, 5), 'exit_multiple', [1e9])
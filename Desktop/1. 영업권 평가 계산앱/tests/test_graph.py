@@ -0,0 +1,59 @@
+"""증분 계산 그래프 테스트 (바뀐 입력 이후 단계만 재계산, value_dcf와 같은 결과)"""
+from dataclasses import replace
+
+import pytest
+
+from valuation import DCFInput, DependencyGraph, Node, ResultCache, value_dcf, value_dcf_incremental
+from valuation.dcf import DCF_NODES
+from valuation.graph import RECOMPUTED, REUSED
+
+
+@pytest.fixture
+def graph():
+    # 다른 테스트와 캐시를 공유하지 않도록 그래프마다 새 캐시 사용
+    return DependencyGraph('dcf', DCF_NODES, cache=ResultCache())
+
+
+def test_first_evaluation_recomputes_every_stage(financial_data, graph):
+    params = DCFInput.constant_growth(5.0, 5)
+    result, trace = value_dcf_incremental(financial_data, params, graph)
+    assert set(trace.values()) == {RECOMPUTED}
+    assert set(trace) == {node.name for node in DCF_NODES}
+    assert result.value == pytest.approx(value_dcf(financial_data, params).value)
+
+
+def test_terminal_growth_change_reuses_projections(financial_data, graph):
+    params = DCFInput.constant_growth(5.0, 5)
+    value_dcf_incremental(financial_data, params, graph)
+
+    changed = replace(params, terminal_growth_rate=2.0)
+    result, trace = value_dcf_incremental(financial_data, changed, graph)
+    assert trace == {
+        'history': REUSED,
+        'base_year': REUSED,
+        'projections': REUSED,
+        'discounting': REUSED,
+        'terminal_value': RECOMPUTED,
+        'goodwill': RECOMPUTED,
+    }
+    assert result.value == pytest.approx(value_dcf(financial_data, changed).value)
+
+    _, trace = value_dcf_incremental(financial_data, changed, graph)
+    assert set(trace.values()) == {REUSED}
+
+
+def test_discount_rate_change_recomputes_downstream(financial_data, graph):
+    params = DCFInput.constant_growth(5.0, 5)
+    value_dcf_incremental(financial_data, params, graph)
+    _, trace = value_dcf_incremental(financial_data, replace(params, discount_rate=10.0), graph)
+    assert trace['projections'] == REUSED
+    assert [trace[name] for name in ('discounting', 'terminal_value', 'goodwill')] == [RECOMPUTED] * 3
+
+
+def test_cycle_is_rejected():
+    graph = DependencyGraph('cycle', [
+        Node('a', lambda b: b, depends_on=('b',)),
+        Node('b', lambda a: a, depends_on=('a',)),
+    ], cache=ResultCache())
+    with pytest.raises(ValueError, match='순환 의존성'):
+        graph.evaluate('a', {})
@@ -0,0 +1,14 @@
+"""앱 시작 시 가져오기 시간 예산·금지 모듈 검사 (python -X importtime, bench/bench_import_time.py와 같은 기준)"""
+from bench_import_time import FORBIDDEN_AT_STARTUP, startup_report
+
+
+def test_startup_imports_within_budget():
+    report = startup_report(budget_ms=200.0, repeat=3)
+    assert not report['failures'], '\n'.join(report['failures'])
+
+
+def test_no_heavy_modules_at_startup():
+    report = startup_report(repeat=1)
+    loaded = [name for name in report['startup_modules']
+              if any(name == forbidden or name.startswith(forbidden + '.') for forbidden in FORBIDDEN_AT_STARTUP)]
+    assert loaded == []
@@ -0,0 +1,62 @@
+"""재무 데이터 적재 테스트 (검증 오류의 행 번호, 청크 경계, 기업 선택)"""
+import pytest
+
+from valuation import ValuationError, load_financial_data, scan_financial_file
+
+HEADER = '연도,매출액,영업이익,당기순이익,총자산,총부채,자본\n'
+
+
+def csv_bytes(rows, header=HEADER):
+    return (header + ''.join(row + '\n' for row in rows)).encode('utf-8')
+
+
+def test_load_sorts_years_and_parses_thousands():
+    data = load_financial_data(csv_bytes([
+        '2023,"9,000,000,000",1000000000,800000000,4800000000,2000000000,2800000000',
+        '2024,10000000000,1200000000,900000000,5000000000,2000000000,3000000000',
+    ]), 'financials.csv')
+    assert list(data['연도']) == [2024, 2023]
+    assert data['매출액'].iloc[1] == 9_000_000_000
+
+
+def test_rejected_rows_are_reported_by_row_number():
+    rows = ['2024,10000000000,1200000000,900000000,5000000000,2000000000,3000000000'] * 5
+    rows[2] = '2023,abc,1000000000,800000000,4800000000,2000000000,2800000000'
+    rows[3] = '2021,-5,1000000000,800000000,4800000000,2000000000,2800000000'
+    with pytest.raises(ValuationError) as error:
+        # 청크 크기 2: 두 번째 청크의 오류도 파일 전체 기준 행 번호로 표시
+        scan_financial_file(csv_bytes(rows), 'financials.csv', chunk_size=2)
+    message = str(error.value)
+    assert "'매출액'에 숫자가 아닌 값이 있습니다 (행 3)" in message
+    assert "'매출액'은(는) 음수일 수 없습니다 (행 4)" in message
+
+
+def test_invalid_year_and_blank_values():
+    with pytest.raises(ValuationError) as error:
+        load_financial_data(csv_bytes([
+            '2024,10000000000,1200000000,900000000,5000000000,2000000000,3000000000',
+            '20.5,9000000000,1000000000,800000000,4800000000,2000000000,2800000000',
+            '2022,8000000000,,700000000,4500000000,2000000000,2500000000',
+        ]), 'financials.csv')
+    message = str(error.value)
+    assert "'연도'가 올바르지 않습니다 (행 2)" in message
+    assert "'영업이익' 값이 비어 있습니다 (행 3)" in message
+
+
+def test_missing_columns():
+    with pytest.raises(ValuationError, match='필수 컬럼이 없습니다: 자본'):
+        load_financial_data(csv_bytes(['2024,1,1,1,1,1'], header='연도,매출액,영업이익,당기순이익,총자산,총부채\n'),
+                            'financials.csv')
+
+
+def test_multi_company_file():
+    header = '회사명,' + HEADER
+    source = csv_bytes([
+        'A,2024,10000000000,1200000000,900000000,5000000000,2000000000,3000000000',
+        'B,2024,5000000000,500000000,400000000,3000000000,1000000000,2000000000',
+        'A,2023,9000000000,1000000000,800000000,4800000000,2000000000,2800000000',
+    ], header=header)
+    assert scan_financial_file(source, 'portfolio.csv', chunk_size=2).companies == {'A': 2, 'B': 1}
+    with pytest.raises(ValuationError):
+        load_financial_data(source, 'portfolio.csv')
+    assert list(load_financial_data(source, 'portfolio.csv', company='A', chunk_size=2)['연도']) == [2024, 2023]
@@ -0,0 +1,42 @@
+"""유사 기업 선정 테스트 (거리 순서·업종 필터·배수 없는 기업 제외)"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuation import PeerIndex
+
+
+@pytest.fixture
+def peer_index():
+    return PeerIndex(pd.DataFrame({
+        'name': ['A', 'B', 'C', 'D', 'E'],
+        'industry': ['제조업', '제조업', '제조업', '서비스업', '제조업'],
+        'revenue': [10e9, 12e9, 100e9, 10e9, 11e9],
+        'operating_income': [1.2e9, 1.0e9, 15e9, 1.2e9, 1.3e9],
+        'total_assets': [5e9, 6e9, 60e9, 5e9, 5.5e9],
+        'multiple_영업이익': [8.0, 7.5, 10.0, 9.0, np.nan],
+    }))
+
+
+def test_nearest_sorted_by_distance(peer_index):
+    peers = peer_index.nearest(10e9, 1.2e9, 5e9, k=4)
+    # 특성이 같은 A·D가 가장 가깝고, 규모가 큰 C가 가장 멂
+    assert set(peers['name'][:2]) == {'A', 'D'}
+    assert peers['name'].iloc[-1] == 'C'
+    assert np.all(np.diff(peers['distance']) >= 0)
+    assert peers['distance'].iloc[0] == pytest.approx(0.0)
+    # 선택 지표 배수가 없는 기업(E)은 제외
+    assert 'E' not in set(peers['name'])
+    assert list(peers['multiple']) == list(peers['multiple_영업이익'])
+
+
+def test_nearest_within_industry_and_k(peer_index):
+    peers = peer_index.nearest(10e9, 1.2e9, 5e9, k=2, industry='제조업')
+    assert list(peers['name']) == ['A', 'B']
+    assert set(peer_index.nearest(10e9, 1.2e9, industry='서비스업')['name']) == {'D'}
+
+
+def test_nearest_unknown_metric_is_empty(peer_index):
+    peers = peer_index.nearest(10e9, 1.2e9, metric='매출액')
+    assert peers.empty
+    assert {'multiple', 'distance'} <= set(peers.columns)
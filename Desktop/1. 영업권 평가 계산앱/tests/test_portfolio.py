@@ -0,0 +1,69 @@
+"""포트폴리오 일괄 평가 테스트 (일괄·묶음·기업별 계산 결과의 일치)"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuation import (
+    PORTFOLIO_COLUMNS,
+    PortfolioInput,
+    PortfolioWriter,
+    split_companies,
+    statutory_goodwill_companies,
+    statutory_goodwill_frame,
+    value_dcf,
+    value_excess_earnings,
+    value_portfolio,
+    value_statutory_goodwill,
+)
+from valuation.ingest import COMPANY_COLUMN
+
+
+@pytest.fixture
+def portfolio(financial_data):
+    """연도 순서가 섞인 3개 기업의 긴 형식 데이터"""
+    larger = financial_data.copy()
+    larger[['매출액', '영업이익', '당기순이익', '총자산', '총부채', '자본']] *= 3
+    short = financial_data.tail(2)
+    parts = [
+        financial_data.assign(**{COMPANY_COLUMN: 'A'}),
+        larger.iloc[::-1].assign(**{COMPANY_COLUMN: 'B'}),
+        short.assign(**{COMPANY_COLUMN: 'C'}),
+    ]
+    return pd.concat(parts, ignore_index=True)
+
+
+def test_statutory_frame_matches_per_company(portfolio):
+    params = PortfolioInput().statutory
+    companies = split_companies(portfolio)
+    frame = statutory_goodwill_frame(portfolio, params)
+    batch = statutory_goodwill_companies(companies, params)
+
+    assert list(frame[COMPANY_COLUMN]) == [name for name, _ in companies] == ['A', 'B', 'C']
+    expected = [value_statutory_goodwill(data, params).value for _, data in companies]
+    assert frame.iloc[:, -1].to_numpy() == pytest.approx(expected)
+    assert batch == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_value_portfolio_matches_per_company(portfolio, workers):
+    params = PortfolioInput()
+    companies = split_companies(portfolio)
+    rows = [row for batch in value_portfolio(companies, params, workers=workers, batch_size=2) for row in batch]
+
+    assert [row[COMPANY_COLUMN] for row in rows] == ['A', 'B', 'C']
+    for row, (_, data) in zip(rows, companies):
+        assert row[PORTFOLIO_COLUMNS[1]] == pytest.approx(value_excess_earnings(data, params.excess_earnings).value)
+        assert row[PORTFOLIO_COLUMNS[2]] == pytest.approx(value_dcf(data, params.dcf).value)
+        assert row[PORTFOLIO_COLUMNS[4]] == pytest.approx(value_statutory_goodwill(data, params.statutory).value)
+
+
+def test_writer_appends_batches(portfolio, tmp_path):
+    path = tmp_path / 'portfolio.csv'
+    with PortfolioWriter(path) as writer:
+        for rows in value_portfolio(split_companies(portfolio), PortfolioInput(), workers=1, batch_size=2):
+            writer.write(rows)
+    written = pd.read_csv(path, encoding='utf-8-sig')
+    assert list(written.columns) == PORTFOLIO_COLUMNS
+    assert list(written[COMPANY_COLUMN]) == ['A', 'B', 'C']
+    assert writer.rows == 3
+    assert np.isfinite(written[PORTFOLIO_COLUMNS[4]]).all()
@@ -0,0 +1,26 @@
+"""PDF 보고서 캐시 키·재무 데이터 표 테스트"""
+from datetime import date
+
+import numpy as np
+
+from valuation import build_report_pdf, report_key
+
+
+def company(financial_data):
+    return {'name': '테스트', 'industry': '제조업', 'business_number': '123-45-67890',
+            'financial_data': financial_data}
+
+
+def test_report_key_includes_valuation_date(financial_data):
+    data = company(financial_data)
+    assert report_key(data, {}, date(2026, 1, 1)) != report_key(data, {}, date(2026, 1, 2))
+    assert report_key(data, {}) == report_key(data, {}, date.today())
+
+
+def test_report_tolerates_extra_and_missing_values(financial_data):
+    financial_data = financial_data.astype(object)
+    financial_data['비고'] = ['감사 전', '감사 완료', '-']
+    financial_data.loc[0, '연도'] = np.nan
+    financial_data.loc[1, '매출액'] = 'n/a'
+    pdf = build_report_pdf(company(financial_data), {}, date(2026, 1, 1))
+    assert pdf.startswith(b'%PDF')
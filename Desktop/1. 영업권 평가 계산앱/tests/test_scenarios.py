@@ -0,0 +1,108 @@
+"""시나리오 테스트 (저장·Parquet 왕복·비교 표와 개별 평가값의 일치)"""
+import pandas as pd
+import pytest
+
+from valuation import (
+    DCFInput,
+    DCFStage,
+    ExcessEarningsInput,
+    MarketComparisonInput,
+    StatutoryGoodwillInput,
+    ValuationError,
+    add_scenario,
+    compare_scenarios,
+    merge_scenarios,
+    read_scenarios,
+    scenario_inputs,
+    scenarios_to_parquet,
+    value_dcf,
+    value_excess_earnings,
+    value_market_comparison,
+    value_statutory_goodwill,
+)
+
+EVALUATORS = {
+    'excess_earnings': value_excess_earnings,
+    'dcf': value_dcf,
+    'market_comparison': value_market_comparison,
+    'statutory': value_statutory_goodwill,
+}
+
+
+@pytest.fixture
+def scenario_params():
+    return {
+        '기본': {
+            'excess_earnings': ExcessEarningsInput(),
+            'dcf': DCFInput.constant_growth(5.0, 5),
+            'market_comparison': MarketComparisonInput(multiple=8.0),
+            'statutory': StatutoryGoodwillInput(),
+        },
+        '낙관': {
+            'excess_earnings': ExcessEarningsInput(normal_roi=8.0, weight_recent=True),
+            'dcf': DCFInput.from_stages([DCFStage(3, 12.0, operating_margin=14.0), DCFStage(4, 5.0)],
+                                        discount_rate=11.0),
+            'market_comparison': MarketComparisonInput(multiple=10.0, adjustment_factor=1.1),
+            'statutory': StatutoryGoodwillInput(normal_return_rate=8.0),
+        },
+        # 일부 방법만 저장한 시나리오
+        'DCF만': {
+            'dcf': DCFInput.constant_growth(3.0, 7, discount_rate=14.0),
+        },
+    }
+
+
+@pytest.fixture
+def scenarios(financial_data, scenario_params):
+    table = None
+    for name, methods in scenario_params.items():
+        results = {method: EVALUATORS[method](financial_data, params).as_dict() for method, params in methods.items()}
+        table = add_scenario(table, name, results)
+    return table
+
+
+def test_compare_matches_individual_valuations(financial_data, scenario_params, scenarios):
+    comparison = compare_scenarios(financial_data, scenarios)
+    assert list(comparison.index) == list(scenario_params)
+    for name, methods in scenario_params.items():
+        for method, params in methods.items():
+            result = EVALUATORS[method](financial_data, params)
+            assert comparison.loc[name, result.method] == pytest.approx(result.value)
+    assert comparison.loc['DCF만'].isna().sum() == 3
+
+
+def test_parquet_round_trip(financial_data, scenario_params, scenarios):
+    restored = read_scenarios(scenarios_to_parquet(scenarios))
+    pd.testing.assert_frame_equal(
+        compare_scenarios(financial_data, restored), compare_scenarios(financial_data, scenarios)
+    )
+    for name, methods in scenario_params.items():
+        assert scenario_inputs(restored, name) == methods
+
+
+def test_add_replaces_same_name_and_merge_prefers_imported(financial_data, scenarios):
+    result = value_dcf(financial_data, DCFInput.constant_growth(1.0, 5)).as_dict()
+    replaced = add_scenario(scenarios, '기본', {'dcf': result})
+    assert list(replaced['name']) == ['낙관', 'DCF만', '기본']
+    assert scenario_inputs(replaced, '기본') == {'dcf': DCFInput.constant_growth(1.0, 5)}
+
+    merged = merge_scenarios(scenarios, replaced.iloc[[2]])
+    assert list(merged['name']) == ['낙관', 'DCF만', '기본']
+    assert set(scenario_inputs(merged, '기본')) == {'dcf'}
+
+
+def test_invalid_scenarios(scenarios):
+    with pytest.raises(ValuationError):
+        add_scenario(scenarios, ' ', {'dcf': {}})
+    with pytest.raises(ValuationError):
+        scenario_inputs(scenarios, '없음')
+    with pytest.raises(ValuationError):
+        read_scenarios(b'not parquet')
+
+
+def test_missing_financial_item_gives_nan(financial_data, scenarios):
+    # 자기자본 자료가 없으면 상증법 열만 NaN
+    comparison = compare_scenarios(financial_data.drop(columns='자본'), scenarios)
+    statutory = value_statutory_goodwill(financial_data, StatutoryGoodwillInput()).method
+    assert comparison[statutory].isna().all()
+    assert comparison.drop(columns=statutory).notna().sum().sum() == 7
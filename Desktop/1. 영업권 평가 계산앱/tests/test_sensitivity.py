@@ -0,0 +1,63 @@
+"""민감도 분석 테스트 (토네이도 순위·격자 기준점·개별 재계산과의 일치)"""
+import numpy as np
+import pytest
+
+from valuation import (
+    DCFInput,
+    DCFStage,
+    ExcessEarningsInput,
+    StatutoryGoodwillInput,
+    dcf_goodwill,
+    dcf_sensitivity_grid,
+    tornado_analysis,
+    value_dcf,
+    value_excess_earnings,
+    value_statutory_goodwill,
+)
+
+
+def test_tornado_sorted_by_impact(financial_data):
+    results = {
+        'excess_earnings': value_excess_earnings(financial_data, ExcessEarningsInput()).as_dict(),
+        'dcf': value_dcf(financial_data, DCFInput.constant_growth(5.0, 5)).as_dict(),
+        'statutory': value_statutory_goodwill(financial_data, StatutoryGoodwillInput()).as_dict(),
+    }
+    tornado = tornado_analysis(financial_data, results, 10.0)
+    assert len(tornado) == 5 + 5 + 3
+    spans = tornado['영향 범위'].to_numpy()
+    assert np.all(spans[:-1] >= spans[1:])
+    assert '환산 기간' not in set(tornado['매개변수'])
+
+
+def test_tornado_flexes_excess_years_by_one_year(financial_data):
+    result = value_excess_earnings(financial_data, ExcessEarningsInput()).as_dict()
+    tornado = tornado_analysis(financial_data, {'excess_earnings': result}, 50.0)
+    row = tornado[tornado['매개변수'].str.startswith('초과이익 지속 연수')].iloc[0]
+    assert row['하향 영업권'] == pytest.approx(value_excess_earnings(financial_data, ExcessEarningsInput(excess_years=4)).value)
+    assert row['상향 영업권'] == pytest.approx(value_excess_earnings(financial_data, ExcessEarningsInput(excess_years=6)).value)
+
+
+def test_tornado_shifts_growth_schedule(financial_data):
+    params = DCFInput.from_stages([DCFStage(3, 20.0), DCFStage(7, -2.0)])
+    result = value_dcf(financial_data, params).as_dict()
+    row = tornado_analysis(financial_data, {'dcf': result}, 10.0).set_index('매개변수').loc['매출 성장률']
+    mean = np.mean(params.growth_rates)
+    expected = dcf_goodwill(financial_data, params, growth_rate=np.array([mean * 0.9, mean * 1.1]))
+    assert [row['하향 영업권'], row['상향 영업권']] == pytest.approx(expected.tolist())
+
+
+def test_sensitivity_grid_matches_value_at_base_point(financial_data):
+    params = DCFInput.constant_growth(5.0, 5, discount_rate=12.0, terminal_growth_rate=2.0)
+    grid = dcf_sensitivity_grid(financial_data, params, 'discount_rate', [10.0, 12.0, 14.0],
+                                'terminal_growth_rate', [1.0, 2.0, 3.0])
+    assert grid.shape == (3, 3)
+    assert grid.loc[12.0, 2.0] == pytest.approx(value_dcf(financial_data, params).value)
+    # 할인율이 오를수록, 영구 성장률이 내려갈수록 가치 감소
+    assert np.all(np.diff(grid.to_numpy(), axis=0) < 0)
+    assert np.all(np.diff(grid.to_numpy(), axis=1) > 0)
+
+
+def test_sensitivity_grid_rejects_same_parameter(financial_data):
+    with pytest.raises(ValueError):
+        dcf_sensitivity_grid(financial_data, DCFInput.constant_growth(5.0, 5), 'discount_rate', [10.0],
+                             'discount_rate', [12.0])
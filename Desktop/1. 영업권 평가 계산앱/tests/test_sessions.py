@@ -0,0 +1,51 @@
+"""세션 저장소 테스트 (저장 위치·파일 권한·저장 후 복원)"""
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from valuation import open_session_store
+from valuation.sessions import DEFAULT_SESSION_DB_PATH
+
+SESSION_ID = 'a' * 32
+
+
+def test_default_path_is_app_local():
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert DEFAULT_SESSION_DB_PATH == os.path.join(app_dir, 'data', 'goodwill_sessions.sqlite')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='POSIX 파일 권한')
+def test_session_file_is_private(tmp_path):
+    path = tmp_path / 'nested' / 'sessions.sqlite'
+    open_session_store(str(path))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_save_and_restore(tmp_path, financial_data):
+    path = str(tmp_path / 'sessions.sqlite')
+    company = {'name': '테스트', 'industry': '제조업', 'business_number': '1', 'financial_data': financial_data}
+    assert open_session_store(path).save(SESSION_ID, {'company_data': company, 'valuation_results': {}})
+
+    state = {}
+    assert open_session_store(path).restore(SESSION_ID, state)
+    assert state['company_data']['name'] == '테스트'
+    assert state['company_data']['financial_data'].equals(financial_data)
+    assert state['scenarios'].empty
+
+
+def test_eviction_leaves_live_state_untouched(tmp_path, financial_data):
+    store = open_session_store(str(tmp_path / 'sessions.sqlite'), ttl=10)
+    company = {'name': '테스트', 'industry': '제조업', 'business_number': '1', 'financial_data': financial_data}
+    state = {'company_data': company, 'valuation_results': {'dcf': {'value': 1.0}}}
+    store.save(SESSION_ID, state)
+
+    assert store.evict_idle(now=time.monotonic() + 60) == 1
+    assert state['company_data']['name'] == '테스트'
+    assert state['valuation_results'] == {'dcf': {'value': 1.0}}
+
+    restored = {}
+    assert store.restore(SESSION_ID, restored)
+    assert restored['valuation_results'] == {'dcf': {'value': 1.0}}
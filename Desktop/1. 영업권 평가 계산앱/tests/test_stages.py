@@ -0,0 +1,55 @@
+"""다단계 DCF 테스트 (단계 펼치기, 단계별 입력의 평가값, 성장률 일정 평행 이동)"""
+import numpy as np
+import pytest
+
+from valuation import (
+    DCFInput,
+    DCFStage,
+    ValuationError,
+    dcf_goodwill,
+    expand_stages,
+    shift_growth_rates,
+    value_dcf,
+)
+from test_valuation import reference_dcf
+
+
+def test_expand_stages_schedules():
+    schedules = expand_stages([
+        DCFStage(3, 20.0, operating_margin=15.0),
+        DCFStage(5, 20.0, end_growth_rate=4.0, operating_margin=12.0),
+        DCFStage(2, 3.0, capex_ratio=4.0),
+    ])
+    assert schedules['growth_rates'] == pytest.approx([20.0] * 3 + [20.0, 16.0, 12.0, 8.0, 4.0] + [3.0] * 2)
+    assert schedules['operating_margins'] == [15.0] * 3 + [12.0] * 5 + [10.0] * 2
+    assert schedules['capex_ratios'] == [5.0] * 8 + [4.0] * 2
+    assert all(len(values) == 10 for values in schedules.values())
+
+
+def test_expand_stages_skips_empty_stages():
+    assert expand_stages([DCFStage(0, 50.0), DCFStage(2, 5.0)])['growth_rates'] == [5.0, 5.0]
+    with pytest.raises(ValuationError):
+        expand_stages([DCFStage(0, 5.0)])
+
+
+def test_from_stages_matches_reference(financial_data):
+    params = DCFInput.from_stages([DCFStage(3, 12.0), DCFStage(4, 10.0, end_growth_rate=4.0), DCFStage(3, 3.0)])
+    assert params.operating_margin == 10.0
+    expected = reference_dcf(10_000_000_000, params.growth_rates, 10.0, 22.0, 12.0, 1.0, 3_000_000_000)
+    assert value_dcf(financial_data, params).value == pytest.approx(expected)
+
+
+def test_single_stage_equals_constant_growth(financial_data):
+    staged = value_dcf(financial_data, DCFInput.from_stages([DCFStage(5, 5.0)]))
+    assert staged.value == pytest.approx(value_dcf(financial_data, DCFInput.constant_growth(5.0, 5)).value)
+
+
+def test_shift_growth_rates_keeps_schedule_shape(financial_data):
+    params = DCFInput.from_stages([DCFStage(3, 20.0), DCFStage(7, -2.0)])
+    mean = np.mean(params.growth_rates)
+    shifted = shift_growth_rates(params.growth_rates, np.array([mean, mean + 1.0]))
+    assert shifted.shape == (2, 10)
+    assert shifted[0] == pytest.approx(params.growth_rates)
+    assert shifted[1] - shifted[0] == pytest.approx(np.ones(10))
+    # 평균 성장률을 기준값으로 넣으면 원래 일정의 평가값과 같음
+    assert dcf_goodwill(financial_data, params, growth_rate=mean) == pytest.approx(value_dcf(financial_data, params).value)
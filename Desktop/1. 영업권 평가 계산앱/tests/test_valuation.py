@@ -0,0 +1,125 @@
+"""평가 방법별 기준값 회귀 테스트 (손으로 계산한 값·단순 반복 계산·일괄 계산과 비교)"""
+import numpy as np
+import pytest
+
+from valuation import (
+    EXIT_MULTIPLE,
+    DCFInput,
+    ExcessEarningsInput,
+    StatutoryGoodwillInput,
+    ValuationError,
+    excess_earnings_goodwill,
+    value_dcf,
+    value_excess_earnings,
+    value_statutory_goodwill,
+)
+
+
+def annuity(rate, years):
+    return sum((1 + rate / 100) ** -t for t in range(1, years + 1))
+
+
+def reference_dcf(revenue, growth_rates, margin, tax_rate, discount_rate, terminal_growth_rate,
+                  net_asset_value, exit_multiple=None, mid_year=False):
+    """연도별 반복으로 계산한 DCF 영업권 (감가상각비 3%, 자본적지출 5%, 운전자본 매출 증가분의 10%)"""
+    r = discount_rate / 100
+    present_value = 0.0
+    for t, growth in enumerate(growth_rates, start=1):
+        previous, revenue = revenue, revenue * (1 + growth / 100)
+        operating_income = revenue * margin / 100
+        fcf = (operating_income * (1 - tax_rate / 100) + revenue * 0.03 - revenue * 0.05
+               - max(revenue - previous, 0) * 0.10)
+        discount = (1 + r) ** -(t - 0.5 if mid_year else t)
+        present_value += fcf * discount
+    if exit_multiple is None:
+        g = terminal_growth_rate / 100
+        terminal = fcf * (1 + g) / (r - g) * discount
+    else:
+        terminal = (operating_income + revenue * 0.03) * exit_multiple * discount * ((1 + r) ** -0.5 if mid_year else 1)
+    return present_value + terminal - net_asset_value
+
+
+def test_excess_earnings_known_value(financial_data):
+    result = value_excess_earnings(financial_data, ExcessEarningsInput())
+    # 평균 순이익 8억 - 총자산 50억 × 10% = 초과이익 3억, 12% 5년 연금현가
+    assert result.details['excess_profit'] == pytest.approx(300_000_000)
+    assert result.value == pytest.approx(300_000_000 * annuity(12.0, 5))
+    assert result.value == pytest.approx(1_081_432_860.7, abs=1.0)
+
+
+def test_excess_earnings_adjustments(financial_data):
+    params = ExcessEarningsInput(normal_roi=8.0, excess_years=3, discount_rate=10.0,
+                                 adjustment_factor=0.9, industry_premium=5.0)
+    result = value_excess_earnings(financial_data, params)
+    assert result.value == pytest.approx(400_000_000 * annuity(10.0, 3) * 0.9 * 1.05)
+
+
+def test_excess_earnings_weight_recent(financial_data):
+    result = value_excess_earnings(financial_data, ExcessEarningsInput(weight_recent=True))
+    # 최근 3년 3:2:1 가중평균 (9억×3 + 8억×2 + 7억×1) / 6
+    weighted = (900_000_000 * 3 + 800_000_000 * 2 + 700_000_000) / 6
+    assert result.details['avg_earnings'] == pytest.approx(weighted)
+    assert result.value == pytest.approx((weighted - 500_000_000) * annuity(12.0, 5))
+
+
+def test_excess_earnings_without_excess_profit(financial_data):
+    with pytest.raises(ValuationError):
+        value_excess_earnings(financial_data, ExcessEarningsInput(normal_roi=20.0))
+
+
+@pytest.mark.parametrize('weight_recent', [False, True])
+def test_excess_earnings_batch_matches_scalar(financial_data, weight_recent):
+    base = ExcessEarningsInput(weight_recent=weight_recent)
+    roi = np.array([6.0, 10.0, 20.0])
+    years = np.array([3, 5, 7])
+    grid = excess_earnings_goodwill(financial_data, base, normal_roi=roi[:, np.newaxis],
+                                    excess_years=years[np.newaxis, :])
+    assert grid.shape == (3, 3)
+    for i, normal_roi in enumerate(roi):
+        for j, excess_years in enumerate(years):
+            params = ExcessEarningsInput(normal_roi=normal_roi, excess_years=int(excess_years),
+                                         weight_recent=weight_recent)
+            if normal_roi == 20.0:
+                # 초과이익이 없는 조합은 스칼라 계산에서는 오류, 일괄 계산에서는 NaN
+                assert np.isnan(grid[i, j])
+                with pytest.raises(ValuationError):
+                    value_excess_earnings(financial_data, params)
+            else:
+                assert grid[i, j] == pytest.approx(value_excess_earnings(financial_data, params).value)
+
+
+def test_dcf_known_value(financial_data):
+    result = value_dcf(financial_data, DCFInput.constant_growth(5.0, 5))
+    expected = reference_dcf(10_000_000_000, [5.0] * 5, 10.0, 22.0, 12.0, 1.0, 3_000_000_000)
+    assert result.value == pytest.approx(expected)
+    assert result.value == pytest.approx(2_742_523_669.0, abs=1.0)
+    assert result.details['net_asset_value'] == pytest.approx(3_000_000_000)
+
+
+@pytest.mark.parametrize('mid_year', [False, True])
+def test_dcf_exit_multiple(financial_data, mid_year):
+    params = DCFInput(growth_rates=[10.0, 8.0, 6.0, 4.0], operating_margin=15.0, discount_rate=11.0,
+                      terminal_value_method=EXIT_MULTIPLE, exit_multiple=7.0, mid_year=mid_year)
+    expected = reference_dcf(10_000_000_000, params.growth_rates, 15.0, 22.0, 11.0, 1.0, 3_000_000_000,
+                             exit_multiple=7.0, mid_year=mid_year)
+    assert value_dcf(financial_data, params).value == pytest.approx(expected)
+
+
+def test_dcf_requires_discount_rate_above_terminal_growth(financial_data):
+    with pytest.raises(ValuationError):
+        value_dcf(financial_data, DCFInput.constant_growth(5.0, 5, discount_rate=3.0, terminal_growth_rate=3.0))
+
+
+def test_statutory_known_value(financial_data):
+    result = value_statutory_goodwill(financial_data, StatutoryGoodwillInput())
+    # 순손익 가중평균 (9억×3 + 8억×2 + 7억×1) / 6, 그 50% - 자기자본 30억 × 10%, 10% 5년 연금현가
+    weighted = (900_000_000 * 3 + 800_000_000 * 2 + 700_000_000) / 6
+    assert result.details['weighted_earnings'] == pytest.approx(weighted)
+    assert result.details['excess_profit'] == pytest.approx(weighted * 0.5 - 300_000_000)
+    assert result.value == pytest.approx((weighted * 0.5 - 300_000_000) * annuity(10.0, 5))
+    assert result.value == pytest.approx(442_258_456.4, abs=1.0)
+
+
+def test_statutory_negative_excess_profit_is_zero(financial_data):
+    result = value_statutory_goodwill(financial_data, StatutoryGoodwillInput(normal_return_rate=20.0))
+    assert result.value == 0.0
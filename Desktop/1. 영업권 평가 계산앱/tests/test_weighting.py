@@ -0,0 +1,54 @@
+"""가중평균·가중치 단체 탐색 테스트 (격자 점 수, 합 1, 목표 범위)"""
+import math
+
+import numpy as np
+import pytest
+
+from valuation import (
+    ValuationError,
+    dirichlet_weights,
+    explore_weights,
+    normalize_weights,
+    simplex_grid,
+    weighted_goodwill,
+)
+
+
+@pytest.mark.parametrize('n_methods, step', [(2, 0.1), (3, 0.01), (4, 0.05)])
+def test_simplex_grid_covers_simplex(n_methods, step):
+    grid = simplex_grid(n_methods, step)
+    divisions = round(1 / step)
+    assert grid.shape == (math.comb(divisions + n_methods - 1, n_methods - 1), n_methods)
+    assert grid.sum(axis=1) == pytest.approx(np.ones(len(grid)))
+    assert grid.min() >= 0
+    # 모든 가중치가 step의 배수이고 중복 조합이 없음
+    units = np.round(grid * divisions)
+    assert np.allclose(units, grid * divisions)
+    assert len(np.unique(units, axis=0)) == len(grid)
+
+
+def test_simplex_grid_three_methods_at_one_percent():
+    assert len(simplex_grid(3, 0.01)) == 5151
+
+
+def test_simplex_grid_rejects_invalid_step():
+    with pytest.raises(ValuationError):
+        simplex_grid(3, 0.03)
+    with pytest.raises(ValuationError):
+        simplex_grid(6, 0.001)
+
+
+def test_weighted_goodwill_normalizes():
+    values = np.array([100.0, 200.0, 400.0])
+    assert weighted_goodwill(values, [1, 1, 2]) == pytest.approx(275.0)
+    assert normalize_weights([0.0, 0.0]) == pytest.approx([0.0, 0.0])
+
+
+def test_explore_weights_hits_match_target():
+    values = np.array([100.0, 200.0, 400.0])
+    exploration = explore_weights(values, simplex_grid(3, 0.1), target=200.0, tolerance=0.05)
+    assert exploration.min == pytest.approx(100.0)
+    assert exploration.max == pytest.approx(400.0)
+    assert np.all(np.abs(exploration.values[exploration.hits] - 200.0) <= 10.0)
+    assert 0 < exploration.hit_share < 1
+    assert dirichlet_weights(3, 1000, seed=0).sum(axis=1) == pytest.approx(np.ones(1000))
@@ -0,0 +1,133 @@
+"""영업권 평가 계산 엔진
+
+Streamlit 페이지와 분리된 순수 계산 함수 모음입니다.
+배치 작업, 벤치마크 등에서 Streamlit 없이 바로 가져다 쓸 수 있습니다.
+"""
+from valuation.base import ValuationError, ValuationResult, latest_financials, net_asset_value
+from valuation.benchmarks import (
+    METRIC_OPTIONS,
+    BenchmarkStore,
+    default_benchmark_store,
+    open_benchmark_store,
+)
+from valuation.cache import RESULT_CACHE, ResultCache, cached_valuation, stable_hash
+from valuation.dcf import (
+    DCF_GRAPH,
+    DCF_STAGE_LABELS,
+    EXIT_MULTIPLE,
+    FORECAST_COLUMNS,
+    GORDON_GROWTH,
+    TERMINAL_VALUE_METHODS,
+    DCFInput,
+    DCFStage,
+    dcf_goodwill,
+    expand_stages,
+    forecast_frame,
+    goodwill_batch,
+    discount_cash_flows,
+    project_cash_flows,
+    project_operations,
+    shift_growth_rates,
+    value_dcf,
+    value_dcf_incremental,
+    weighted_average_cost_of_capital,
+    yearly_schedules,
+)
+from valuation.excess_earnings import (
+    ExcessEarningsInput,
+    annuity_factor,
+    average_earnings,
+    earnings_basis,
+    excess_earnings_batch,
+    excess_earnings_goodwill,
+    value_excess_earnings,
+)
+from valuation.goal_seek import (
+    IMPLIED_DCF_PARAMETERS,
+    GoalSeekResult,
+    implied_dcf_parameter,
+    implied_dcf_parameter_batch,
+    implied_market_multiple,
+    solve_bracketed,
+)
+from valuation.graph import DependencyGraph, Node
+from valuation.ingest import (
+    FINANCIAL_COLUMNS,
+    SUPPORTED_EXTENSIONS,
+    IngestSummary,
+    iter_financial_chunks,
+    load_financial_data,
+    scan_financial_file,
+)
+from valuation.market import (
+    MarketComparisonInput,
+    industry_multiple,
+    market_goodwill_batch,
+    metric_value,
+    normalize_industry,
+    similar_companies,
+    value_market_comparison,
+)
+from valuation.peers import PeerIndex, company_features
+from valuation.portfolio import (
+    PORTFOLIO_COLUMNS,
+    PortfolioInput,
+    PortfolioWriter,
+    read_portfolio,
+    split_companies,
+    statutory_goodwill_companies,
+    value_portfolio,
+)
+from valuation.report import REPORT_JOBS, ReportJobs, build_report_pdf, report_key
+from valuation.scenarios import (
+    SCENARIO_COLUMNS,
+    SCENARIO_METHODS,
+    SCENARIO_NAME,
+    add_scenario,
+    compare_scenarios,
+    merge_scenarios,
+    normalize_scenarios,
+    read_scenarios,
+    scenario_inputs,
+    scenarios_to_parquet,
+)
+from valuation.sensitivity import (
+    DCF_SENSITIVITY_PARAMETERS,
+    TORNADO_COLUMNS,
+    TORNADO_PARAMETERS,
+    dcf_sensitivity_grid,
+    tornado_analysis,
+)
+from valuation.sessions import (
+    SESSION_KEYS,
+    SessionStore,
+    SQLiteSessionBackend,
+    default_session_values,
+    open_session_store,
+)
+from valuation.simulation import (
+    DISTRIBUTION_KINDS,
+    SIMULATION_PARAMETERS,
+    Distribution,
+    MonteCarloResult,
+    display_histogram,
+    simulate_dcf,
+)
+from valuation.statutory import (
+    RECENT_WEIGHTS,
+    StatutoryGoodwillInput,
+    recency_weighted_earnings,
+    statutory_goodwill_batch,
+    statutory_goodwill_frame,
+    value_statutory_goodwill,
+)
+from valuation.weighting import (
+    MAX_SIMPLEX_POINTS,
+    SIMPLEX_MODES,
+    WeightExploration,
+    dirichlet_weights,
+    explore_weights,
+    normalize_weights,
+    simplex_grid,
+    weighted_goodwill,
+)
@@ -0,0 +1,52 @@
+"""평가 엔진 공통 자료형 및 도우미"""
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+RECENT_WEIGHTS = (3, 2, 1)  # 최근 연도부터 (상증법 순손익 가중평균)
+
+
+class ValuationError(ValueError):
+    """입력 데이터로 평가액을 산출할 수 없는 경우 발생"""
+
+
+@dataclass
+class ValuationResult:
+    """평가 방법별 결과
+
+    as_dict()는 st.session_state.valuation_results에 저장하는 기존 사전 형식과 동일합니다.
+    """
+    method: str
+    value: float
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def latest_financials(financial_data: pd.DataFrame) -> pd.Series:
+    """가장 최근 연도의 재무 데이터 행"""
+    if financial_data is None or financial_data.empty:
+        raise ValuationError("재무 데이터가 없습니다.")
+    latest_year = financial_data['연도'].max()
+    return financial_data[financial_data['연도'] == latest_year].iloc[0]
+
+
+def net_asset_value(latest_data: pd.Series, fallback_value: float) -> float:
+    """순자산가치 (총자산 - 총부채), 자료가 없으면 fallback_value의 60%로 가정"""
+    if '총자산' in latest_data and '총부채' in latest_data:
+        return latest_data['총자산'] - latest_data['총부채']
+    return fallback_value * 0.6
+
+
+def recency_weighted_earnings(earnings):
+    """최근 연도부터 정렬한 순손익 earnings(..., 연도 수)의 3:2:1 가중평균 (NaN인 연도는 제외)"""
+    earnings = np.asarray(earnings, dtype=float)[..., :len(RECENT_WEIGHTS)]
+    weights = np.broadcast_to(np.asarray(RECENT_WEIGHTS[:earnings.shape[-1]], dtype=float), earnings.shape)
+    weights = np.where(np.isnan(earnings), 0.0, weights)
+    total = weights.sum(axis=-1)
+    weighted = (np.nan_to_num(earnings) * weights).sum(axis=-1)
+    return np.divide(weighted, total, out=np.full(total.shape, np.nan), where=total > 0)
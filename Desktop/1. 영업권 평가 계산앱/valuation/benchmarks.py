@@ -0,0 +1,251 @@
+"""업종별 벤치마크 저장소
+
+업종 평균 배수와 비교 기업 데이터를 SQLite에 보관하고 업종·지표·매출 범위로 조회합니다.
+BENCHMARK_DB_PATH 환경 변수로 외부 DB 파일을 지정할 수 있으며,
+지정하지 않으면 내장 기본 데이터로 메모리 DB를 만듭니다.
+"""
+import functools
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+DEFAULT_INDUSTRY = '기타'
+
+# 비교 가능한 재무 지표
+METRIC_OPTIONS = ['매출액', '영업이익', '당기순이익', '총자산', 'EBITDA']
+
+# 기본 업종별 평균 배수 (실제로는 DB나 API에서 가져와야 함)
+SEED_INDUSTRY_MULTIPLES = {
+    '제조업': {'매출액': 0.8, '영업이익': 6.5, '당기순이익': 10.0, '총자산': 1.2, 'EBITDA': 5.5},
+    '서비스업': {'매출액': 1.2, '영업이익': 7.0, '당기순이익': 12.0, '총자산': 1.5, 'EBITDA': 6.0},
+    'IT/소프트웨어': {'매출액': 2.5, '영업이익': 12.0, '당기순이익': 18.0, '총자산': 2.2, 'EBITDA': 10.0},
+    '도소매업': {'매출액': 0.7, '영업이익': 5.5, '당기순이익': 9.0, '총자산': 1.0, 'EBITDA': 5.0},
+    '금융업': {'매출액': 1.5, '영업이익': 8.0, '당기순이익': 12.0, '총자산': 0.8, 'EBITDA': 7.0},
+    '건설업': {'매출액': 0.6, '영업이익': 5.0, '당기순이익': 8.0, '총자산': 0.9, 'EBITDA': 4.5},
+    '기타': {'매출액': 1.0, '영업이익': 6.0, '당기순이익': 10.0, '총자산': 1.2, 'EBITDA': 5.5},
+}
+
+# 기본 유사 기업 (가상의 데이터, multiple은 영업이익 배수)
+SEED_COMPANIES = {
+    '제조업': [
+        {'name': 'A제조', 'multiple': 5.8, 'revenue': 250000000000, 'profit': 15000000000},
+        {'name': 'B산업', 'multiple': 6.2, 'revenue': 180000000000, 'profit': 10000000000},
+        {'name': 'C기계', 'multiple': 7.1, 'revenue': 350000000000, 'profit': 22000000000}
+    ],
+    '서비스업': [
+        {'name': 'D서비스', 'multiple': 6.5, 'revenue': 120000000000, 'profit': 9000000000},
+        {'name': 'E컨설팅', 'multiple': 7.5, 'revenue': 80000000000, 'profit': 7500000000},
+        {'name': 'F솔루션', 'multiple': 7.0, 'revenue': 150000000000, 'profit': 12000000000}
+    ],
+    'IT/소프트웨어': [
+        {'name': 'G소프트', 'multiple': 11.5, 'revenue': 90000000000, 'profit': 12000000000},
+        {'name': 'H테크', 'multiple': 12.8, 'revenue': 120000000000, 'profit': 18000000000},
+        {'name': 'I솔루션', 'multiple': 11.7, 'revenue': 75000000000, 'profit': 9000000000}
+    ],
+    '도소매업': [
+        {'name': 'J유통', 'multiple': 5.2, 'revenue': 500000000000, 'profit': 12000000000},
+        {'name': 'K마트', 'multiple': 5.7, 'revenue': 450000000000, 'profit': 10000000000},
+        {'name': 'L상사', 'multiple': 5.6, 'revenue': 350000000000, 'profit': 8000000000}
+    ],
+    '금융업': [
+        {'name': 'M금융', 'multiple': 7.8, 'revenue': 220000000000, 'profit': 35000000000},
+        {'name': 'N캐피탈', 'multiple': 8.2, 'revenue': 180000000000, 'profit': 30000000000},
+        {'name': 'O파이낸스', 'multiple': 8.0, 'revenue': 200000000000, 'profit': 32000000000}
+    ],
+    '건설업': [
+        {'name': 'P건설', 'multiple': 4.8, 'revenue': 700000000000, 'profit': 21000000000},
+        {'name': 'Q엔지니어링', 'multiple': 5.2, 'revenue': 500000000000, 'profit': 18000000000},
+        {'name': 'R개발', 'multiple': 5.0, 'revenue': 600000000000, 'profit': 20000000000}
+    ],
+    '기타': [
+        {'name': '기업 X', 'multiple': 5.8, 'revenue': 150000000000, 'profit': 9000000000},
+        {'name': '기업 Y', 'multiple': 6.2, 'revenue': 180000000000, 'profit': 11000000000},
+        {'name': '기업 Z', 'multiple': 6.0, 'revenue': 160000000000, 'profit': 10000000000}
+    ]
+}
+
+# 비교 기업 컬럼 (DB 컬럼 → 화면 표시용 컬럼명)
+COMPANY_COLUMNS = {
+    'name': '기업명',
+    'industry': '업종',
+    'revenue': '매출액',
+    'operating_income': '영업이익',
+    'net_income': '당기순이익',
+    'total_assets': '총자산',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS industry_multiples (
+    industry TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    multiple REAL NOT NULL,
+    PRIMARY KEY (industry, metric)
+);
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    revenue REAL,
+    operating_income REAL,
+    net_income REAL,
+    total_assets REAL
+);
+CREATE INDEX IF NOT EXISTS idx_companies_industry_revenue ON companies (industry, revenue);
+CREATE TABLE IF NOT EXISTS company_multiples (
+    company_id INTEGER NOT NULL REFERENCES companies (id),
+    metric TEXT NOT NULL,
+    multiple REAL NOT NULL,
+    PRIMARY KEY (company_id, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_company_multiples_metric ON company_multiples (metric, company_id);
+"""
+
+
+class BenchmarkStore:
+    """업종 평균 배수와 비교 기업 조회 (여러 스레드에서 공유 가능)"""
+
+    def __init__(self, connection, path=':memory:'):
+        self.path = path
+        self._connection = connection
+        self._lock = threading.Lock()
+        self._industries = None
+
+    def __repr__(self):
+        return f"BenchmarkStore({self.path!r})"
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+            rows = cursor.fetchall()
+        return pd.DataFrame.from_records(rows, columns=[column[0] for column in cursor.description])
+
+    def industries(self):
+        """배수 데이터가 있는 업종 목록"""
+        if self._industries is None:
+            self._industries = self._query(
+                "SELECT DISTINCT industry FROM industry_multiples ORDER BY industry"
+            )['industry'].tolist()
+        return self._industries
+
+    def normalize_industry(self, industry):
+        """배수 데이터에 없는 업종은 '기타'로 처리"""
+        return industry if industry in self.industries() else DEFAULT_INDUSTRY
+
+    def industry_multiple(self, industry, metric):
+        """업종 평균 배수"""
+        result = self._query(
+            "SELECT multiple FROM industry_multiples WHERE industry = ? AND metric = ?",
+            (self.normalize_industry(industry), metric)
+        )
+        if result.empty:
+            raise KeyError(f"'{industry}' 업종의 '{metric}' 배수 데이터가 없습니다.")
+        return float(result['multiple'].iloc[0])
+
+    def peers(self, industry, metric='영업이익', revenue_range=None, limit=None):
+        """업종 내 비교 기업 (선택한 지표의 배수 포함, 매출액 내림차순)
+
+        revenue_range=(최솟값, 최댓값)을 지정하면 매출액 범위로 거릅니다.
+        """
+        sql = (
+            "SELECT c.name, c.industry, c.revenue, c.operating_income, c.net_income, c.total_assets, m.multiple "
+            "FROM companies c JOIN company_multiples m ON m.company_id = c.id AND m.metric = ? "
+            "WHERE c.industry = ?"
+        )
+        params = [metric, self.normalize_industry(industry)]
+        if revenue_range is not None:
+            sql += " AND c.revenue BETWEEN ? AND ?"
+            params.extend(revenue_range)
+        sql += " ORDER BY c.revenue DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return self._query(sql, params)
+
+    def companies_frame(self):
+        """전체 비교 기업과 지표별 배수('multiple_<지표>' 컬럼)를 한 번에 조회"""
+        companies = self._query(f"SELECT id, {', '.join(COMPANY_COLUMNS)} FROM companies ORDER BY id")
+        multiples = self._query("SELECT company_id, metric, multiple FROM company_multiples")
+        wide = multiples.pivot(index='company_id', columns='metric', values='multiple').add_prefix('multiple_')
+        return companies.join(wide, on='id')
+
+    def company_count(self):
+        return int(self._query("SELECT COUNT(*) AS n FROM companies")['n'].iloc[0])
+
+    def import_industry_multiples(self, multiples):
+        """{업종: {지표: 배수}} 형태의 업종 평균 배수 저장 (기존 값은 덮어씀)"""
+        rows = [(industry, metric, float(value))
+                for industry, metric_values in multiples.items()
+                for metric, value in metric_values.items()]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO industry_multiples (industry, metric, multiple) VALUES (?, ?, ?)", rows
+            )
+        self._industries = None
+
+    def import_companies(self, companies: pd.DataFrame):
+        """비교 기업 일괄 등록
+
+        companies는 COMPANY_COLUMNS의 DB 컬럼과 지표별 배수 컬럼('multiple_<지표>')을 가집니다.
+        """
+        columns = list(COMPANY_COLUMNS)
+        records = companies.reindex(columns=columns)
+        records = records.astype(object).where(records.notna(), None)
+        multiple_columns = {metric: f'multiple_{metric}' for metric in METRIC_OPTIONS
+                            if f'multiple_{metric}' in companies.columns}
+        with self._lock, self._connection:
+            start = self._connection.execute("SELECT COALESCE(MAX(id), 0) FROM companies").fetchone()[0] + 1
+            ids = range(start, start + len(companies))
+            self._connection.executemany(
+                f"INSERT INTO companies (id, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))})",
+                ((company_id, *row) for company_id, row in zip(ids, records.itertuples(index=False, name=None)))
+            )
+            for metric, column in multiple_columns.items():
+                values = companies[column].to_numpy()
+                self._connection.executemany(
+                    "INSERT INTO company_multiples (company_id, metric, multiple) VALUES (?, ?, ?)",
+                    ((company_id, metric, float(value)) for company_id, value in zip(ids, values) if pd.notna(value))
+                )
+
+
+def seed_companies():
+    """기본 유사 기업 데이터를 import_companies 형식으로 변환
+
+    기본 데이터의 배수는 영업이익 배수이므로, 다른 지표의 배수는 업종 평균 배수의 비율로 환산합니다.
+    """
+    rows = []
+    for industry, companies in SEED_COMPANIES.items():
+        industry_multiples = SEED_INDUSTRY_MULTIPLES[industry]
+        for company in companies:
+            row = {
+                'name': company['name'],
+                'industry': industry,
+                'revenue': company['revenue'],
+                'operating_income': company['profit'],
+            }
+            for metric in METRIC_OPTIONS:
+                row[f'multiple_{metric}'] = company['multiple'] * industry_multiples[metric] / industry_multiples['영업이익']
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def open_benchmark_store(path=None):
+    """벤치마크 저장소 열기 (경로가 없으면 기본 데이터로 메모리 DB 생성)"""
+    if path:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.executescript(SCHEMA)
+        return BenchmarkStore(connection, path)
+
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.executescript(SCHEMA)
+    store = BenchmarkStore(connection)
+    store.import_industry_multiples(SEED_INDUSTRY_MULTIPLES)
+    store.import_companies(seed_companies())
+    return store
+
+
+@functools.lru_cache(maxsize=None)
+def default_benchmark_store():
+    """프로세스 기본 벤치마크 저장소 (BENCHMARK_DB_PATH 환경 변수 사용)"""
+    return open_benchmark_store(os.environ.get('BENCHMARK_DB_PATH'))
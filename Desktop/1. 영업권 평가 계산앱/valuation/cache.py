@@ -0,0 +1,111 @@
+"""평가 결과 캐시
+
+재무 데이터와 평가 매개변수의 내용 해시를 키로 결과를 보관합니다.
+프로세스 단위로 하나만 두므로 같은 서버의 모든 세션이 공유하며,
+최대 항목 수(LRU)와 유효 시간(TTL)으로 크기를 제한합니다.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+
+import pandas as pd
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL = 3600  # 초 (PRD 세션 타임아웃 1시간)
+
+
+def _json_default(value):
+    """numpy 스칼라 등 JSON 기본 직렬화가 안 되는 값 처리"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def stable_hash(*parts):
+    """DataFrame·데이터클래스·기본 자료형으로 이루어진 값들의 안정적인 SHA-256 해시"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            digest.update(json.dumps([list(map(str, part.columns)), list(map(str, part.dtypes))]).encode())
+            digest.update(pd.util.hash_pandas_object(part, index=False).values.tobytes())
+        else:
+            if is_dataclass(part):
+                part = asdict(part)
+            digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=_json_default).encode())
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """스레드 안전한 LRU + TTL 캐시 (적중/미스/제거 횟수 집계)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """(적중 여부, 값) 반환"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """캐시에 없으면 compute()로 계산해 저장 (계산 중에는 잠금을 잡지 않음)"""
+        found, value = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+# 프로세스 전역 캐시 (모든 세션 공유)
+RESULT_CACHE = ResultCache()
+
+
+def cached_valuation(method, func, financial_data, params, *args, cache=None):
+    """func(financial_data, params, *args) 결과를 입력 내용 해시로 캐시"""
+    cache = cache or RESULT_CACHE
+    key = stable_hash(method, financial_data, params, *args)
+    return cache.get_or_compute(key, lambda: func(financial_data, params, *args))
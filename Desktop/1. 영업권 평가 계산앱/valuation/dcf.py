@@ -0,0 +1,459 @@
+"""현금흐름할인법(DCF) 평가
+
+예측 기간은 연도별 배열로 계산하므로 고성장·감속·안정 단계를 이어 붙인 50년 이상의 장기 예측도
+5년 예측과 같은 방식(배열 연산 한 번)으로 처리합니다. 영업이익률·감가상각비·자본적지출·운전자본 비율은
+연도별 일정으로 줄 수 있고, 기중(mid-year) 할인 관행도 선택할 수 있습니다.
+"""
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError, ValuationResult, latest_financials, net_asset_value
+from valuation.graph import DependencyGraph, Node
+
+METHOD_NAME = '현금흐름할인법(DCF)'
+
+# 영구가치 계산 방법
+GORDON_GROWTH = '영구성장모델(Gordon Growth)'
+EXIT_MULTIPLE = 'Exit Multiple'
+TERMINAL_VALUE_METHODS = [GORDON_GROWTH, EXIT_MULTIPLE]
+
+# 예측 결과 키 → 화면 표시용 컬럼명
+FORECAST_COLUMNS = {
+    'year': '연도',
+    'revenue': '매출액',
+    'operating_income': '영업이익',
+    'pretax_income': '세전이익',
+    'tax': '세금',
+    'after_tax_income': '세후이익',
+    'depreciation': '감가상각비',
+    'capex': '자본적지출',
+    'working_capital_change': '운전자본증감',
+    'fcf': '잉여현금흐름',
+    'discount_factor': '할인계수',
+    'present_value': '현재가치',
+}
+
+# 기본 가정 (매출액 대비 비율)
+DEPRECIATION_RATIO = 0.03      # 감가상각비: 매출액의 3%
+CAPEX_RATIO = 0.05             # 자본적지출: 매출액의 5%
+WORKING_CAPITAL_RATIO = 0.10   # 운전자본증감: 매출액 증가분의 10%
+
+# DCFInput의 연도별 일정 필드(% 단위) → (project_operations schedules 키, 단위 환산 배율)
+SCHEDULE_FIELDS = {
+    'operating_margins': ('operating_margin', 1.0),
+    'depreciation_ratios': ('depreciation_ratio', 0.01),
+    'capex_ratios': ('capex_ratio', 0.01),
+    'working_capital_ratios': ('working_capital_ratio', 0.01),
+}
+
+
+def _as_batch(value):
+    """스칼라/배열 매개변수를 연도 축(마지막 축)에 브로드캐스팅 가능한 형태로 변환"""
+    return np.asarray(value, dtype=float)[..., np.newaxis]
+
+
+def project_cash_flows(base_revenue, growth_rates, operating_margin, tax_rate, discount_rate,
+                       depreciation_ratio=DEPRECIATION_RATIO, capex_ratio=CAPEX_RATIO,
+                       working_capital_ratio=WORKING_CAPITAL_RATIO, schedules=None, mid_year=False):
+    """예측 기간 전체의 현금흐름을 NumPy 배열 연산으로 한 번에 계산
+
+    growth_rates는 연도별 매출 성장률(%)이며 마지막 축이 연도입니다.
+    나머지 매개변수(%)는 스칼라이거나 앞쪽 축이 growth_rates와 브로드캐스팅 가능한 배열이면
+    여러 시나리오를 한 번에 계산합니다. 결과는 FORECAST_COLUMNS의 키(연도 제외)를 갖는 배열 사전입니다.
+    schedules는 project_operations, mid_year는 discount_cash_flows를 참고하세요.
+    """
+    projection = project_operations(base_revenue, growth_rates, operating_margin, tax_rate,
+                                    depreciation_ratio, capex_ratio, working_capital_ratio, schedules)
+    projection.update(discount_cash_flows(projection['fcf'], discount_rate, mid_year))
+    return projection
+
+
+def project_operations(base_revenue, growth_rates, operating_margin, tax_rate,
+                       depreciation_ratio=DEPRECIATION_RATIO, capex_ratio=CAPEX_RATIO,
+                       working_capital_ratio=WORKING_CAPITAL_RATIO, schedules=None):
+    """할인 전 단계: 매출액부터 잉여현금흐름까지 (할인율과 무관)
+
+    schedules에 'operating_margin'·'depreciation_ratio'·'capex_ratio'·'working_capital_ratio' 키로
+    연도별 값(마지막 축이 연도, 단위는 같은 이름의 인자와 동일)을 주면 해당 인자 대신 사용합니다.
+    """
+    schedules = schedules or {}
+
+    def ratio(name, value):
+        return np.asarray(schedules[name], dtype=float) if name in schedules else _as_batch(value)
+
+    growth = np.asarray(growth_rates, dtype=float)
+    base = _as_batch(base_revenue)
+
+    # 매출액: 기준 매출액 × 누적 성장률
+    revenue = base * np.cumprod(1 + growth / 100, axis=-1)
+    operating_income = revenue * ratio('operating_margin', operating_margin) / 100
+    pretax_income = operating_income  # 세전이익은 영업이익과 동일하게 가정
+    tax = pretax_income * _as_batch(tax_rate) / 100
+    after_tax_income = pretax_income - tax
+
+    depreciation = revenue * ratio('depreciation_ratio', depreciation_ratio)
+    capex = revenue * ratio('capex_ratio', capex_ratio)
+
+    # 운전자본증감: 전년 대비 매출 증가분에만 적용
+    previous_revenue = np.concatenate(
+        [np.broadcast_to(base, revenue.shape[:-1] + (1,)), revenue[..., :-1]], axis=-1
+    )
+    working_capital_change = (np.maximum(revenue - previous_revenue, 0)
+                              * ratio('working_capital_ratio', working_capital_ratio))
+
+    fcf = after_tax_income + depreciation - capex - working_capital_change
+
+    return {
+        'revenue': revenue,
+        'operating_income': operating_income,
+        'pretax_income': pretax_income,
+        'tax': tax,
+        'after_tax_income': after_tax_income,
+        'depreciation': depreciation,
+        'capex': capex,
+        'working_capital_change': working_capital_change,
+        'fcf': fcf,
+    }
+
+
+def discount_cash_flows(fcf, discount_rate, mid_year=False):
+    """연도별 할인계수와 잉여현금흐름의 현재가치 (mid_year이면 현금흐름이 연중에 고르게 발생한다고 보고 반년 덜 할인)"""
+    fcf = np.asarray(fcf, dtype=float)
+    periods = np.arange(1, fcf.shape[-1] + 1) - (0.5 if mid_year else 0.0)
+    discount_factor = (1 + _as_batch(discount_rate) / 100) ** -periods
+    return {
+        'discount_factor': discount_factor,
+        'present_value': fcf * discount_factor,
+    }
+
+
+def forecast_frame(forecast):
+    """단일 시나리오 예측 결과(연도 포함)를 화면 표시용 DataFrame으로 변환 (금액은 정수, 할인계수는 실수)"""
+    data = {}
+    for key in FORECAST_COLUMNS:
+        values = np.asarray(forecast[key])
+        data[key] = values if key == 'discount_factor' else values.astype('int64')
+    return pd.DataFrame(data).rename(columns=FORECAST_COLUMNS)
+
+
+@dataclass
+class DCFStage:
+    """DCF 예측 단계 (비율은 % 단위)
+
+    매출 성장률은 단계 첫해 growth_rate에서 마지막 해 end_growth_rate까지 선형으로 변하고(감속 단계),
+    end_growth_rate가 없으면 단계 내내 같습니다. 나머지 비율은 단계 안에서 일정합니다.
+    """
+    years: int
+    growth_rate: float
+    end_growth_rate: Optional[float] = None
+    operating_margin: float = 10.0
+    depreciation_ratio: float = DEPRECIATION_RATIO * 100
+    capex_ratio: float = CAPEX_RATIO * 100
+    working_capital_ratio: float = WORKING_CAPITAL_RATIO * 100
+    name: str = ''
+
+
+def expand_stages(stages: List[DCFStage]) -> Dict[str, List[float]]:
+    """단계 목록을 연도별 성장률·비율 일정(DCFInput 필드 이름, % 단위)으로 펼침"""
+    stages = [stage for stage in stages if stage.years > 0]
+    if not stages:
+        raise ValuationError("예측 단계가 없습니다. 기간이 1년 이상인 단계를 하나 이상 입력하세요.")
+    years = [int(stage.years) for stage in stages]
+    growth = np.concatenate([
+        np.linspace(stage.growth_rate,
+                    stage.growth_rate if stage.end_growth_rate is None else stage.end_growth_rate,
+                    int(stage.years))
+        for stage in stages
+    ])
+
+    def repeat(attribute):
+        return np.repeat([getattr(stage, attribute) for stage in stages], years).astype(float).tolist()
+
+    return {
+        'growth_rates': growth.tolist(),
+        'operating_margins': repeat('operating_margin'),
+        'depreciation_ratios': repeat('depreciation_ratio'),
+        'capex_ratios': repeat('capex_ratio'),
+        'working_capital_ratios': repeat('working_capital_ratio'),
+    }
+
+
+@dataclass
+class DCFInput:
+    """DCF 매개변수 (비율은 % 단위, growth_rates는 예측 연도별 매출 성장률)
+
+    operating_margins 등 연도별 일정이 있으면 같은 항목의 단일 값·기본 가정 대신 사용하며, 길이는 growth_rates와 같아야 합니다.
+    stages는 from_stages로 만든 경우 화면 표시용으로 남겨 두는 단계 정의입니다.
+    """
+    growth_rates: List[float]
+    operating_margin: float = 10.0
+    discount_rate: float = 12.0
+    terminal_growth_rate: float = 1.0
+    tax_rate: float = 22.0
+    terminal_value_method: str = GORDON_GROWTH
+    exit_multiple: float = 6.0
+    operating_margins: Optional[List[float]] = None
+    depreciation_ratios: Optional[List[float]] = None
+    capex_ratios: Optional[List[float]] = None
+    working_capital_ratios: Optional[List[float]] = None
+    mid_year: bool = False
+    stages: Optional[List[dict]] = None
+
+    @classmethod
+    def constant_growth(cls, growth_rate, forecast_period, **kwargs):
+        """예측 기간 동안 동일한 성장률을 적용하는 입력"""
+        return cls(growth_rates=[growth_rate] * forecast_period, **kwargs)
+
+    @classmethod
+    def from_stages(cls, stages: List[DCFStage], **kwargs):
+        """고성장·감속·안정 등 단계별 가정을 이어 붙인 장기 예측 입력 (operating_margin은 마지막 단계 값)"""
+        schedules = expand_stages(stages)
+        kwargs.setdefault('operating_margin', schedules['operating_margins'][-1])
+        return cls(**schedules, stages=[asdict(stage) for stage in stages], **kwargs)
+
+
+def yearly_schedules(values: Dict, years: int, exclude=()):
+    """DCFInput 필드 사전의 연도별 일정을 project_operations의 schedules 형식으로 변환
+
+    exclude에 있는 schedules 키(예: 민감도 분석에서 단일 값으로 바꾼 'operating_margin')는 제외합니다.
+    """
+    schedules = {}
+    for field_name, (key, scale) in SCHEDULE_FIELDS.items():
+        schedule = values.get(field_name)
+        if schedule is None or key in exclude:
+            continue
+        if len(schedule) != years:
+            raise ValuationError(f"연도별 일정({field_name})의 길이가 예측 기간({years}년)과 다릅니다.")
+        schedules[key] = np.asarray(schedule, dtype=float) * scale
+    return schedules
+
+
+def shift_growth_rates(growth_rates, growth_rate):
+    """연도별 성장률 일정을 평균이 growth_rate(배열 가능)가 되도록 평행 이동
+
+    단계별 일정의 모양(고성장→안정 등)은 그대로 두므로, 기준 평균을 넣으면 원래 일정과 같은 결과가 나옵니다.
+    성장률이 모든 연도에 같으면 전 기간 동일 성장률과 같습니다.
+    """
+    growth_rates = np.asarray(growth_rates, dtype=float)
+    shift = np.asarray(growth_rate, dtype=float) - growth_rates.mean()
+    return growth_rates + shift[..., np.newaxis]
+
+
+def weighted_average_cost_of_capital(debt_ratio, cost_of_debt, cost_of_equity, tax_rate=22.0):
+    """자본 구조로부터 WACC(%) 계산"""
+    equity_ratio = 100 - debt_ratio
+    return (debt_ratio / 100 * cost_of_debt * (1 - tax_rate / 100)) + (equity_ratio / 100 * cost_of_equity)
+
+
+def terminal_value(projection, params: DCFInput):
+    """예측 마지막 연도 기준 영구가치(Terminal Value)"""
+    return _terminal_value(projection, params.terminal_value_method, params.discount_rate,
+                           params.terminal_growth_rate, params.exit_multiple)
+
+
+def terminal_discount_factor(last_discount_factor, discount_rate, terminal_value_method, mid_year=False):
+    """영구가치 할인계수
+
+    기중 할인에서 영구성장모델은 마지막 연도 현금흐름과 같은 시점(연중)으로, Exit Multiple은 매각 시점인 연말로 할인합니다.
+    """
+    if mid_year and terminal_value_method == EXIT_MULTIPLE:
+        return last_discount_factor * (1 + np.asarray(discount_rate, dtype=float) / 100) ** -0.5
+    return last_discount_factor
+
+
+def _terminal_value(projection, terminal_value_method, discount_rate, terminal_growth_rate, exit_multiple):
+    if terminal_value_method == EXIT_MULTIPLE:
+        last_ebitda = projection['operating_income'][-1] + projection['depreciation'][-1]
+        return last_ebitda * exit_multiple
+    if discount_rate <= terminal_growth_rate:
+        raise ValuationError("할인율이 영구 성장률보다 커야 영구가치를 계산할 수 있습니다.")
+    last_fcf = projection['fcf'][-1]
+    return last_fcf * (1 + terminal_growth_rate / 100) / (discount_rate / 100 - terminal_growth_rate / 100)
+
+
+# 증분 계산 단계: 과거 데이터 → 기준 연도 → 현금흐름 예측 → 할인 → 영구가치 → 영업권
+DCF_STAGE_LABELS = {
+    'history': '과거 재무 데이터',
+    'base_year': '기준 연도',
+    'projections': '현금흐름 예측',
+    'discounting': '할인',
+    'terminal_value': '영구가치',
+    'goodwill': '영업권',
+}
+
+
+def _stage_history(financial_data):
+    return financial_data.sort_values('연도', ignore_index=True)
+
+
+def _stage_base_year(history):
+    return latest_financials(history)
+
+
+def _stage_projections(base_year, growth_rates, operating_margin, tax_rate, operating_margins=None,
+                       depreciation_ratios=None, capex_ratios=None, working_capital_ratios=None):
+    schedules = yearly_schedules({
+        'operating_margins': operating_margins,
+        'depreciation_ratios': depreciation_ratios,
+        'capex_ratios': capex_ratios,
+        'working_capital_ratios': working_capital_ratios,
+    }, len(growth_rates))
+    projection = project_operations(base_year['매출액'], growth_rates, operating_margin, tax_rate, schedules=schedules)
+    latest_year = int(base_year['연도'])
+    projection['year'] = list(range(latest_year + 1, latest_year + len(growth_rates) + 1))
+    return projection
+
+
+def _stage_discounting(projections, discount_rate, mid_year=False):
+    discounting = discount_cash_flows(projections['fcf'], discount_rate, mid_year)
+    # 단계별 현재가치의 합
+    discounting['total_present_value'] = discounting['present_value'].sum()
+    return discounting
+
+
+def _stage_terminal_value(projections, discounting, terminal_value_method, discount_rate,
+                          terminal_growth_rate, exit_multiple, mid_year=False):
+    tv = _terminal_value(projections, terminal_value_method, discount_rate, terminal_growth_rate, exit_multiple)
+    factor = terminal_discount_factor(discounting['discount_factor'][-1], discount_rate, terminal_value_method, mid_year)
+    return {'terminal_value': tv, 'terminal_value_present': tv * factor}
+
+
+def _stage_goodwill(base_year, discounting, terminal):
+    # 기업가치 = 예측 기간 현재가치 + 영구가치의 현재가치
+    firm_value = discounting['total_present_value'] + terminal['terminal_value_present']
+    # 영업권 가치 추정 (간소화: 기업가치 - 순자산가치)
+    nav = net_asset_value(base_year, firm_value)
+    return {'firm_value': firm_value, 'net_asset_value': nav, 'goodwill': firm_value - nav}
+
+
+DCF_NODES = [
+    Node('history', _stage_history, inputs=('financial_data',)),
+    Node('base_year', _stage_base_year, depends_on=('history',)),
+    Node('projections', _stage_projections,
+         inputs=('growth_rates', 'operating_margin', 'tax_rate') + tuple(SCHEDULE_FIELDS),
+         depends_on=('base_year',)),
+    Node('discounting', _stage_discounting, inputs=('discount_rate', 'mid_year'), depends_on=('projections',)),
+    Node('terminal_value', _stage_terminal_value,
+         inputs=('terminal_value_method', 'discount_rate', 'terminal_growth_rate', 'exit_multiple', 'mid_year'),
+         depends_on=('projections', 'discounting')),
+    Node('goodwill', _stage_goodwill, depends_on=('base_year', 'discounting', 'terminal_value')),
+]
+
+# 프로세스 전역 DCF 계산 그래프 (단계 결과는 RESULT_CACHE에 보관)
+DCF_GRAPH = DependencyGraph('dcf', DCF_NODES)
+
+
+def _dcf_result(params: DCFInput, stages) -> ValuationResult:
+    """단계별 결과로 평가 결과 구성"""
+    projections, discounting = stages['projections'], stages['discounting']
+    terminal, goodwill = stages['terminal_value'], stages['goodwill']
+
+    forecast = {'year': projections['year']}
+    forecast.update({key: np.asarray(values).tolist() for key, values in projections.items() if key != 'year'})
+    forecast.update({key: discounting[key].tolist() for key in ('discount_factor', 'present_value')})
+
+    return ValuationResult(
+        method=METHOD_NAME,
+        value=goodwill['goodwill'],
+        parameters=asdict(params),
+        details={
+            'firm_value': goodwill['firm_value'],
+            'net_asset_value': goodwill['net_asset_value'],
+            'total_present_value': discounting['total_present_value'],
+            'terminal_value': terminal['terminal_value'],
+            'terminal_value_present': terminal['terminal_value_present'],
+            'forecast': forecast
+        }
+    )
+
+
+def value_dcf(financial_data: pd.DataFrame, params: DCFInput) -> ValuationResult:
+    """최근 연도 매출액을 기준으로 미래 잉여현금흐름과 영구가치를 현재가치화하고 순자산가치를 차감"""
+    base_year = _stage_base_year(financial_data)
+    projections = _stage_projections(base_year, params.growth_rates, params.operating_margin, params.tax_rate,
+                                     params.operating_margins, params.depreciation_ratios, params.capex_ratios,
+                                     params.working_capital_ratios)
+    discounting = _stage_discounting(projections, params.discount_rate, params.mid_year)
+    terminal = _stage_terminal_value(projections, discounting, params.terminal_value_method, params.discount_rate,
+                                     params.terminal_growth_rate, params.exit_multiple, params.mid_year)
+    goodwill = _stage_goodwill(base_year, discounting, terminal)
+    return _dcf_result(params, {
+        'projections': projections,
+        'discounting': discounting,
+        'terminal_value': terminal,
+        'goodwill': goodwill,
+    })
+
+
+def value_dcf_incremental(financial_data: pd.DataFrame, params: DCFInput, graph=None):
+    """value_dcf와 같은 결과를 단계별 캐시로 계산해 (평가 결과, 단계별 재계산/재사용 여부)를 반환
+
+    예를 들어 영구 성장률만 바꾸면 예측·할인 단계는 재사용하고 영구가치와 영업권만 다시 계산합니다.
+    """
+    inputs = dict(asdict(params), financial_data=financial_data)
+    stages, trace = (graph or DCF_GRAPH).evaluate('goodwill', inputs)
+    return _dcf_result(params, stages), trace
+
+
+def goodwill_batch(base_revenue, growth_rates, operating_margin, tax_rate, discount_rate,
+                   terminal_growth_rate, net_asset_value=None,
+                   terminal_value_method=GORDON_GROWTH, exit_multiple=6.0, schedules=None, mid_year=False):
+    """여러 매개변수 조합의 영업권 가치를 한 번의 배열 연산으로 계산
+
+    배열 매개변수는 project_cash_flows와 같은 규칙으로 브로드캐스팅되며, 결과는 연도 축을 뺀 형태입니다.
+    할인율이 영구 성장률 이하인 조합은 NaN이 됩니다. net_asset_value가 없으면 기업가치의 60%로 가정합니다.
+    """
+    projection = project_cash_flows(base_revenue, growth_rates, operating_margin, tax_rate, discount_rate,
+                                    schedules=schedules, mid_year=mid_year)
+    total_present_value = projection['present_value'].sum(axis=-1)
+
+    if terminal_value_method == EXIT_MULTIPLE:
+        last_ebitda = projection['operating_income'][..., -1] + projection['depreciation'][..., -1]
+        tv = last_ebitda * np.asarray(exit_multiple, dtype=float)
+    else:
+        r = np.asarray(discount_rate, dtype=float) / 100
+        g = np.asarray(terminal_growth_rate, dtype=float) / 100
+        spread = np.where(r > g, r - g, np.nan)
+        tv = projection['fcf'][..., -1] * (1 + g) / spread
+
+    factor = terminal_discount_factor(projection['discount_factor'][..., -1], discount_rate, terminal_value_method,
+                                      mid_year)
+    firm_value = total_present_value + tv * factor
+    if net_asset_value is None:
+        return firm_value * 0.4
+    return firm_value - net_asset_value
+
+
+def dcf_goodwill(financial_data: pd.DataFrame, params: DCFInput, **overrides):
+    """params를 기준으로 일부 매개변수를 배열로 바꿔 영업권 가치를 일괄 계산
+
+    overrides에는 DCFInput 필드 또는 growth_rate(연도별 성장률의 평균, 일정은 평행 이동)를 배열로 넘깁니다.
+    """
+    latest_data = latest_financials(financial_data)
+    values = asdict(params)
+    values.update(overrides)
+
+    growth_rates = np.asarray(values['growth_rates'], dtype=float)
+    if 'growth_rate' in values:
+        growth_rates = shift_growth_rates(params.growth_rates, values['growth_rate'])
+
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = net_asset_value(latest_data, 0)
+
+    return goodwill_batch(
+        latest_data['매출액'],
+        growth_rates,
+        values['operating_margin'],
+        values['tax_rate'],
+        values['discount_rate'],
+        values['terminal_growth_rate'],
+        net_asset_value=nav,
+        terminal_value_method=values['terminal_value_method'],
+        exit_multiple=values['exit_multiple'],
+        schedules=yearly_schedules(values, len(params.growth_rates), exclude=tuple(overrides)),
+        mid_year=values['mid_year']
+    )
@@ -0,0 +1,105 @@
+"""초과이익법 평가"""
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError, ValuationResult, latest_financials, recency_weighted_earnings
+
+METHOD_NAME = '초과이익법'
+
+
+@dataclass
+class ExcessEarningsInput:
+    """초과이익법 매개변수 (비율은 % 단위, weight_recent이면 평균 이익 대신 최근 3년 3:2:1 가중평균)"""
+    normal_roi: float = 10.0
+    excess_years: int = 5
+    discount_rate: float = 12.0
+    adjustment_factor: float = 1.0
+    industry_premium: float = 0.0
+    weight_recent: bool = False
+
+
+def annuity_factor(discount_rate, years):
+    """연금현가계수 Σ 1/(1+r)^t (t=1..n) = (1 - (1+r)^-n) / r, 배열 입력은 브로드캐스팅"""
+    r = np.asarray(discount_rate, dtype=float) / 100
+    n = np.asarray(years, dtype=float)
+    safe_r = np.where(r == 0, 1.0, r)
+    return np.where(r == 0, n, (1 - (1 + safe_r) ** -n) / safe_r)
+
+
+def average_earnings(financial_data: pd.DataFrame, weight_recent=False) -> float:
+    """초과이익 계산의 기준 이익 (전 기간 당기순이익 평균, weight_recent이면 최근 3년 3:2:1 가중평균)"""
+    if weight_recent:
+        recent = financial_data.sort_values('연도', ascending=False)['당기순이익']
+        return float(recency_weighted_earnings(recent.to_numpy(dtype=float)))
+    return financial_data['당기순이익'].mean()
+
+
+def earnings_basis(parameters) -> str:
+    """결과 매개변수 사전의 기준 이익 이름 (weight_recent가 없는 이전 결과는 평균)"""
+    return "최근 3년 가중평균 당기순이익 (3:2:1)" if parameters.get('weight_recent') else "평균 당기순이익"
+
+
+def excess_earnings_batch(avg_earnings, total_assets, normal_roi, excess_years, discount_rate,
+                          adjustment_factor=1.0, industry_premium=0.0):
+    """여러 매개변수 조합의 초과이익법 영업권 가치를 한 번에 계산
+
+    모든 인자는 스칼라 또는 서로 브로드캐스팅 가능한 배열이며, 초과이익이 없는 조합은 NaN입니다.
+    """
+    normal_profit = np.asarray(total_assets, dtype=float) * np.asarray(normal_roi, dtype=float) / 100
+    excess_profit = np.asarray(avg_earnings, dtype=float) - normal_profit
+    value = (excess_profit * annuity_factor(discount_rate, excess_years)
+             * adjustment_factor * (1 + np.asarray(industry_premium, dtype=float) / 100))
+    return np.where(excess_profit > 0, value, np.nan)
+
+
+def excess_earnings_goodwill(financial_data: pd.DataFrame, params: ExcessEarningsInput, **overrides):
+    """params를 기준으로 일부 매개변수를 배열로 바꿔 영업권 가치를 일괄 계산
+
+    예) excess_earnings_goodwill(df, params, normal_roi=roi[:, None], discount_rate=rates[None, :])
+    """
+    values = asdict(params)
+    values.update(overrides)
+    weight_recent = values.pop('weight_recent')
+    return excess_earnings_batch(
+        average_earnings(financial_data, weight_recent),
+        latest_financials(financial_data)['총자산'],
+        **values
+    )
+
+
+def value_excess_earnings(financial_data: pd.DataFrame, params: ExcessEarningsInput) -> ValuationResult:
+    """평균 당기순이익 중 정상이익을 초과하는 부분을 인정연수 동안 현재가치화"""
+    avg_earnings = average_earnings(financial_data, params.weight_recent)
+    if pd.isna(avg_earnings):
+        raise ValuationError("당기순이익 자료가 없습니다.")
+    total_assets = latest_financials(financial_data)['총자산']
+
+    normal_profit = total_assets * (params.normal_roi / 100)
+    excess_profit = avg_earnings - normal_profit
+
+    if excess_profit <= 0:
+        raise ValuationError("초과이익이 계산되지 않습니다. 평균 이익이 정상 이익보다 낮습니다.")
+
+    # 현재가치 계산 (연금현가계수 적용)
+    factor = float(annuity_factor(params.discount_rate, params.excess_years))
+    years = np.arange(1, params.excess_years + 1)
+    yearly_present_values = excess_profit * (1 + params.discount_rate / 100) ** -years
+
+    # 조정
+    present_value = excess_profit * factor * params.adjustment_factor * (1 + params.industry_premium / 100)
+
+    return ValuationResult(
+        method=METHOD_NAME,
+        value=present_value,
+        parameters=asdict(params),
+        details={
+            'avg_earnings': avg_earnings,
+            'total_assets': total_assets,
+            'normal_profit': normal_profit,
+            'excess_profit': excess_profit,
+            'annuity_factor': factor,
+            'yearly_present_values': yearly_present_values.tolist()
+        }
+    )
@@ -0,0 +1,190 @@
+"""목표 영업권을 재현하는 매개변수 역산 (goal seek)
+
+협상 가격 등 목표 영업권이 나오는 할인율·성장률·영업이익률·배수를 주어진 구간 안에서 찾습니다.
+Brent법과 같은 계열의 구간 기반 역2차 보간법(Chandrupatla)을 NumPy 배열 연산으로 구현해
+목표 여러 개나 기업 여러 곳을 한 번의 호출로 풉니다. 반복마다 배열 계산 한 번이면 되므로 보통 10회 안팎에 수렴합니다.
+"""
+import time
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError, latest_financials
+from valuation.dcf import EXIT_MULTIPLE, DCFInput, goodwill_batch, shift_growth_rates, yearly_schedules
+from valuation.market import MarketComparisonInput, market_goodwill_batch, metric_value
+
+# 역산 대상 DCF 매개변수 → (표시명, 기본 탐색 하한, 기본 탐색 상한)
+IMPLIED_DCF_PARAMETERS = {
+    'discount_rate': ('할인율 (WACC, %)', 0.0, 60.0),
+    'terminal_growth_rate': ('영구 성장률 (%)', -10.0, 10.0),
+    'growth_rate': ('평균 매출 성장률 (%)', -30.0, 60.0),
+    'operating_margin': ('영업이익률 (%)', -50.0, 100.0),
+    'exit_multiple': ('Exit Multiple (EBITDA 배수)', 0.0, 60.0),
+}
+# 시장가치비교법 배수의 기본 탐색 구간
+MARKET_MULTIPLE_BOUNDS = (0.0, 200.0)
+# 할인율과 영구 성장률 사이에 두는 최소 간격 (%p, 같으면 영구가치가 발산)
+RATE_GAP = 1e-6
+
+
+@dataclass
+class GoalSeekResult:
+    """역산 결과 (values·converged는 targets와 같은 모양, 구간 안에 해가 없으면 NaN)"""
+    parameter: str
+    targets: np.ndarray
+    values: np.ndarray
+    converged: np.ndarray
+    iterations: int
+    elapsed: float = 0.0
+
+    def frame(self, index=None) -> pd.DataFrame:
+        """목표별 역산 값 표"""
+        return pd.DataFrame({
+            '목표 영업권': np.ravel(self.targets),
+            '역산 값': np.ravel(self.values),
+            '수렴': np.ravel(self.converged),
+        }, index=index)
+
+
+def solve_bracketed(func, targets, low, high, xtol=1e-9, max_iter=100):
+    """func(x) = targets인 x를 [low, high] 구간에서 원소별로 찾음
+
+    func는 targets와 같은 모양의 x 배열을 받아 같은 모양의 값을 돌려줘야 하며, 각 원소는 서로 독립이어야 합니다.
+    구간 양 끝의 오차 부호가 같거나 계산 값이 NaN이면 해가 없는 것으로 보고 NaN을 돌려줍니다.
+    반환값은 (해, 수렴 여부, 반복 횟수)입니다.
+    """
+    targets = np.asarray(targets, dtype=float)
+    shape = targets.shape
+    x1 = np.broadcast_to(np.asarray(low, dtype=float), shape).copy()
+    x2 = np.broadcast_to(np.asarray(high, dtype=float), shape).copy()
+
+    def residual(x):
+        return np.broadcast_to(np.asarray(func(x), dtype=float), shape) - targets
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        f1, f2 = residual(x1), residual(x2)
+        bracketed = np.isfinite(f1) & np.isfinite(f2) & (np.sign(f1) != np.sign(f2))
+        solution = np.where(f1 == 0, x1, np.where(f2 == 0, x2, np.nan))
+        converged = np.isfinite(solution)
+        active = bracketed & ~converged
+        x3, f3 = x1.copy(), f1.copy()
+        t = np.full(shape, 0.5)
+
+        iterations = 0
+        while active.any() and iterations < max_iter:
+            iterations += 1
+            xt = x1 + t * (x2 - x1)
+            ft = residual(xt)
+
+            # 새 점과 부호가 다른 쪽 끝을 남겨 구간 [x1, x2]가 항상 해를 감싸도록 유지
+            same_sign = np.sign(ft) == np.sign(f1)
+            x3, f3 = np.where(same_sign, x1, x2), np.where(same_sign, f1, f2)
+            x2, f2 = np.where(same_sign, x2, x1), np.where(same_sign, f2, f1)
+            x1, f1 = xt, ft
+
+            closer = np.abs(f1) < np.abs(f2)
+            xm, fm = np.where(closer, x1, x2), np.where(closer, f1, f2)
+            tl = (2 * np.finfo(float).eps * np.abs(xm) + xtol) / np.abs(x2 - x1)
+            failed = active & ~np.isfinite(ft)
+            done = active & ~failed & ((tl > 0.5) | (fm == 0))
+            solution = np.where(done, xm, solution)
+            converged |= done
+            active &= ~(done | failed)
+
+            # 역2차 보간이 구간 안에서 안정적일 때만 쓰고, 아니면 이분법
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            interpolate = (phi ** 2 < xi) & ((1 - phi) ** 2 < 1 - xi)
+            t_interpolated = (f1 / (f2 - f1) * f3 / (f2 - f3)
+                              + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2))
+            t = np.clip(np.where(interpolate, t_interpolated, 0.5), tl, 1 - tl)
+            t = np.where(np.isfinite(t), t, 0.5)
+
+    return solution, converged, iterations
+
+
+def _dcf_bounds(values, parameter, bounds):
+    """매개변수별 탐색 구간 (할인율·영구 성장률은 영구가치가 발산하지 않도록 좁힘)"""
+    low, high = bounds or IMPLIED_DCF_PARAMETERS[parameter][1:]
+    if parameter == 'discount_rate':
+        low = np.maximum(low, np.asarray(values['terminal_growth_rate'], dtype=float) + RATE_GAP)
+    elif parameter == 'terminal_growth_rate':
+        high = np.minimum(high, np.asarray(values['discount_rate'], dtype=float) - RATE_GAP)
+    return low, high
+
+
+def implied_dcf_parameter_batch(base_revenue, params: DCFInput, parameter, targets, net_asset_value=None,
+                                bounds=None, xtol=1e-9) -> GoalSeekResult:
+    """기준 매출액·순자산가치(기업별 배열 가능)와 목표 영업권(배열 가능)에 맞는 DCF 매개변수를 한 번에 역산
+
+    base_revenue·net_asset_value·targets는 서로 브로드캐스팅되며, 나머지 매개변수는 params 값을 그대로 사용합니다.
+    growth_rate는 연도별 성장률의 평균이며 단계별 일정은 모양을 유지한 채 평행 이동하고,
+    그 밖에 단일 값으로 푸는 항목의 연도별 일정은 무시합니다.
+    """
+    if parameter not in IMPLIED_DCF_PARAMETERS:
+        raise ValuationError(f"역산할 수 없는 매개변수입니다: {parameter}")
+    if parameter == 'exit_multiple' and params.terminal_value_method != EXIT_MULTIPLE:
+        raise ValuationError("Exit Multiple은 영구가치 계산 방법이 Exit Multiple일 때만 역산할 수 있습니다.")
+
+    started = time.perf_counter()
+    values = asdict(params)
+    years = len(params.growth_rates)
+    schedules = yearly_schedules(values, years, exclude=(parameter,))
+    shape = np.broadcast_shapes(np.shape(base_revenue), np.shape(targets),
+                                np.shape(net_asset_value) if net_asset_value is not None else ())
+    targets = np.broadcast_to(np.asarray(targets, dtype=float), shape)
+
+    def goodwill(x):
+        trial = dict(values, **{parameter: x})
+        growth_rates = np.asarray(values['growth_rates'], dtype=float)
+        if parameter == 'growth_rate':
+            growth_rates = shift_growth_rates(growth_rates, x)
+        return goodwill_batch(
+            base_revenue,
+            growth_rates,
+            trial['operating_margin'],
+            trial['tax_rate'],
+            trial['discount_rate'],
+            trial['terminal_growth_rate'],
+            net_asset_value=net_asset_value,
+            terminal_value_method=trial['terminal_value_method'],
+            exit_multiple=trial['exit_multiple'],
+            schedules=schedules,
+            mid_year=values['mid_year']
+        )
+
+    low, high = _dcf_bounds(values, parameter, bounds)
+    solution, converged, iterations = solve_bracketed(goodwill, targets, low, high, xtol=xtol)
+    return GoalSeekResult(parameter, targets, solution, converged, iterations, time.perf_counter() - started)
+
+
+def implied_dcf_parameter(financial_data: pd.DataFrame, params: DCFInput, parameter, targets,
+                          bounds=None) -> GoalSeekResult:
+    """한 기업의 DCF 영업권이 목표 영업권(여러 개 가능)이 되는 매개변수 값"""
+    latest_data = latest_financials(financial_data)
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = float(latest_data['총자산'] - latest_data['총부채'])
+    return implied_dcf_parameter_batch(float(latest_data['매출액']), params, parameter, targets,
+                                       net_asset_value=nav, bounds=bounds)
+
+
+def implied_market_multiple(financial_data: pd.DataFrame, params: MarketComparisonInput, targets,
+                            bounds=MARKET_MULTIPLE_BOUNDS) -> GoalSeekResult:
+    """시장가치비교법 영업권이 목표 영업권(여러 개 가능)이 되는 배수 (업종 평균 배수는 쓰지 않음)"""
+    started = time.perf_counter()
+    latest_data = latest_financials(financial_data)
+    value = metric_value(latest_data, params.selected_metric) or 0
+    if not value:
+        raise ValuationError(f"{params.selected_metric} 자료가 없어 배수를 역산할 수 없습니다.")
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = float(latest_data['총자산'] - latest_data['총부채'])
+
+    targets = np.asarray(targets, dtype=float)
+    solution, converged, iterations = solve_bracketed(
+        lambda multiple: market_goodwill_batch(value, multiple, params.adjustment_factor, nav),
+        targets, *bounds
+    )
+    return GoalSeekResult('multiple', targets, solution, converged, iterations, time.perf_counter() - started)
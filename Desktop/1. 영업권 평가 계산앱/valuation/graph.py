@@ -0,0 +1,65 @@
+"""증분 계산 그래프
+
+평가를 여러 단계(노드)로 나누고 각 단계의 결과를 '자기 입력값 + 선행 단계 키'의 해시로 캐시합니다.
+입력 하나가 바뀌면 그 입력을 쓰는 단계와 그 이후 단계만 다시 계산하고 나머지는 재사용합니다.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+from valuation.cache import RESULT_CACHE, stable_hash
+
+RECOMPUTED = 'recomputed'
+REUSED = 'reused'
+
+
+@dataclass(frozen=True)
+class Node:
+    """계산 단계: func(*선행 단계 결과, **inputs에 해당하는 입력값)"""
+    name: str
+    func: Callable
+    inputs: Tuple[str, ...] = ()
+    depends_on: Tuple[str, ...] = ()
+
+
+class DependencyGraph:
+    """단계별 결과를 캐시하는 의존성 그래프 (캐시를 지정하지 않으면 프로세스 전역 캐시 사용)
+
+    캐시된 결과는 여러 세션이 공유하므로 단계 함수는 입력과 선행 결과를 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, name, nodes, cache=None):
+        self.name = name
+        self.nodes = {node.name: node for node in nodes}
+        self.cache = cache or RESULT_CACHE
+        for node in nodes:
+            unknown = [dependency for dependency in node.depends_on if dependency not in self.nodes]
+            if unknown:
+                raise ValueError(f"'{node.name}' 단계의 선행 단계가 없습니다: {', '.join(unknown)}")
+
+    def evaluate(self, target, inputs: Dict) -> Tuple[Dict, Dict[str, str]]:
+        """target과 그 선행 단계를 계산해 (단계별 결과, 단계별 재계산/재사용 여부)를 반환"""
+        values, keys, trace = {}, {}, {}
+        self._evaluate(target, inputs, values, keys, trace, ())
+        return values, trace
+
+    def _evaluate(self, name, inputs, values, keys, trace, path):
+        if name in values:
+            return
+        if name in path:
+            raise ValueError(f"순환 의존성이 있습니다: {' → '.join(path + (name,))}")
+        node = self.nodes[name]
+        for dependency in node.depends_on:
+            self._evaluate(dependency, inputs, values, keys, trace, path + (name,))
+
+        own_inputs = {key: inputs[key] for key in node.inputs}
+        key = stable_hash(self.name, name, [keys[dependency] for dependency in node.depends_on],
+                          list(node.inputs), *own_inputs.values())
+        found, value = self.cache.get(key)
+        if found:
+            trace[name] = REUSED
+        else:
+            value = node.func(*(values[dependency] for dependency in node.depends_on), **own_inputs)
+            self.cache.put(key, value)
+            trace[name] = RECOMPUTED
+        values[name] = value
+        keys[name] = key
@@ -0,0 +1,294 @@
+"""재무 데이터 파일 적재
+
+CSV(pyarrow 스트리밍), Excel(읽기 전용 스트리밍), Parquet(행 그룹 단위)을
+청크 단위로 읽어 숫자형으로 변환하고 벡터화된 검사로 검증합니다.
+여러 기업이 섞인 대용량 ERP 내보내기 파일도 청크 크기만큼의 메모리로 처리합니다.
+"""
+import io
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError
+
+# 필수 재무 컬럼과 변환할 자료형
+FINANCIAL_DTYPES = {
+    '연도': 'int64',
+    '매출액': 'float64',
+    '영업이익': 'float64',
+    '당기순이익': 'float64',
+    '총자산': 'float64',
+    '총부채': 'float64',
+    '자본': 'float64',
+}
+FINANCIAL_COLUMNS = list(FINANCIAL_DTYPES)
+
+# 여러 기업이 섞인 파일의 기업 구분 컬럼 (첫 번째 이름으로 통일)
+COMPANY_COLUMN = '회사명'
+COMPANY_COLUMN_ALIASES = ['회사명', '기업명', '회사', 'company', 'company_name']
+
+# 음수가 될 수 없는 컬럼
+NON_NEGATIVE_COLUMNS = ['매출액', '총자산', '총부채']
+YEAR_RANGE = (1900, 2100)
+
+SUPPORTED_EXTENSIONS = ['csv', 'xlsx', 'xls', 'parquet']
+DEFAULT_CHUNK_SIZE = 100_000
+
+# 오류 메시지에 표시할 최대 행 수
+MAX_REPORTED_ROWS = 5
+
+
+@dataclass
+class IngestSummary:
+    """파일 전체를 한 번 훑은 결과 (companies: 기업별 행 수, 단일 기업 파일이면 비어 있음)"""
+    rows: int = 0
+    chunks: int = 0
+    companies: Dict[str, int] = field(default_factory=dict)
+    years: List[int] = field(default_factory=list)
+
+
+def file_format(file_name):
+    """파일 이름의 확장자로 형식 판별"""
+    extension = os.path.splitext(str(file_name))[1].lower().lstrip('.')
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise ValuationError(f"지원하지 않는 파일 형식입니다: {extension or file_name} "
+                             f"(지원 형식: {', '.join(SUPPORTED_EXTENSIONS)})")
+    return extension
+
+
+def _rewind(source):
+    """파일 객체면 처음으로 되돌려 여러 번 읽을 수 있게 함"""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+
+def _detect_encoding(source):
+    """UTF-8로 읽히지 않는 CSV는 한글 Windows 인코딩(CP949)으로 간주"""
+    if hasattr(source, 'read'):
+        head = _rewind(source).read(64 * 1024)
+        _rewind(source)
+    else:
+        with open(source, 'rb') as handle:
+            head = handle.read(64 * 1024)
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as error:
+        # 청크 경계에서 잘린 멀티바이트 문자는 UTF-8로 인정
+        if error.start < len(head) - 3:
+            return 'cp949'
+    return 'utf-8-sig' if head.startswith(b'\xef\xbb\xbf') else 'utf-8'
+
+
+def _read_csv(source, chunk_size):
+    from pyarrow import csv
+
+    encoding = _detect_encoding(source)
+    # 숫자 컬럼은 문자열로 읽은 뒤 변환 (천 단위 구분 기호, 빈 문자열 처리)
+    text_columns = FINANCIAL_COLUMNS + COMPANY_COLUMN_ALIASES
+    reader = csv.open_csv(
+        _rewind(source),
+        read_options=csv.ReadOptions(encoding=encoding, block_size=max(chunk_size * 128, 1 << 20)),
+        convert_options=csv.ConvertOptions(column_types={name: 'string' for name in text_columns},
+                                           strings_can_be_null=True),
+    )
+    for batch in reader:
+        yield _cast_numeric_batch(batch).to_pandas()
+
+
+def _cast_numeric_batch(batch):
+    """문자열로 읽은 숫자 컬럼을 pyarrow 연산으로 float 변환 (실패한 컬럼은 문자열로 두고 검증 단계에서 오류 위치 보고)"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = list(batch.columns)
+    for index, name in enumerate(batch.schema.names):
+        if name not in FINANCIAL_DTYPES or not pa.types.is_string(columns[index].type):
+            continue
+        cleaned = pc.utf8_trim_whitespace(pc.replace_substring(columns[index], ',', ''))
+        try:
+            columns[index] = pc.cast(cleaned, pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+def _read_xlsx(source, chunk_size):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_rewind(source), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(name) if name is not None else f'열{index + 1}' for index, name in enumerate(header)]
+        buffer = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame.from_records(buffer, columns=header)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame.from_records(buffer, columns=header)
+    finally:
+        workbook.close()
+
+
+def _read_xls(source, chunk_size):
+    # 구형 xls는 스트리밍 읽기를 지원하지 않아 한 번에 읽은 뒤 청크로 나눔
+    frame = pd.read_excel(_rewind(source), engine='xlrd')
+    for start in range(0, len(frame), chunk_size):
+        yield frame.iloc[start:start + chunk_size]
+
+
+def _read_parquet(source, chunk_size):
+    from pyarrow import parquet
+
+    parquet_file = parquet.ParquetFile(_rewind(source))
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+READERS = {
+    'csv': _read_csv,
+    'xlsx': _read_xlsx,
+    'xls': _read_xls,
+    'parquet': _read_parquet,
+}
+
+
+def _row_numbers(mask, offset):
+    """검사에 걸린 행의 파일 내 행 번호 (머리글 다음 행이 1)"""
+    rows = np.flatnonzero(mask)[:MAX_REPORTED_ROWS] + offset + 1
+    suffix = f" 외 {int(mask.sum()) - MAX_REPORTED_ROWS}행" if mask.sum() > MAX_REPORTED_ROWS else ""
+    return ', '.join(map(str, rows)) + suffix
+
+
+def _to_numeric(values):
+    """문자열 숫자(천 단위 구분 기호·공백 포함)를 float으로 변환 (변환 불가 값은 NaN)"""
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        values = values.astype('string').str.replace(',', '', regex=False).str.strip()
+        values = values.mask(values == '')
+    return pd.to_numeric(values, errors='coerce').astype('float64')
+
+
+def normalize_chunk(chunk: pd.DataFrame, offset=0) -> pd.DataFrame:
+    """컬럼 이름 정리, 자료형 변환, 검증을 거친 재무 데이터 청크
+
+    offset은 이 청크 앞에 있던 행 수이며, 오류 메시지의 행 번호에 사용합니다.
+    """
+    chunk = chunk.rename(columns=lambda name: str(name).strip())
+    company_column = next((name for name in COMPANY_COLUMN_ALIASES if name in chunk.columns), None)
+
+    missing = [name for name in FINANCIAL_COLUMNS if name not in chunk.columns]
+    if missing:
+        raise ValuationError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    # 완전히 빈 행(엑셀 서식만 남은 행 등)은 제외
+    raw = chunk[FINANCIAL_COLUMNS]
+    blank = raw.isna().all(axis=1).to_numpy()
+    if blank.any():
+        chunk, raw = chunk[~blank], raw[~blank]
+
+    typed = pd.DataFrame({name: _to_numeric(raw[name]) for name in FINANCIAL_COLUMNS}, index=raw.index)
+
+    errors = []
+    for name in FINANCIAL_COLUMNS:
+        converted = typed[name].isna().to_numpy()
+        if not converted.any():
+            continue
+        present = raw[name].notna()
+        if raw[name].dtype == object or pd.api.types.is_string_dtype(raw[name]):
+            present &= raw[name].astype('string').str.strip().ne('').fillna(False)
+        present = present.to_numpy()
+        invalid = converted & present
+        if invalid.any():
+            errors.append(f"'{name}'에 숫자가 아닌 값이 있습니다 (행 {_row_numbers(invalid, offset)})")
+        if (converted & ~present).any():
+            errors.append(f"'{name}' 값이 비어 있습니다 (행 {_row_numbers(converted & ~present, offset)})")
+
+    years = typed['연도'].to_numpy()
+    bad_year = np.isfinite(years) & ((years != np.round(years)) | (years < YEAR_RANGE[0]) | (years > YEAR_RANGE[1]))
+    if bad_year.any():
+        errors.append(f"'연도'가 올바르지 않습니다 (행 {_row_numbers(bad_year, offset)})")
+    for name in NON_NEGATIVE_COLUMNS:
+        negative = (typed[name] < 0).to_numpy()
+        if negative.any():
+            errors.append(f"'{name}'은(는) 음수일 수 없습니다 (행 {_row_numbers(negative, offset)})")
+    if errors:
+        raise ValuationError("재무 데이터 검증에 실패했습니다.\n- " + "\n- ".join(errors))
+
+    typed = typed.astype(FINANCIAL_DTYPES)
+    if company_column is not None:
+        typed.insert(0, COMPANY_COLUMN, chunk[company_column].astype('string').str.strip().to_numpy())
+    return typed.reset_index(drop=True)
+
+
+def iter_financial_chunks(source, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """파일을 청크 단위로 읽어 검증된 재무 데이터 DataFrame을 차례로 반환
+
+    source는 파일 경로나 바이너리 파일 객체(업로드 파일 등)이며, file_name이 없으면 경로에서 형식을 판별합니다.
+    """
+    extension = file_format(file_name or getattr(source, 'name', source))
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    offset = 0
+    try:
+        for chunk in READERS[extension](source, chunk_size):
+            if chunk.empty:
+                continue
+            yield normalize_chunk(chunk, offset)
+            offset += len(chunk)
+    except ValuationError:
+        raise
+    except ImportError as error:
+        raise ValuationError(f"{extension} 파일을 읽는 데 필요한 패키지가 없습니다: {error.name}")
+    except Exception as error:
+        raise ValuationError(f"파일을 읽는 중 오류가 발생했습니다: {error}")
+
+
+def scan_financial_file(source, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE) -> IngestSummary:
+    """파일 전체를 검증하며 행 수·기업별 행 수·연도 범위를 집계 (데이터는 보관하지 않음)"""
+    summary = IngestSummary()
+    companies = pd.Series(dtype='int64')
+    years = set()
+    for chunk in iter_financial_chunks(source, file_name, chunk_size):
+        summary.rows += len(chunk)
+        summary.chunks += 1
+        years.update(np.unique(chunk['연도']).tolist())
+        if COMPANY_COLUMN in chunk:
+            companies = companies.add(chunk[COMPANY_COLUMN].value_counts(dropna=True), fill_value=0)
+    companies = companies.sort_index()
+    summary.companies = dict(zip(companies.index.astype(str), companies.to_numpy(dtype='int64').tolist()))
+    summary.years = sorted(years)
+    return summary
+
+
+def load_financial_data(source, file_name=None, company: Optional[str] = None,
+                        chunk_size=DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+    """한 기업의 재무 데이터를 연도순으로 적재
+
+    여러 기업이 섞인 파일은 company에 해당하는 행만 청크별로 골라 모으므로
+    메모리에는 선택한 기업의 데이터만 남습니다. 같은 연도가 여러 번 나오면 오류로 처리합니다.
+    """
+    parts = []
+    for chunk in iter_financial_chunks(source, file_name, chunk_size):
+        if COMPANY_COLUMN in chunk:
+            if company is None:
+                raise ValuationError("여러 기업이 포함된 파일입니다. 불러올 기업을 선택해주세요.")
+            chunk = chunk[chunk[COMPANY_COLUMN] == company]
+        if not chunk.empty:
+            parts.append(chunk[FINANCIAL_COLUMNS])
+    if not parts:
+        raise ValuationError("불러올 재무 데이터가 없습니다.")
+
+    data = pd.concat(parts, ignore_index=True)
+    duplicated = data['연도'].duplicated(keep=False).to_numpy()
+    if duplicated.any():
+        years = ', '.join(map(str, np.unique(data['연도'].to_numpy()[duplicated])))
+        raise ValuationError(f"같은 연도의 데이터가 중복되어 있습니다: {years}")
+    return data.sort_values('연도', ascending=False, ignore_index=True)
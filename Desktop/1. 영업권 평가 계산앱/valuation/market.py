@@ -0,0 +1,93 @@
+"""시장가치비교법 평가"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationResult, latest_financials, net_asset_value
+from valuation.benchmarks import DEFAULT_INDUSTRY, BenchmarkStore, default_benchmark_store
+
+METHOD_NAME = '시장가치비교법'
+
+
+@dataclass
+class MarketComparisonInput:
+    """시장가치비교법 매개변수 (multiple이 없으면 업종 평균 배수 사용)"""
+    selected_metric: str = '영업이익'
+    multiple: Optional[float] = None
+    adjustment_factor: float = 1.0
+
+
+def normalize_industry(industry, store=None):
+    """배수 데이터에 없는 업종은 '기타'로 처리"""
+    return (store or default_benchmark_store()).normalize_industry(industry)
+
+
+def industry_multiple(industry, metric, store=None):
+    """업종 평균 배수"""
+    return (store or default_benchmark_store()).industry_multiple(industry, metric)
+
+
+def similar_companies(industry, metric='영업이익', store=None):
+    """업종 내 유사 기업 (선택한 지표의 배수 포함)"""
+    return (store or default_benchmark_store()).peers(industry, metric)
+
+
+def metric_value(latest_data: pd.Series, metric: str) -> Optional[float]:
+    """최근 연도 재무 지표 값 (EBITDA는 영업이익 + 감가상각비로 계산, 자료가 없으면 None)"""
+    if metric in latest_data:
+        return latest_data[metric]
+    if metric == 'EBITDA':
+        if '영업이익' not in latest_data:
+            return 0
+        # 감가상각비가 없는 경우 영업이익의 10%로 가정
+        depreciation = latest_data.get('감가상각비', latest_data['영업이익'] * 0.1)
+        return latest_data['영업이익'] + depreciation
+    return None
+
+
+def market_goodwill_batch(metric, multiple, adjustment_factor=1.0, net_asset_value=None):
+    """재무 지표 × 배수 × 조정 계수에서 순자산가치를 뺀 영업권 (배열 인자는 브로드캐스팅, 순자산가치가 없으면 시장가치의 60%)"""
+    adjusted_market_value = (np.asarray(metric, dtype=float) * np.asarray(multiple, dtype=float)
+                             * np.asarray(adjustment_factor, dtype=float))
+    if net_asset_value is None:
+        return adjusted_market_value * 0.4
+    return adjusted_market_value - np.asarray(net_asset_value, dtype=float)
+
+
+def value_market_comparison(financial_data: pd.DataFrame, params: MarketComparisonInput,
+                            industry: str = DEFAULT_INDUSTRY, store: BenchmarkStore = None) -> ValuationResult:
+    """재무 지표 × 배수로 시장가치를 구하고 순자산가치를 차감"""
+    latest_data = latest_financials(financial_data)
+    industry = normalize_industry(industry, store)
+    value = metric_value(latest_data, params.selected_metric) or 0
+    multiple = params.multiple
+    if multiple is None:
+        multiple = industry_multiple(industry, params.selected_metric, store)
+
+    market_value = value * multiple
+
+    # 조정 계수 적용
+    adjusted_market_value = market_value * params.adjustment_factor
+
+    # 영업권 가치 추정 (간소화: 시장가치 - 순자산가치)
+    nav = net_asset_value(latest_data, adjusted_market_value)
+    goodwill_value = adjusted_market_value - nav
+
+    return ValuationResult(
+        method=METHOD_NAME,
+        value=goodwill_value,
+        parameters={
+            'selected_metric': params.selected_metric,
+            'metric_value': value,
+            'multiple': multiple,
+            'adjustment_factor': params.adjustment_factor
+        },
+        details={
+            'market_value': market_value,
+            'adjusted_market_value': adjusted_market_value,
+            'net_asset_value': nav,
+            'industry': industry
+        }
+    )
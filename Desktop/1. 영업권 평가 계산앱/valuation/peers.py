@@ -0,0 +1,94 @@
+"""유사 기업 자동 선정
+
+매출액·영업이익·총자산 규모와 영업이익률을 표준화한 특성 공간에서
+대상 기업과 가장 가까운 비교 기업 k개를 찾습니다.
+특성 행렬은 한 번 만들어 메모리에 두고, 조회는 벡터화된 거리 계산으로 처리합니다.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# 규모 특성 변환 단위 (백만원): arcsinh(값 / 단위)는 큰 값에서 로그와 같고 0·음수도 처리
+SIZE_SCALE = 1_000_000
+
+# 거리 계산에 필요한 최소 공통 특성 수
+MIN_COMMON_FEATURES = 2
+
+
+def company_features(revenue, operating_income, total_assets):
+    """규모(매출액·영업이익·총자산)와 영업이익률 특성 행렬 (행: 기업)"""
+    revenue = np.atleast_1d(np.asarray(revenue, dtype=float))
+    operating_income = np.atleast_1d(np.asarray(operating_income, dtype=float))
+    total_assets = np.atleast_1d(np.asarray(total_assets, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin = np.where(revenue > 0, operating_income / revenue, np.nan)
+    return np.column_stack([
+        np.arcsinh(revenue / SIZE_SCALE),
+        np.arcsinh(operating_income / SIZE_SCALE),
+        np.arcsinh(total_assets / SIZE_SCALE),
+        margin,
+    ])
+
+
+class PeerIndex:
+    """비교 기업 특성 행렬 (표준화, 업종별 행 번호 색인)"""
+
+    def __init__(self, companies: pd.DataFrame):
+        self.companies = companies.reset_index(drop=True)
+        raw = company_features(
+            self.companies['revenue'], self.companies['operating_income'], self.companies['total_assets']
+        )
+        with warnings.catch_warnings():
+            # 값이 모두 없는 특성(예: 총자산 미입력)은 경고 대신 표준화에서 제외
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self._mean = np.nanmean(raw, axis=0)
+            std = np.nanstd(raw, axis=0)
+        self._std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+        self._mean = np.where(np.isfinite(self._mean), self._mean, 0.0)
+        self._features = (raw - self._mean) / self._std
+
+        industries = self.companies['industry'].to_numpy()
+        self._all_rows = np.arange(len(self.companies))
+        self._industry_rows = {
+            industry: np.flatnonzero(industries == industry) for industry in np.unique(industries)
+        }
+
+    @classmethod
+    def from_store(cls, store):
+        return cls(store.companies_frame())
+
+    def __len__(self):
+        return len(self.companies)
+
+    def nearest(self, revenue, operating_income, total_assets=np.nan, k=5, industry=None, metric='영업이익'):
+        """대상 기업과 가장 유사한 비교 기업 k개 (거리 오름차순)
+
+        industry를 지정하면 해당 업종 안에서만 찾고, 선택한 지표의 배수가 없는 기업은 제외합니다.
+        반환 DataFrame에는 'multiple'(선택 지표 배수)과 'distance'(표준화 거리) 컬럼이 추가됩니다.
+        """
+        rows = self._industry_rows.get(industry, self._all_rows) if industry else self._all_rows
+        multiple_column = f'multiple_{metric}'
+        if multiple_column not in self.companies:
+            return self.companies.iloc[:0].assign(multiple=[], distance=[])
+        multiples = self.companies[multiple_column].to_numpy()
+        rows = rows[~np.isnan(multiples[rows])]
+
+        target = (company_features(revenue, operating_income, total_assets)[0] - self._mean) / self._std
+        diff = self._features[rows] - target
+        available = ~np.isnan(diff)
+        common = available.sum(axis=1)
+        distance = np.sqrt(np.where(available, diff ** 2, 0).sum(axis=1) / np.maximum(common, 1))
+        distance[common < MIN_COMMON_FEATURES] = np.inf
+
+        if k < len(rows):
+            candidates = np.argpartition(distance, k)[:k]
+        else:
+            candidates = np.arange(len(rows))
+        order = candidates[np.argsort(distance[candidates], kind='stable')]
+        order = order[np.isfinite(distance[order])]
+
+        result = self.companies.iloc[rows[order]].copy()
+        result['multiple'] = multiples[rows[order]]
+        result['distance'] = distance[order]
+        return result.reset_index(drop=True)
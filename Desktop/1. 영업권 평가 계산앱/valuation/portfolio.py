@@ -0,0 +1,180 @@
+"""포트폴리오 일괄 평가
+
+기업·연도별 재무 데이터(긴 형식)를 기업별로 나눠 초과이익법·DCF·시장가치비교법을 모두 계산하고,
+상증법 보충적 평가는 묶음 전체를 한 번에 벡터 연산으로 계산합니다.
+기업을 묶음 단위로 프로세스 풀에 나눠 보내고, 끝난 묶음부터 결과를 돌려주므로
+진행률 표시와 파일 저장을 계산과 동시에 할 수 있습니다.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError
+from valuation.benchmarks import DEFAULT_INDUSTRY
+from valuation.dcf import METHOD_NAME as DCF_METHOD_NAME
+from valuation.dcf import DCFInput, value_dcf
+from valuation.excess_earnings import METHOD_NAME as EXCESS_EARNINGS_METHOD_NAME
+from valuation.excess_earnings import ExcessEarningsInput, value_excess_earnings
+from valuation.ingest import COMPANY_COLUMN, FINANCIAL_COLUMNS, iter_financial_chunks
+from valuation.market import METHOD_NAME as MARKET_METHOD_NAME
+from valuation.market import MarketComparisonInput, value_market_comparison
+from valuation.statutory import METHOD_NAME as STATUTORY_METHOD_NAME
+from valuation.statutory import StatutoryGoodwillInput, statutory_goodwill_batch, statutory_inputs
+
+# 결과 컬럼 (평가 방법별 영업권 가치 + 오류 내용)
+ERROR_COLUMN = '오류'
+PORTFOLIO_COLUMNS = [COMPANY_COLUMN, EXCESS_EARNINGS_METHOD_NAME, DCF_METHOD_NAME, MARKET_METHOD_NAME,
+                     STATUTORY_METHOD_NAME, ERROR_COLUMN]
+OUTPUT_FORMATS = ['csv', 'parquet']
+
+# 프로세스 풀 작업 하나에 넣을 기업 수 (직렬화 비용 분산)
+DEFAULT_BATCH_SIZE = 50
+
+
+@dataclass
+class PortfolioInput:
+    """포트폴리오 전체에 공통으로 적용할 평가 매개변수"""
+    excess_earnings: ExcessEarningsInput = field(default_factory=ExcessEarningsInput)
+    dcf: DCFInput = field(default_factory=lambda: DCFInput.constant_growth(5.0, 5))
+    market: MarketComparisonInput = field(default_factory=MarketComparisonInput)
+    statutory: StatutoryGoodwillInput = field(default_factory=StatutoryGoodwillInput)
+    industry: str = DEFAULT_INDUSTRY
+
+
+def read_portfolio(source, file_name=None) -> pd.DataFrame:
+    """기업 구분 컬럼이 있는 재무 데이터 파일 전체를 검증해 적재"""
+    parts = [chunk for chunk in iter_financial_chunks(source, file_name) if not chunk.empty]
+    if not parts:
+        raise ValuationError("불러올 재무 데이터가 없습니다.")
+    if COMPANY_COLUMN not in parts[0]:
+        raise ValuationError(f"포트폴리오 파일에는 기업 구분 컬럼('{COMPANY_COLUMN}')이 있어야 합니다.")
+    return pd.concat(parts, ignore_index=True)
+
+
+def split_companies(data: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
+    """긴 형식 데이터를 (기업명, 재무 데이터) 목록으로 분할"""
+    return [
+        (str(name), group[FINANCIAL_COLUMNS].reset_index(drop=True))
+        for name, group in data.groupby(COMPANY_COLUMN, sort=False, dropna=True)
+    ]
+
+
+def value_company(name, financial_data: pd.DataFrame, params: PortfolioInput) -> dict:
+    """한 기업의 세 가지 방법 영업권 가치 (계산할 수 없는 방법은 None, 사유는 오류 컬럼에 기록)"""
+    methods = [
+        (EXCESS_EARNINGS_METHOD_NAME, lambda: value_excess_earnings(financial_data, params.excess_earnings)),
+        (DCF_METHOD_NAME, lambda: value_dcf(financial_data, params.dcf)),
+        (MARKET_METHOD_NAME, lambda: value_market_comparison(financial_data, params.market, params.industry)),
+    ]
+    row = {COMPANY_COLUMN: name}
+    errors = []
+    for method, evaluate in methods:
+        try:
+            row[method] = float(evaluate().value)
+        except (ValuationError, KeyError, ValueError, ZeroDivisionError) as error:
+            row[method] = None
+            errors.append(f"{method}: {error}")
+    row[ERROR_COLUMN] = '; '.join(errors)
+    return row
+
+
+def statutory_goodwill_companies(companies: List[Tuple[str, pd.DataFrame]], params: StatutoryGoodwillInput):
+    """(기업명, 재무 데이터) 목록 전체의 상증법 영업권을 한 번에 계산 (입력 순서, 자료가 부족한 기업은 NaN)"""
+    if not companies:
+        return np.array([])
+    data = pd.concat([financial_data for _, financial_data in companies], ignore_index=True)
+    keys = np.repeat(np.arange(len(companies)), [len(financial_data) for _, financial_data in companies])
+    _, earnings, equity = statutory_inputs(data, keys)
+    return statutory_goodwill_batch(earnings, equity, **asdict(params))
+
+
+def _value_batch(task):
+    """기업 묶음 평가 (프로세스 풀에서도 실행되도록 최상위 함수로 정의)"""
+    params = PortfolioInput(
+        excess_earnings=ExcessEarningsInput(**task['params']['excess_earnings']),
+        dcf=DCFInput(**task['params']['dcf']),
+        market=MarketComparisonInput(**task['params']['market']),
+        statutory=StatutoryGoodwillInput(**task['params']['statutory']),
+        industry=task['params']['industry'],
+    )
+    rows = [value_company(name, financial_data, params) for name, financial_data in task['companies']]
+    for row, value in zip(rows, statutory_goodwill_companies(task['companies'], params.statutory)):
+        if np.isnan(value):
+            row[STATUTORY_METHOD_NAME] = None
+            errors = [row[ERROR_COLUMN]] if row[ERROR_COLUMN] else []
+            row[ERROR_COLUMN] = '; '.join(errors + [f"{STATUTORY_METHOD_NAME}: 재무 데이터가 부족합니다."])
+        else:
+            row[STATUTORY_METHOD_NAME] = float(value)
+    return rows
+
+
+def value_portfolio(companies: Iterable[Tuple[str, pd.DataFrame]], params: PortfolioInput,
+                    workers=None, batch_size=DEFAULT_BATCH_SIZE) -> Iterator[List[dict]]:
+    """기업별 평가 결과를 묶음 단위로 차례로 반환 (입력 순서 유지)
+
+    workers가 2 이상이고 묶음이 여러 개면 프로세스 풀에서 병렬로 계산합니다.
+    """
+    companies = list(companies)
+    spec = asdict(params)
+    tasks = [
+        {'companies': companies[start:start + batch_size], 'params': spec}
+        for start in range(0, len(companies), batch_size)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            yield from executor.map(_value_batch, tasks)
+    else:
+        yield from map(_value_batch, tasks)
+
+
+class PortfolioWriter:
+    """평가 결과를 묶음 단위로 CSV 또는 Parquet 파일에 이어 쓰기
+
+        with PortfolioWriter(path, 'parquet') as writer:
+            for rows in value_portfolio(companies, params):
+                writer.write(rows)
+    """
+
+    def __init__(self, path, output_format='csv'):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+        self.path = path
+        self.output_format = output_format
+        self.rows = 0
+        self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, rows: List[dict]):
+        frame = pd.DataFrame.from_records(rows, columns=PORTFOLIO_COLUMNS)
+        for column in PORTFOLIO_COLUMNS[1:-1]:
+            frame[column] = frame[column].astype('float64')
+        if self.output_format == 'csv':
+            # 첫 묶음만 머리글과 BOM(엑셀 한글 표시용)을 쓰고 이후는 이어 쓰기
+            first = self.rows == 0
+            frame.to_csv(self.path, header=first, index=False,
+                         mode='w' if first else 'a', encoding='utf-8-sig' if first else 'utf-8')
+        else:
+            import pyarrow as pa
+            from pyarrow import parquet
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = parquet.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        self.rows += len(frame)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
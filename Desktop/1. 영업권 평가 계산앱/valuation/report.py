@@ -0,0 +1,440 @@
+"""영업권 평가 보고서 PDF
+
+평가 결과 요약, 초과이익법·상증법 상세 계산 과정, DCF 예측표, 시장가치비교법 내역과 차트를 PDF 한 파일로 만듭니다.
+한글은 reportlab 내장 CID 글꼴(HYGothic-Medium)을 사용하므로 별도 글꼴 파일이 필요 없습니다.
+
+보고서 생성은 ReportJobs가 백그라운드 스레드에서 처리하고, 완성된 PDF는 기업 정보와 평가 결과의 내용 해시로
+보관하므로 내용과 평가일이 바뀌지 않았으면 다시 만들지 않습니다.
+"""
+import copy
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from valuation.cache import ResultCache, stable_hash
+from valuation.dcf import FORECAST_COLUMNS, forecast_frame
+from valuation.excess_earnings import earnings_basis
+from valuation.ingest import FINANCIAL_COLUMNS
+
+REPORT_VERSION = 1  # 보고서 양식이 바뀌면 올려서 이전 캐시를 무효화
+FONT_NAME = 'HYGothic-Medium'
+MILLION = 1_000_000
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+MISSING = 'missing'
+
+DISCLAIMER = ("이 보고서는 자동 생성된 참고용 자료입니다. 실제 법적 효력이 필요한 경우나 중요한 의사결정에 활용하기 전에 "
+              "반드시 세무사, 회계사, 또는 감정평가사의 전문적인 검토를 받으시기 바랍니다.")
+
+
+def report_key(company_data: Dict, valuation_results: Dict, generated_on: Optional[date] = None) -> str:
+    """보고서 내용 해시 (기업 정보·재무 데이터·평가 결과·평가일이 같으면 같은 키, 평가일 기본값은 오늘)"""
+    company = {key: value for key, value in company_data.items() if key != 'financial_data'}
+    financial_data = company_data.get('financial_data')
+    generated_on = generated_on or date.today()
+    parts = ['report', REPORT_VERSION, generated_on.strftime('%Y-%m-%d'), company, valuation_results]
+    if isinstance(financial_data, pd.DataFrame):
+        parts.append(financial_data)
+    return stable_hash(*parts)
+
+
+def _won(value):
+    return f"{value:,.0f}원"
+
+
+def _millions(value):
+    if pd.isna(value):
+        return "-"
+    return f"{value / MILLION:,.0f}"
+
+
+def _year(value):
+    if pd.isna(value):
+        return "-"
+    return f"{value:.0f}"
+
+
+class _Builder:
+    """reportlab 구성 요소를 만드는 도우미 (reportlab은 보고서를 만들 때만 가져옴)"""
+
+    def __init__(self):
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+        if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+        self.colors = colors
+        base = getSampleStyleSheet()
+        self.styles = {
+            name: ParagraphStyle(f'report_{name}', parent=base[parent], fontName=FONT_NAME, wordWrap='CJK', **extra)
+            for name, parent, extra in [
+                ('title', 'Title', {}),
+                ('h1', 'Heading1', {'spaceBefore': 12}),
+                ('h2', 'Heading2', {'spaceBefore': 8}),
+                ('body', 'BodyText', {'fontSize': 9, 'leading': 13}),
+                ('small', 'BodyText', {'fontSize': 8, 'leading': 11, 'textColor': colors.grey}),
+            ]
+        }
+
+    def paragraph(self, text, style='body'):
+        from reportlab.platypus import Paragraph
+
+        return Paragraph(text, self.styles[style])
+
+    def table(self, rows, col_widths=None, font_size=8.5, numeric_from=1):
+        """첫 행을 머리글로 하는 표 (numeric_from 열부터 오른쪽 정렬)"""
+        from reportlab.platypus import Table, TableStyle
+
+        table = Table(rows, colWidths=col_widths, repeatRows=1, hAlign='LEFT')
+        table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('BACKGROUND', (0, 0), (-1, 0), self.colors.HexColor('#E8EEF7')),
+            ('GRID', (0, 0), (-1, -1), 0.4, self.colors.HexColor('#B0B7C3')),
+            ('ALIGN', (numeric_from, 1), (-1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]))
+        return table
+
+    def _drawing(self, title, width, height):
+        from reportlab.graphics.shapes import Drawing, String
+
+        drawing = Drawing(width, height)
+        drawing.add(String(width / 2, height - 14, title, fontName=FONT_NAME, fontSize=10, textAnchor='middle'))
+        return drawing
+
+    def bar_chart(self, title, labels, values, width=440, height=200):
+        """막대 차트 (값 축은 백만원 단위)"""
+        from reportlab.graphics.charts.barcharts import VerticalBarChart
+
+        drawing = self._drawing(f"{title} (백만원)", width, height)
+        chart = VerticalBarChart()
+        chart.x, chart.y, chart.width, chart.height = 60, 30, width - 80, height - 60
+        chart.data = [[value / MILLION for value in values]]
+        chart.categoryAxis.categoryNames = [str(label) for label in labels]
+        chart.categoryAxis.labels.fontName = FONT_NAME
+        chart.categoryAxis.labels.fontSize = 8
+        chart.valueAxis.labels.fontName = FONT_NAME
+        chart.valueAxis.labels.fontSize = 7
+        chart.valueAxis.labelTextFormat = lambda value: f"{value:,.0f}"
+        chart.valueAxis.forceZero = True
+        chart.bars[0].fillColor = self.colors.HexColor('#4C78A8')
+        drawing.add(chart)
+        return drawing
+
+    def line_chart(self, title, categories, series: Dict[str, list], width=440, height=200):
+        """꺾은선 차트 (계열 이름 → 값 목록, 값 축은 백만원 단위)"""
+        from reportlab.graphics.charts.legends import Legend
+        from reportlab.graphics.charts.linecharts import HorizontalLineChart
+
+        palette = [self.colors.HexColor('#4C78A8'), self.colors.HexColor('#F58518')]
+        drawing = self._drawing(f"{title} (백만원)", width, height)
+        chart = HorizontalLineChart()
+        chart.x, chart.y, chart.width, chart.height = 60, 40, width - 80, height - 70
+        chart.data = [[value / MILLION for value in values] for values in series.values()]
+        chart.categoryAxis.categoryNames = [str(category) for category in categories]
+        chart.categoryAxis.labels.fontName = FONT_NAME
+        chart.categoryAxis.labels.fontSize = 7
+        chart.valueAxis.labels.fontName = FONT_NAME
+        chart.valueAxis.labels.fontSize = 7
+        chart.valueAxis.labelTextFormat = lambda value: f"{value:,.0f}"
+        for index in range(len(series)):
+            chart.lines[index].strokeColor = palette[index % len(palette)]
+            chart.lines[index].strokeWidth = 1.5
+        drawing.add(chart)
+
+        legend = Legend()
+        legend.x, legend.y = 60, 14
+        legend.fontName = FONT_NAME
+        legend.fontSize = 8
+        legend.alignment = 'right'
+        legend.columnMaximum = 1
+        legend.colorNamePairs = [(palette[index % len(palette)], name) for index, name in enumerate(series)]
+        drawing.add(legend)
+        return drawing
+
+    def pie_chart(self, title, labels, values, width=440, height=200):
+        from reportlab.graphics.charts.piecharts import Pie
+
+        drawing = self._drawing(title, width, height)
+        pie = Pie()
+        pie.x, pie.y, pie.width, pie.height = width / 2 - 70, 20, 140, 140
+        pie.data = [max(value, 0) for value in values]
+        total = sum(pie.data) or 1
+        pie.labels = [f"{label} {value / total:.0%}" for label, value in zip(labels, pie.data)]
+        pie.simpleLabels = False
+        pie.slices.fontName = FONT_NAME
+        pie.slices.fontSize = 8
+        for index, color in enumerate(['#4C78A8', '#F58518', '#54A24B', '#E45756']):
+            if index < len(pie.data):
+                pie.slices[index].fillColor = self.colors.HexColor(color)
+        drawing.add(pie)
+        return drawing
+
+
+def _summary_section(builder, valuation_results):
+    names = [result['method'] for result in valuation_results.values()]
+    values = [result['value'] for result in valuation_results.values()]
+    story = [builder.paragraph("평가 결과 요약", 'h1'),
+             builder.table([['평가 방법', '영업권 가치']] + [[name, _won(value)] for name, value in zip(names, values)],
+                           col_widths=[200, 160])]
+    if values:
+        story.append(builder.bar_chart('평가 방법별 영업권 가치 비교', names, values))
+    return story
+
+
+def _financial_section(builder, financial_data):
+    if not isinstance(financial_data, pd.DataFrame) or financial_data.empty:
+        return []
+    # 알려진 재무 컬럼만 숫자로 바꿔 표시 (추가 컬럼은 제외, 숫자가 아닌 값·빈 값은 '-')
+    columns = [column for column in FINANCIAL_COLUMNS if column in financial_data.columns]
+    table = financial_data[columns].apply(pd.to_numeric, errors='coerce')
+    rows = [columns]
+    for values in table.itertuples(index=False):
+        rows.append([_year(value) if column == '연도' else _millions(value) for column, value in zip(columns, values)])
+    return [builder.paragraph("기초 재무 데이터", 'h2'), builder.paragraph("(단위: 백만원)", 'small'),
+            builder.table(rows, font_size=8)]
+
+
+def _excess_earnings_section(builder, result):
+    params, details = result['parameters'], result['details']
+    steps = [
+        ("1. 기초 데이터", [f"{earnings_basis(params)}: {_won(details['avg_earnings'])}",
+                         f"총자산: {_won(details['total_assets'])}"]),
+        ("2. 정상이익 계산", ["정상이익 = 총자산 × 정상수익률",
+                          f"정상이익 = {details['total_assets']:,.0f} × {params['normal_roi']}% = {_won(details['normal_profit'])}"]),
+        ("3. 초과이익 계산", ["초과이익 = 평균이익 - 정상이익",
+                          f"초과이익 = {details['avg_earnings']:,.0f} - {details['normal_profit']:,.0f} = "
+                          f"{_won(details['excess_profit'])}"]),
+        ("4. 현재가치 계산", [f"{params['excess_years']}년 동안 초과이익의 현재가치 합계",
+                          f"할인율: {params['discount_rate']}%, 연금현가계수: {details['annuity_factor']:.4f}",
+                          f"현재가치 합계 = {details['excess_profit']:,.0f} × {details['annuity_factor']:.4f}"]),
+        ("5. 조정", [f"조정 계수: {params['adjustment_factor']}", f"산업 프리미엄: {params['industry_premium']}%"]),
+    ]
+    story = [
+        builder.paragraph(result['method'], 'h1'),
+        builder.table([['매개변수', '값'],
+                       ['정상 자본수익률', f"{params['normal_roi']}%"],
+                       ['초과이익 인정연수', f"{params['excess_years']}년"],
+                       ['할인율', f"{params['discount_rate']}%"],
+                       ['조정 계수', f"{params['adjustment_factor']}"],
+                       ['산업 프리미엄', f"{params['industry_premium']}%"],
+                       ['기준 이익', earnings_basis(params)]], col_widths=[160, 120]),
+        builder.paragraph("상세 계산 과정", 'h2'),
+    ]
+    for heading, lines in steps:
+        story.append(builder.paragraph(f"<b>{heading}</b><br/>" + '<br/>'.join(f"- {line}" for line in lines)))
+    story.append(builder.paragraph(f"<b>최종 영업권 가치: {_won(result['value'])}</b>"))
+
+    yearly = details.get('yearly_present_values') or []
+    if yearly:
+        story.append(builder.bar_chart('연도별 초과이익의 현재가치', range(1, len(yearly) + 1), yearly))
+    return story
+
+
+def _dcf_section(builder, result):
+    params, details = result['parameters'], result['details']
+    forecast = forecast_frame(details['forecast'])
+    growth_rates = params['growth_rates']
+    if params.get('stages'):
+        # 단계별 장기 예측은 연도별 나열 대신 단계 요약
+        growth_text = ', '.join(
+            f"{stage['name'] or '단계'} {stage['years']}년 {stage['growth_rate']}%"
+            + (f"→{stage['end_growth_rate']}%" if stage['end_growth_rate'] is not None else '')
+            for stage in params['stages']
+        )
+    elif len(set(growth_rates)) == 1:
+        growth_text = f"{growth_rates[0]}% ({len(growth_rates)}년)"
+    else:
+        growth_text = ', '.join(f"{rate}%" for rate in growth_rates)
+
+    labels = list(FORECAST_COLUMNS.values())
+    rows = [labels]
+    for _, row in forecast.iterrows():
+        rows.append([str(row['연도'])] + [
+            f"{row[label]:.4f}" if label == '할인계수' else _millions(row[label]) for label in labels[1:]
+        ])
+
+    return [
+        builder.paragraph(result['method'], 'h1'),
+        builder.table([['매개변수', '값'],
+                       ['매출 성장률', growth_text],
+                       ['영업이익률', f"{params['operating_margin']}%"],
+                       ['할인율', f"{params['discount_rate']}%"],
+                       ['영구 성장률', f"{params['terminal_growth_rate']}%"],
+                       ['법인세율', f"{params['tax_rate']}%"],
+                       ['잔존가치 방법', params['terminal_value_method']],
+                       ['할인 시점', '기중(mid-year)' if params.get('mid_year') else '기말']], col_widths=[160, 220]),
+        builder.paragraph("미래 현금흐름 예측", 'h2'),
+        builder.paragraph("(단위: 백만원)", 'small'),
+        builder.table(rows, font_size=6.5),
+        builder.paragraph("DCF 평가 결과", 'h2'),
+        builder.table([['항목', '금액'],
+                       ['예측 기간 현금흐름 합계', _won(details['total_present_value'])],
+                       ['잔존가치', _won(details['terminal_value'])],
+                       ['잔존가치 현재가치', _won(details['terminal_value_present'])],
+                       ['총 기업가치', _won(details['firm_value'])],
+                       ['순자산가치', _won(details['net_asset_value'])],
+                       ['추정 영업권 가치', _won(result['value'])]], col_widths=[160, 160]),
+        builder.line_chart('예측 기간 현금흐름 추이', forecast['연도'].tolist(),
+                           {'잉여현금흐름': forecast['잉여현금흐름'].tolist(), '현재가치': forecast['현재가치'].tolist()}),
+        builder.pie_chart('기업가치 구성', ['예측기간 현재가치', '잔존가치 현재가치'],
+                          [details['total_present_value'], details['terminal_value_present']]),
+    ]
+
+
+def _market_section(builder, result):
+    params, details = result['parameters'], result['details']
+    return [
+        builder.paragraph(result['method'], 'h1'),
+        builder.table([['항목', '값'],
+                       ['업종', details.get('industry', '')],
+                       ['기준 지표', params['selected_metric']],
+                       ['지표 값', _won(params['metric_value'])],
+                       ['적용 배수', f"{params['multiple']:.2f}배"],
+                       ['시장가치', _won(details['market_value'])],
+                       ['조정 계수', f"{params['adjustment_factor']}"],
+                       ['조정 후 시장가치', _won(details['adjusted_market_value'])],
+                       ['순자산가치', _won(details['net_asset_value'])],
+                       ['추정 영업권 가치', _won(result['value'])]], col_widths=[160, 160]),
+    ]
+
+
+def _statutory_section(builder, result):
+    params, details = result['parameters'], result['details']
+    rows = [['연도', '당기순이익', '가중치']] + [
+        [str(year), _won(earnings), str(weight)]
+        for year, earnings, weight in zip(details['years'], details['earnings'], details['weights'])
+    ]
+    steps = [
+        ("1. 순손익 가중평균", [f"가중평균 = Σ(당기순이익 × 가중치) / Σ가중치 = {_won(details['weighted_earnings'])}"]),
+        ("2. 초과이익 계산", [
+            f"순손익 반영액 = {details['weighted_earnings']:,.0f} × {params['earnings_ratio']}% = {_won(details['earnings_portion'])}",
+            f"자기자본 정상이익 = {details['equity']:,.0f} × {params['normal_return_rate']}% = {_won(details['normal_return'])}",
+            f"초과이익 = {_won(details['excess_profit'])}"]),
+        ("3. 현재가치 환산", [f"{params['years']}년, 이자율 {params['discount_rate']}%, 연금현가계수 {details['annuity_factor']:.4f}",
+                          "영업권 = max(초과이익, 0) × 연금현가계수"]),
+    ]
+    story = [builder.paragraph(result['method'], 'h1'),
+             builder.paragraph("상속세및증여세법 시행령 제59조 제2항에 따른 영업권 평가", 'small'),
+             builder.table(rows, col_widths=[80, 160, 60])]
+    for heading, lines in steps:
+        story.append(builder.paragraph(f"<b>{heading}</b><br/>" + '<br/>'.join(f"- {line}" for line in lines)))
+    story.append(builder.paragraph(f"<b>최종 영업권 가치: {_won(result['value'])}</b>"))
+    return story
+
+
+# 평가 결과 키 → 상세 내역 구성 함수 (없는 방법은 요약에만 표시)
+METHOD_SECTIONS = {
+    'excess_earnings': _excess_earnings_section,
+    'dcf': _dcf_section,
+    'market_comparison': _market_section,
+    'statutory': _statutory_section,
+}
+
+
+def build_report_pdf(company_data: Dict, valuation_results: Dict, generated_on: Optional[date] = None) -> bytes:
+    """기업 정보와 평가 결과로 PDF 보고서 생성"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import PageBreak, SimpleDocTemplate, Spacer
+
+    builder = _Builder()
+    generated_on = generated_on or date.today()
+    story = [
+        builder.paragraph("영업권 가치 평가 보고서", 'title'),
+        builder.table([['항목', '내용'],
+                       ['회사명', company_data.get('name') or '-'],
+                       ['산업', company_data.get('industry') or '-'],
+                       ['사업자등록번호', company_data.get('business_number') or '-'],
+                       ['평가일', generated_on.strftime('%Y-%m-%d')]], col_widths=[120, 240], numeric_from=2),
+        Spacer(1, 6),
+        builder.paragraph(f"<b>전문가 검토 필요</b>: {DISCLAIMER}", 'small'),
+    ]
+    story += _summary_section(builder, valuation_results)
+    story += _financial_section(builder, company_data.get('financial_data'))
+    for method, section in METHOD_SECTIONS.items():
+        if method in valuation_results:
+            story.append(PageBreak())
+            story += section(builder, valuation_results[method])
+
+    def footer(canvas, document):
+        canvas.saveState()
+        canvas.setFont(FONT_NAME, 7)
+        canvas.drawRightString(A4[0] - 15 * mm, 10 * mm, f"영업권 평가 시스템 | {document.page}쪽")
+        canvas.restoreState()
+
+    output = io.BytesIO()
+    document = SimpleDocTemplate(output, pagesize=A4, title="영업권 가치 평가 보고서",
+                                 leftMargin=15 * mm, rightMargin=15 * mm, topMargin=15 * mm, bottomMargin=15 * mm)
+    document.build(story, onFirstPage=footer, onLaterPages=footer)
+    return output.getvalue()
+
+
+class ReportJobs:
+    """보고서 PDF를 백그라운드 스레드에서 만들고 내용 해시별로 보관 (스레드 안전, 모든 세션 공유)"""
+
+    def __init__(self, workers=2, cache=None):
+        self.workers = workers
+        self.cache = cache or ResultCache(max_entries=64)
+        self._pending = {}
+        self._failures = {}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, key, company_data: Dict, valuation_results: Dict, generated_on: Optional[date] = None) -> bool:
+        """key의 보고서가 없으면 생성 작업을 시작 (이미 있거나 만드는 중이면 False)
+
+        generated_on은 key를 만들 때 쓴 평가일과 같아야 합니다.
+        """
+        found, _ = self.cache.get(key)
+        if found:
+            return False
+        # 세션이 작업 중에 값을 바꿔도 영향이 없도록 복사본으로 생성
+        company_data = copy.deepcopy(company_data)
+        valuation_results = copy.deepcopy(valuation_results)
+        with self._lock:
+            if key in self._pending:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='report')
+            self._failures.pop(key, None)
+            future = self._executor.submit(build_report_pdf, company_data, valuation_results, generated_on)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return True
+
+    def _finish(self, key, future):
+        error = future.exception()
+        if error is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            self._pending.pop(key, None)
+            if error is not None:
+                self._failures[key] = str(error)
+
+    def status(self, key) -> Tuple[str, object]:
+        """(상태, 내용): (DONE, PDF 바이트) / (PENDING, None) / (FAILED, 오류 메시지) / (MISSING, None)"""
+        found, pdf = self.cache.get(key)
+        if found:
+            return DONE, pdf
+        with self._lock:
+            if key in self._pending:
+                return PENDING, None
+            if key in self._failures:
+                return FAILED, self._failures[key]
+        return MISSING, None
+
+
+# 프로세스 전역 보고서 작업 (스레드 풀은 처음 요청할 때 생성)
+REPORT_JOBS = ReportJobs()
@@ -0,0 +1,295 @@
+"""이름 있는 평가 시나리오 (기본·낙관·비관·인수자 관점 등)
+
+시나리오마다 평가 방법별 매개변수를 한 행에 담은 열 형식 표(DataFrame)로 관리합니다.
+컬럼 이름은 '평가 결과 키.매개변수'이며, 연도별 값 목록(DCF 성장률·단계 등)은 JSON 문자열로 둡니다.
+시나리오를 비교할 때는 방법마다 모든 시나리오를 한 번의 배열 연산으로 다시 계산하고,
+표 전체를 Parquet으로 내보내거나 가져올 수 있습니다.
+"""
+import io
+import json
+from collections import defaultdict
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import ValuationError, latest_financials
+from valuation.dcf import (
+    CAPEX_RATIO,
+    DEPRECIATION_RATIO,
+    WORKING_CAPITAL_RATIO,
+    DCFInput,
+    goodwill_batch,
+    yearly_schedules,
+)
+from valuation.dcf import METHOD_NAME as DCF_METHOD_NAME
+from valuation.excess_earnings import METHOD_NAME as EXCESS_METHOD_NAME
+from valuation.excess_earnings import ExcessEarningsInput, average_earnings, excess_earnings_batch
+from valuation.market import METHOD_NAME as MARKET_METHOD_NAME
+from valuation.market import MarketComparisonInput, industry_multiple, market_goodwill_batch, metric_value
+from valuation.statutory import METHOD_NAME as STATUTORY_METHOD_NAME
+from valuation.statutory import RECENT_WEIGHTS, StatutoryGoodwillInput, statutory_goodwill_batch
+
+SCENARIO_NAME = 'name'
+
+# 평가 결과 키 → (매개변수 데이터클래스, 방법 이름)
+SCENARIO_METHODS = {
+    'excess_earnings': (ExcessEarningsInput, EXCESS_METHOD_NAME),
+    'dcf': (DCFInput, DCF_METHOD_NAME),
+    'market_comparison': (MarketComparisonInput, MARKET_METHOD_NAME),
+    'statutory': (StatutoryGoodwillInput, STATUTORY_METHOD_NAME),
+}
+# JSON 문자열로 저장하는 목록 매개변수
+LIST_FIELDS = ('growth_rates', 'operating_margins', 'depreciation_ratios', 'capex_ratios', 'working_capital_ratios',
+               'stages')
+SCENARIO_COLUMNS = [SCENARIO_NAME] + [
+    f"{method}.{field.name}" for method, (input_class, _) in SCENARIO_METHODS.items() for field in fields(input_class)
+]
+# 일정이 없는 DCF 연도별 항목의 기본 비율 (%)
+DCF_DEFAULT_RATIOS = {
+    'depreciation_ratios': DEPRECIATION_RATIO * 100,
+    'capex_ratios': CAPEX_RATIO * 100,
+    'working_capital_ratios': WORKING_CAPITAL_RATIO * 100,
+}
+
+
+def normalize_scenarios(scenarios: pd.DataFrame) -> pd.DataFrame:
+    """시나리오 표를 SCENARIO_COLUMNS 순서로 맞춤 (없는 컬럼은 빈 값, 모르는 컬럼은 제외)"""
+    if scenarios is None:
+        scenarios = pd.DataFrame()
+    return scenarios.reindex(columns=SCENARIO_COLUMNS).reset_index(drop=True)
+
+
+def _cell(value):
+    """표에 넣을 값 (목록은 JSON 문자열, numpy 스칼라는 파이썬 값)"""
+    if isinstance(value, (list, tuple)):
+        return json.dumps(value, ensure_ascii=False)
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def scenario_row(name, valuation_results) -> dict:
+    """평가 결과(평가 결과 키 → ValuationResult.as_dict())의 매개변수로 시나리오 한 행을 만듦"""
+    row = {SCENARIO_NAME: name}
+    for method, (input_class, _) in SCENARIO_METHODS.items():
+        if method not in valuation_results:
+            continue
+        parameters = valuation_results[method]['parameters']
+        for field in fields(input_class):
+            if field.name in parameters:
+                row[f"{method}.{field.name}"] = _cell(parameters[field.name])
+    return row
+
+
+def add_scenario(scenarios: pd.DataFrame, name, valuation_results) -> pd.DataFrame:
+    """현재 평가 결과를 name 시나리오로 추가한 새 표 (같은 이름이 있으면 교체)"""
+    name = str(name).strip()
+    if not name:
+        raise ValuationError("시나리오 이름을 입력하세요.")
+    if not any(method in valuation_results for method in SCENARIO_METHODS):
+        raise ValuationError("시나리오로 저장할 평가 결과가 없습니다.")
+    scenarios = normalize_scenarios(scenarios)
+    scenarios = scenarios[scenarios[SCENARIO_NAME] != name]
+    row = pd.DataFrame([scenario_row(name, valuation_results)])
+    return normalize_scenarios(pd.concat([scenarios, row], ignore_index=True) if len(scenarios) else row)
+
+
+def _method_inputs(scenarios: pd.DataFrame, method):
+    """행마다 방법의 매개변수 데이터클래스 (해당 방법 값이 하나도 없는 행은 None)"""
+    input_class = SCENARIO_METHODS[method][0]
+    columns = {field.name: f"{method}.{field.name}" for field in fields(input_class)}
+    inputs = []
+    for record in scenarios[list(columns.values())].to_dict('records'):
+        values = {}
+        for name, column in columns.items():
+            value = record[column]
+            if value is None or (np.isscalar(value) and pd.isna(value)):
+                continue
+            values[name] = json.loads(value) if name in LIST_FIELDS and isinstance(value, str) else _cell(value)
+        if not values:
+            inputs.append(None)
+            continue
+        try:
+            inputs.append(input_class(**values))
+        except TypeError:
+            # 필수 매개변수(DCF 성장률 등)가 빠진 행
+            inputs.append(None)
+    return inputs
+
+
+def scenario_inputs(scenarios: pd.DataFrame, name):
+    """name 시나리오의 평가 결과 키 → 매개변수 데이터클래스"""
+    scenarios = normalize_scenarios(scenarios)
+    matches = np.flatnonzero(scenarios[SCENARIO_NAME].to_numpy() == name)
+    if not len(matches):
+        raise ValuationError(f"시나리오가 없습니다: {name}")
+    row = scenarios.iloc[matches[:1]]
+    inputs = {method: _method_inputs(row, method)[0] for method in SCENARIO_METHODS}
+    return {method: params for method, params in inputs.items() if params is not None}
+
+
+def _net_asset_value(latest_data):
+    if '총자산' in latest_data and '총부채' in latest_data:
+        return float(latest_data['총자산'] - latest_data['총부채'])
+    return None
+
+
+def _method_columns(scenarios: pd.DataFrame, method):
+    """단일 값 매개변수만 있는 방법의 (값이 있는 행 표시, 매개변수 → 해당 행들의 배열), 빈 칸은 기본값으로 채움"""
+    input_class = SCENARIO_METHODS[method][0]
+    names = [field.name for field in fields(input_class)]
+    table = scenarios[[f"{method}.{name}" for name in names]].set_axis(names, axis=1)
+    present = table.notna().any(axis=1).to_numpy()
+    defaults = {field.name: field.default for field in fields(input_class) if field.default is not None}
+    table = table[present].fillna(defaults).infer_objects()
+    return present, {name: table[name].to_numpy() for name in names}
+
+
+def _compare_excess_earnings(financial_data, scenarios, context):
+    present, columns = _method_columns(scenarios, 'excess_earnings')
+    values = np.full(len(scenarios), np.nan)
+    if present.any():
+        # 최근 연도 가중 여부는 행마다 평균 이익 또는 3:2:1 가중평균 중 하나를 고름
+        weight_recent = columns.pop('weight_recent').astype(bool)
+        earnings = np.where(weight_recent, average_earnings(financial_data, True), average_earnings(financial_data))
+        columns = {name: column.astype(float) for name, column in columns.items()}
+        values[present] = excess_earnings_batch(earnings, context['latest']['총자산'], **columns)
+    return present, values
+
+
+def _dcf_schedules(params: DCFInput, years):
+    """일정이 없는 항목은 단일 값·기본 비율로 채운 연도별 일정 (project_operations 형식)"""
+    values = {name: getattr(params, name) for name in ('operating_margins', *DCF_DEFAULT_RATIOS)}
+    if values['operating_margins'] is None:
+        values['operating_margins'] = [params.operating_margin] * years
+    for name, default in DCF_DEFAULT_RATIOS.items():
+        if values[name] is None:
+            values[name] = [default] * years
+    return yearly_schedules(values, years)
+
+
+def _compare_dcf(financial_data, scenarios, context):
+    inputs = _method_inputs(scenarios, 'dcf')
+    present = np.array([params is not None for params in inputs], dtype=bool)
+    values = np.full(len(inputs), np.nan)
+    # 예측 기간·영구가치 방법·할인 시점이 같은 시나리오끼리 한 번에 계산
+    groups = defaultdict(list)
+    for index, params in enumerate(inputs):
+        if params is not None:
+            groups[(len(params.growth_rates), params.terminal_value_method, bool(params.mid_year))].append(index)
+
+    for (years, terminal_value_method, mid_year), members in groups.items():
+        group = [inputs[index] for index in members]
+        schedules = [_dcf_schedules(params, years) for params in group]
+        values[members] = goodwill_batch(
+            float(context['latest']['매출액']),
+            np.array([params.growth_rates for params in group], dtype=float),
+            np.array([params.operating_margin for params in group], dtype=float),
+            np.array([params.tax_rate for params in group], dtype=float),
+            np.array([params.discount_rate for params in group], dtype=float),
+            np.array([params.terminal_growth_rate for params in group], dtype=float),
+            net_asset_value=context['net_asset_value'],
+            terminal_value_method=terminal_value_method,
+            exit_multiple=np.array([params.exit_multiple for params in group], dtype=float),
+            schedules={key: np.stack([schedule[key] for schedule in schedules]) for key in schedules[0]},
+            mid_year=mid_year
+        )
+    return present, values
+
+
+def _compare_market(financial_data, scenarios, context):
+    present, columns = _method_columns(scenarios, 'market_comparison')
+    values = np.full(len(scenarios), np.nan)
+    if present.any():
+        metrics = columns['selected_metric']
+        multiples = columns['multiple'].astype(float)
+        # 배수가 비어 있으면 지표별 업종 평균 배수
+        for metric in set(metrics):
+            missing = (metrics == metric) & np.isnan(multiples)
+            if missing.any():
+                multiples[missing] = industry_multiple(context['industry'], metric, context['store'])
+        metric_values = {metric: metric_value(context['latest'], metric) or 0 for metric in set(metrics)}
+        values[present] = market_goodwill_batch(
+            np.array([metric_values[metric] for metric in metrics], dtype=float),
+            multiples,
+            columns['adjustment_factor'].astype(float),
+            context['net_asset_value']
+        )
+    return present, values
+
+
+def _compare_statutory(financial_data, scenarios, context):
+    present, columns = _method_columns(scenarios, 'statutory')
+    values = np.full(len(scenarios), np.nan)
+    if present.any() and '자본' in context['latest'] and '당기순이익' in financial_data:
+        recent = financial_data.sort_values('연도', ascending=False).head(len(RECENT_WEIGHTS))
+        columns = {name: column.astype(float) for name, column in columns.items()}
+        values[present] = statutory_goodwill_batch(recent['당기순이익'].to_numpy(dtype=float)[np.newaxis, :],
+                                                   float(context['latest']['자본']), **columns)
+    return present, values
+
+
+# 평가 결과 키 → 모든 시나리오를 한 번에 다시 계산하는 함수 (값이 있는 행 표시, 영업권 배열)
+SCENARIO_EVALUATORS = {
+    'excess_earnings': _compare_excess_earnings,
+    'dcf': _compare_dcf,
+    'market_comparison': _compare_market,
+    'statutory': _compare_statutory,
+}
+
+
+def compare_scenarios(financial_data: pd.DataFrame, scenarios: pd.DataFrame, industry=None,
+                      store=None) -> pd.DataFrame:
+    """시나리오(행) × 평가 방법(열)의 영업권 가치 표
+
+    시나리오에 없는 방법이나 계산할 수 없는 경우(초과이익이 없거나 필요한 재무 항목이 없는 경우)는 NaN입니다.
+    시장가치비교법 배수가 비어 있으면 industry의 업종 평균 배수를 사용합니다.
+    """
+    scenarios = normalize_scenarios(scenarios)
+    latest_data = latest_financials(financial_data)
+    context = {
+        'latest': latest_data,
+        'net_asset_value': _net_asset_value(latest_data),
+        'industry': industry,
+        'store': store,
+    }
+    columns = {}
+    for method, (_, method_name) in SCENARIO_METHODS.items():
+        try:
+            present, values = SCENARIO_EVALUATORS[method](financial_data, scenarios, context)
+        except KeyError:
+            # 필요한 재무 항목이 없는 방법
+            present, values = np.ones(len(scenarios), dtype=bool), np.full(len(scenarios), np.nan)
+        if present.any():
+            columns[method_name] = values
+    return pd.DataFrame(columns, index=pd.Index(scenarios[SCENARIO_NAME], name='시나리오'))
+
+
+def scenarios_to_parquet(scenarios: pd.DataFrame) -> bytes:
+    """시나리오 표 → Parquet 바이트"""
+    buffer = io.BytesIO()
+    normalize_scenarios(scenarios).to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def read_scenarios(source) -> pd.DataFrame:
+    """Parquet 파일(경로·바이트·파일 객체)에서 시나리오 표를 읽음"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    try:
+        scenarios = pd.read_parquet(source)
+    except Exception as e:
+        raise ValuationError(f"시나리오 파일을 읽을 수 없습니다: {e}")
+    if SCENARIO_NAME not in scenarios.columns:
+        raise ValuationError(f"시나리오 파일에 '{SCENARIO_NAME}' 컬럼이 없습니다.")
+    scenarios = normalize_scenarios(scenarios)
+    return scenarios[scenarios[SCENARIO_NAME].notna()].reset_index(drop=True)
+
+
+def merge_scenarios(scenarios: pd.DataFrame, imported: pd.DataFrame) -> pd.DataFrame:
+    """가져온 시나리오를 기존 표에 합침 (이름이 같으면 가져온 쪽으로 교체)"""
+    scenarios, imported = normalize_scenarios(scenarios), normalize_scenarios(imported)
+    kept = scenarios[~scenarios[SCENARIO_NAME].isin(imported[SCENARIO_NAME])]
+    frames = [frame for frame in (kept, imported) if len(frame)]
+    return normalize_scenarios(pd.concat(frames, ignore_index=True) if frames else imported)
@@ -0,0 +1,177 @@
+"""민감도 분석 (두 매개변수 격자, 모든 매개변수 토네이도)"""
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import latest_financials
+from valuation.dcf import DCFInput, dcf_goodwill, goodwill_batch, shift_growth_rates, yearly_schedules
+from valuation.excess_earnings import ExcessEarningsInput, excess_earnings_goodwill
+from valuation.market import market_goodwill_batch
+from valuation.statutory import StatutoryGoodwillInput, statutory_goodwill_batch
+
+# 민감도 분석 대상 DCF 매개변수 → (표시명, 기본 최솟값, 기본 최댓값)
+DCF_SENSITIVITY_PARAMETERS = {
+    'discount_rate': ('할인율 (WACC, %)', 8.0, 20.0),
+    'terminal_growth_rate': ('영구 성장률 (%)', 0.0, 4.0),
+    'growth_rate': ('평균 매출 성장률 (%)', -5.0, 15.0),
+    'operating_margin': ('영업이익률 (%)', 5.0, 30.0),
+    'tax_rate': ('법인세율 (%)', 10.0, 30.0),
+}
+
+# 토네이도 분석 대상 (평가 결과 키 → {매개변수: 표시명})
+# 초과이익 지속 연수는 정수이므로 ±1년, 상증법 환산 기간(5년)은 법정 기간이므로 제외
+TORNADO_PARAMETERS = {
+    'excess_earnings': {
+        'normal_roi': '정상 ROI',
+        'excess_years': '초과이익 지속 연수 (±1년)',
+        'discount_rate': '할인율',
+        'adjustment_factor': '조정 계수',
+        'industry_premium': '산업 프리미엄',
+    },
+    'dcf': {
+        'growth_rate': '매출 성장률',
+        'operating_margin': '영업이익률',
+        'discount_rate': '할인율 (WACC)',
+        'terminal_growth_rate': '영구 성장률',
+        'tax_rate': '법인세율',
+    },
+    'market_comparison': {
+        'multiple': '배수',
+        'adjustment_factor': '조정 계수',
+    },
+    'statutory': {
+        'earnings_ratio': '순손익 반영 비율',
+        'normal_return_rate': '자기자본 정상이익률',
+        'discount_rate': '환산 이자율',
+    },
+}
+TORNADO_COLUMNS = ['평가 방법', '매개변수', '기준 영업권', '하향 영업권', '상향 영업권', '영향 범위']
+
+
+def dcf_sensitivity_grid(financial_data: pd.DataFrame, params: DCFInput,
+                         row_parameter, row_values, column_parameter, column_values) -> pd.DataFrame:
+    """두 매개변수의 N×M 조합에 대한 영업권 가치를 한 번의 브로드캐스팅 연산으로 계산
+
+    결과 DataFrame의 행은 row_values, 열은 column_values입니다.
+    """
+    if row_parameter == column_parameter:
+        raise ValueError("서로 다른 두 매개변수를 선택해야 합니다.")
+    row_values = np.asarray(row_values, dtype=float)
+    column_values = np.asarray(column_values, dtype=float)
+
+    grid = dcf_goodwill(
+        financial_data,
+        params,
+        **{row_parameter: row_values[:, np.newaxis], column_parameter: column_values[np.newaxis, :]}
+    )
+    grid = np.broadcast_to(grid, (len(row_values), len(column_values)))
+    return pd.DataFrame(grid, index=pd.Index(row_values, name=row_parameter),
+                        columns=pd.Index(column_values, name=column_parameter))
+
+
+def _flex_scales(names, flex):
+    """매개변수 K개를 하나씩 (1 - flex%), (1 + flex%)배로 바꾸는 2K개 시나리오의 매개변수별 배율"""
+    scales = {name: np.ones(2 * len(names)) for name in names}
+    for index, name in enumerate(names):
+        scales[name][2 * index:2 * index + 2] = [1 - flex / 100, 1 + flex / 100]
+    return scales
+
+
+def _flex_years(years, scale):
+    """정수 기간을 하향·상향 시나리오에서 1년씩 줄이거나 늘림 (최소 1년)"""
+    return np.maximum(years + np.sign(scale - 1), 1)
+
+
+def _excess_earnings_tornado(financial_data, result, scales):
+    params = ExcessEarningsInput(**result['parameters'])
+    overrides = {name: getattr(params, name) * scale for name, scale in scales.items()}
+    overrides['excess_years'] = _flex_years(params.excess_years, scales['excess_years'])
+    return excess_earnings_goodwill(financial_data, params, **overrides)
+
+
+def _dcf_tornado(financial_data, result, scales):
+    params = DCFInput(**result['parameters'])
+    values = asdict(params)
+    latest_data = latest_financials(financial_data)
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = float(latest_data['총자산'] - latest_data['총부채'])
+
+    # 성장률은 다른 분석과 같이 일정 전체를 평행 이동 (평균 성장률 크기의 ±flex%, 음수여도 하향은 낮추는 쪽),
+    # 영업이익률은 연도별 값 전체를 같은 비율로 바꿈
+    schedules = yearly_schedules(values, len(params.growth_rates))
+    mean_growth = float(np.mean(params.growth_rates))
+    growth_rates = shift_growth_rates(params.growth_rates, mean_growth + abs(mean_growth) * (scales['growth_rate'] - 1))
+    if 'operating_margin' in schedules:
+        schedules['operating_margin'] = schedules['operating_margin'] * scales['operating_margin'][:, np.newaxis]
+    return goodwill_batch(
+        float(latest_data['매출액']),
+        growth_rates,
+        params.operating_margin * scales['operating_margin'],
+        params.tax_rate * scales['tax_rate'],
+        params.discount_rate * scales['discount_rate'],
+        params.terminal_growth_rate * scales['terminal_growth_rate'],
+        net_asset_value=nav,
+        terminal_value_method=params.terminal_value_method,
+        exit_multiple=params.exit_multiple,
+        schedules=schedules,
+        mid_year=params.mid_year
+    )
+
+
+def _market_tornado(financial_data, result, scales):
+    params = result['parameters']
+    latest_data = latest_financials(financial_data)
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = float(latest_data['총자산'] - latest_data['총부채'])
+    return market_goodwill_batch(params['metric_value'], params['multiple'] * scales['multiple'],
+                                 params['adjustment_factor'] * scales['adjustment_factor'], nav)
+
+
+def _statutory_tornado(financial_data, result, scales):
+    params = StatutoryGoodwillInput(**result['parameters'])
+    details = result['details']
+    overrides = {name: getattr(params, name) * scale for name, scale in scales.items()}
+    return statutory_goodwill_batch(details['earnings'], details['equity'], **overrides)
+
+
+# 평가 결과 키 → 2K개 시나리오를 한 번에 계산하는 함수
+TORNADO_EVALUATORS = {
+    'excess_earnings': _excess_earnings_tornado,
+    'dcf': _dcf_tornado,
+    'market_comparison': _market_tornado,
+    'statutory': _statutory_tornado,
+}
+
+
+def tornado_analysis(financial_data: pd.DataFrame, valuation_results, flex=10.0) -> pd.DataFrame:
+    """평가된 모든 방법의 매개변수를 하나씩 ±flex% 바꿨을 때의 영업권 (영향 범위가 큰 순)
+
+    valuation_results는 평가 결과 키 → ValuationResult.as_dict() 사전이며, 방법마다 2K개 시나리오를 한 번의 배열 연산으로 계산합니다.
+    기준값이 0인 매개변수는 바뀌지 않으므로 영향 범위가 0이고, 영업권을 계산할 수 없는 시나리오는 NaN입니다.
+    """
+    frames = []
+    for key, result in valuation_results.items():
+        if key not in TORNADO_EVALUATORS:
+            continue
+        labels = TORNADO_PARAMETERS[key]
+        names = list(labels)
+        values = np.broadcast_to(
+            np.asarray(TORNADO_EVALUATORS[key](financial_data, result, _flex_scales(names, flex)), dtype=float),
+            (2 * len(names),)
+        ).reshape(len(names), 2)
+        frames.append(pd.DataFrame({
+            TORNADO_COLUMNS[0]: result['method'],
+            TORNADO_COLUMNS[1]: [labels[name] for name in names],
+            TORNADO_COLUMNS[2]: float(result['value']),
+            TORNADO_COLUMNS[3]: values[:, 0],
+            TORNADO_COLUMNS[4]: values[:, 1],
+            TORNADO_COLUMNS[5]: np.abs(values[:, 1] - values[:, 0]),
+        }))
+    if not frames:
+        return pd.DataFrame(columns=TORNADO_COLUMNS)
+    return (pd.concat(frames, ignore_index=True)
+            .sort_values(TORNADO_COLUMNS[5], ascending=False, na_position='last', kind='stable')
+            .reset_index(drop=True))
@@ -0,0 +1,284 @@
+"""세션 저장소
+
+기업 정보·재무 데이터·평가 결과·시나리오를 세션 ID별로 디스크(SQLite)에 저장하고,
+최근 사용한 세션만 메모리에 둡니다. 재무 데이터와 시나리오 표는 Arrow IPC, 나머지는 JSON으로 직렬화합니다.
+
+- 자동 저장: save()는 내용 해시가 바뀐 경우에만 디스크에 씁니다.
+- 유휴 세션 정리: TTL(기본 1시간, PRD 세션 타임아웃) 동안 사용하지 않은 세션은 메모리에서 내립니다.
+- 지연 복원: 내려간 세션이나 서버 재시작 후 돌아온 세션은 다음 restore() 때 디스크에서 다시 읽습니다.
+
+디스크 계층은 read/write/delete/purge를 가진 객체면 무엇이든 쓸 수 있습니다 (기본 SQLiteSessionBackend).
+세션 ID를 아는 사람은 누구나 해당 세션(재무 데이터 포함)을 읽을 수 있으므로 세션 ID는 비밀번호처럼 다뤄야 합니다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, MutableMapping, Optional
+
+import pandas as pd
+
+from valuation.cache import _json_default, stable_hash
+
+# 세션에 저장하는 st.session_state 키 (REQUIRED_SESSION_KEYS가 없으면 저장하지 않고, 나머지는 없으면 빈 값으로 저장)
+SESSION_KEYS = ('company_data', 'valuation_results', 'scenarios')
+REQUIRED_SESSION_KEYS = SESSION_KEYS[:2]
+FINANCIAL_DATA_KEY = 'financial_data'
+
+DEFAULT_SESSION_TTL = 3600  # 초 (PRD 세션 타임아웃 1시간)
+DEFAULT_RETENTION = 7 * 24 * 3600  # 초 (디스크에 남겨 두는 기간)
+# 기본 저장 위치: 앱 폴더의 data/ (공용 임시 폴더는 다른 사용자와 공유되고 재부팅 때 지워질 수 있음)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SESSION_DB_PATH = os.path.join(APP_DIR, 'data', 'goodwill_sessions.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    company TEXT NOT NULL,
+    financial_data BLOB,
+    results TEXT NOT NULL,
+    scenarios BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+"""
+
+
+def default_session_values() -> Dict:
+    """새 세션의 초기 상태"""
+    return {
+        'company_data': {
+            'name': '',
+            'industry': '',
+            'business_number': '',
+            FINANCIAL_DATA_KEY: pd.DataFrame()
+        },
+        'valuation_results': {},
+        'scenarios': pd.DataFrame()
+    }
+
+
+def dump_frame(frame: Optional[pd.DataFrame]) -> Optional[bytes]:
+    """DataFrame → Arrow IPC 스트림 바이트 (비어 있으면 None)"""
+    if frame is None or (frame.empty and len(frame.columns) == 0):
+        return None
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def load_frame(blob: Optional[bytes]) -> pd.DataFrame:
+    """Arrow IPC 스트림 바이트 → DataFrame"""
+    if blob is None:
+        return pd.DataFrame()
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(blob).read_all().to_pandas()
+
+
+def encode_session(values: Dict) -> Dict:
+    """세션 상태 → 저장 레코드 (company·results는 JSON 문자열, financial_data·scenarios는 Arrow IPC 바이트)"""
+    company = dict(values['company_data'])
+    frame = company.pop(FINANCIAL_DATA_KEY, None)
+    return {
+        'company': json.dumps(company, ensure_ascii=False, default=_json_default),
+        'financial_data': dump_frame(frame),
+        'results': json.dumps(values['valuation_results'], ensure_ascii=False, default=_json_default),
+        'scenarios': dump_frame(values.get('scenarios')),
+    }
+
+
+def decode_session(record: Dict) -> Dict:
+    """저장 레코드 → 세션 상태"""
+    company = json.loads(record['company'])
+    company[FINANCIAL_DATA_KEY] = load_frame(record['financial_data'])
+    return {'company_data': company, 'valuation_results': json.loads(record['results']),
+            'scenarios': load_frame(record.get('scenarios'))}
+
+
+def session_fingerprint(values: Dict) -> str:
+    """세션 상태의 내용 해시 (바뀌지 않았으면 저장 생략)"""
+    company = dict(values['company_data'])
+    frame = company.pop(FINANCIAL_DATA_KEY, None)
+    parts = [company, values['valuation_results']]
+    if isinstance(frame, pd.DataFrame):
+        parts.append(frame)
+    scenarios = values.get('scenarios')
+    if isinstance(scenarios, pd.DataFrame) and len(scenarios.columns):
+        parts.append(scenarios)
+    return stable_hash(*parts)
+
+
+class SQLiteSessionBackend:
+    """세션 레코드를 SQLite 파일 하나에 저장하는 디스크 계층"""
+
+    def __init__(self, connection: sqlite3.Connection, path=None):
+        self.connection = connection
+        self.path = path
+        self._lock = threading.Lock()
+
+    def read(self, session_id) -> Optional[Dict]:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT company, financial_data, results, scenarios FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'company': row[0], 'financial_data': row[1], 'results': row[2], 'scenarios': row[3]}
+
+    def write(self, session_id, record: Dict, updated_at: float):
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, updated_at, company, financial_data, results, scenarios) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (session_id, updated_at, record['company'], record['financial_data'], record['results'],
+                 record.get('scenarios'))
+            )
+
+    def delete(self, session_id):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def purge(self, before: float) -> int:
+        """before(에포크 초) 이전에 마지막으로 저장된 세션 삭제"""
+        with self._lock, self.connection:
+            return self.connection.execute("DELETE FROM sessions WHERE updated_at < ?", (before,)).rowcount
+
+
+@dataclass
+class _Resident:
+    """메모리에 올라와 있는 세션 (values는 st.session_state와 같은 객체를 가리킴)"""
+    values: Dict
+    fingerprint: str
+    touched: float
+
+
+class SessionStore:
+    """메모리 계층 + 디스크 계층 세션 저장소 (스레드 안전, 프로세스당 하나를 모든 세션이 공유)"""
+
+    def __init__(self, backend, ttl=DEFAULT_SESSION_TTL, retention=DEFAULT_RETENTION):
+        self.backend = backend
+        self.ttl = ttl
+        self.retention = retention
+        self._resident: Dict[str, _Resident] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def restore(self, session_id, state: MutableMapping) -> bool:
+        """state(st.session_state)에 세션 상태를 채움, 디스크에서 다시 읽었으면 True
+
+        이미 같은 객체가 들어 있으면 아무것도 하지 않고, 메모리에 남아 있으면 그대로 다시 연결합니다.
+        """
+        self.evict_idle()
+        now = time.monotonic()
+        with self._lock:
+            resident = self._resident.get(session_id)
+            if resident is not None:
+                resident.touched = now
+                if all(key in state and state[key] is resident.values[key] for key in SESSION_KEYS):
+                    return False
+                values, loaded = resident.values, False
+
+        if resident is None:
+            record = self.backend.read(session_id)
+            values = decode_session(record) if record is not None else default_session_values()
+            loaded = record is not None
+            with self._lock:
+                self._resident[session_id] = _Resident(values, session_fingerprint(values), now)
+                self.loads += loaded
+
+        for key in SESSION_KEYS:
+            state[key] = values[key]
+        return loaded
+
+    def save(self, session_id, state: MutableMapping) -> bool:
+        """내용이 바뀌었으면 디스크에 저장, 저장했으면 True"""
+        if any(key not in state for key in REQUIRED_SESSION_KEYS):
+            return False
+        values = {key: state[key] for key in SESSION_KEYS if key in state}
+        if len(values) < len(SESSION_KEYS):
+            for key, value in default_session_values().items():
+                values.setdefault(key, value)
+        fingerprint = session_fingerprint(values)
+        now = time.monotonic()
+        with self._lock:
+            resident = self._resident.get(session_id)
+            unchanged = resident is not None and resident.fingerprint == fingerprint
+            self._resident[session_id] = _Resident(values, fingerprint, now)
+        if unchanged:
+            return False
+
+        self.backend.write(session_id, encode_session(values), time.time())
+        with self._lock:
+            self.writes += 1
+        return True
+
+    def evict_idle(self, now=None) -> int:
+        """TTL 동안 사용하지 않은 세션을 메모리에서 내림 (디스크 레코드는 유지)
+
+        저장소의 참조만 끊고 세션 상태 객체는 건드리지 않습니다. 아직 연결된 탭이 실행 중일 수 있으므로,
+        메모리는 그 탭이 사라질 때 해제되고 돌아온 세션은 다음 restore() 때 디스크에서 다시 읽습니다.
+        """
+        if self.ttl is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [session_id for session_id, resident in self._resident.items() if now - resident.touched >= self.ttl]
+            for session_id in idle:
+                del self._resident[session_id]
+            self.evictions += len(idle)
+        return len(idle)
+
+    def delete(self, session_id):
+        """세션을 메모리와 디스크에서 삭제"""
+        with self._lock:
+            self._resident.pop(session_id, None)
+        self.backend.delete(session_id)
+
+    def purge_expired(self) -> int:
+        """보관 기간이 지난 세션을 디스크에서 삭제"""
+        if self.retention is None:
+            return 0
+        return self.backend.purge(time.time() - self.retention)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'resident': len(self._resident),
+                'loads': self.loads,
+                'writes': self.writes,
+                'evictions': self.evictions,
+            }
+
+
+def open_session_store(path=None, ttl=DEFAULT_SESSION_TTL, retention=DEFAULT_RETENTION) -> SessionStore:
+    """SQLite 세션 저장소 열기 (경로가 없으면 앱 폴더의 data/goodwill_sessions.sqlite, ':memory:'는 메모리 DB)
+
+    파일 DB는 폴더가 없으면 만들고, 다른 사용자가 읽지 못하도록 소유자만 읽고 쓸 수 있게 권한을 좁힙니다.
+    """
+    path = path or DEFAULT_SESSION_DB_PATH
+    if path != ':memory:':
+        os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.executescript(SCHEMA)
+    if path != ':memory:':
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass  # 다른 사용자 소유 파일이나 권한을 지원하지 않는 파일 시스템
+    # 시나리오 컬럼이 생기기 전에 만든 파일은 컬럼을 추가
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(sessions)")}
+    if 'scenarios' not in columns:
+        with connection:
+            connection.execute("ALTER TABLE sessions ADD COLUMN scenarios BLOB")
+    store = SessionStore(SQLiteSessionBackend(connection, path), ttl=ttl, retention=retention)
+    store.purge_expired()
+    return store
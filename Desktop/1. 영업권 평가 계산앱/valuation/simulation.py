@@ -0,0 +1,313 @@
+"""몬테카를로 DCF 시뮬레이션
+
+성장률·영업이익률·할인율·영구 성장률을 분포에서 추출해 영업권 가치의 분포를 구합니다.
+경로는 청크 단위로 계산하고 결과는 첫 청크로 정한 고정 구간 히스토그램에 누적하므로,
+경로 수와 관계없이 메모리 사용량은 청크 크기에 비례합니다. 구간 밖으로 나간 꼬리 값(보통 극소수)은
+끝 구간에 몰아넣지 않고 따로 모아 백분위를 계산할 때 정확한 값으로 반영합니다.
+"""
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import latest_financials, net_asset_value
+from valuation.dcf import DCFInput, goodwill_batch, shift_growth_rates, yearly_schedules
+
+# 시뮬레이션 대상 매개변수 → 표시명
+SIMULATION_PARAMETERS = {
+    'growth_rate': '평균 매출 성장률 (%)',
+    'operating_margin': '영업이익률 (%)',
+    'discount_rate': '할인율 (WACC, %)',
+    'terminal_growth_rate': '영구 성장률 (%)',
+}
+
+DISTRIBUTION_KINDS = ['normal', 'uniform', 'triangular', 'fixed']
+
+DEFAULT_CHUNK_SIZE = 100_000
+HISTOGRAM_BINS = 2000
+# 히스토그램 구간을 정할 첫 청크의 분위수 (극단값 하나가 구간을 넓혀 해상도를 떨어뜨리지 않도록 최솟값·최댓값 대신 사용)
+HISTOGRAM_RANGE_QUANTILES = (0.01, 0.99)
+
+
+@dataclass
+class Distribution:
+    """매개변수 분포 (kind에 따라 사용하는 필드가 다름, 단위는 %)
+
+    - normal: mean, std
+    - uniform: low, high
+    - triangular: low, mode, high
+    - fixed: mean
+    """
+    kind: str = 'fixed'
+    mean: float = 0.0
+    std: float = 0.0
+    low: float = 0.0
+    high: float = 0.0
+    mode: float = 0.0
+
+    @classmethod
+    def normal(cls, mean, std):
+        return cls(kind='normal', mean=mean, std=std)
+
+    @classmethod
+    def uniform(cls, low, high):
+        return cls(kind='uniform', low=low, high=high)
+
+    @classmethod
+    def triangular(cls, low, mode, high):
+        return cls(kind='triangular', low=low, mode=mode, high=high)
+
+    @classmethod
+    def fixed(cls, value):
+        return cls(kind='fixed', mean=value)
+
+    def from_uniform(self, u):
+        """[0, 1) 균등 난수를 역누적분포함수로 변환"""
+        if self.kind == 'normal':
+            from scipy.special import ndtri
+            return self.mean + self.std * ndtri(np.clip(u, 1e-12, 1 - 1e-12))
+        if self.kind == 'uniform':
+            return self.low + (self.high - self.low) * u
+        if self.kind == 'triangular':
+            width = self.high - self.low
+            if width <= 0:
+                return np.full_like(u, self.mode)
+            split = (self.mode - self.low) / width
+            left = self.low + np.sqrt(u * width * (self.mode - self.low))
+            right = self.high - np.sqrt((1 - u) * width * (self.high - self.mode))
+            return np.where(u < split, left, right)
+        if self.kind == 'fixed':
+            return np.full_like(u, self.mean)
+        raise ValueError(f"지원하지 않는 분포입니다: {self.kind}")
+
+
+@dataclass
+class MonteCarloResult:
+    """시뮬레이션 요약 (percentiles의 키는 백분위 수)"""
+    n_paths: int
+    n_valid: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: Dict[int, float]
+    histogram_counts: List[int] = field(default_factory=list)
+    histogram_edges: List[float] = field(default_factory=list)
+    elapsed: float = 0.0
+    underflow: int = 0  # 히스토그램 구간보다 작은 경로 수 (백분위에는 반영, 히스토그램에는 없음)
+    overflow: int = 0   # 히스토그램 구간보다 큰 경로 수
+
+
+def _draw_uniforms(n, dimension, chunk_index, chunk_size, seed, sobol):
+    """청크별 균등 난수 (n × dimension), 청크 번호로 재현 가능"""
+    if sobol:
+        from scipy.stats import qmc
+        engine = qmc.Sobol(d=dimension, scramble=True, seed=seed)
+        if chunk_index:
+            engine.fast_forward(chunk_index * chunk_size)
+        with warnings.catch_warnings():
+            # 2의 거듭제곱이 아닌 표본 수에 대한 균형성 경고는 무시
+            warnings.simplefilter('ignore')
+            return engine.random(n)
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(chunk_index + 1)[chunk_index])
+    return rng.random((n, dimension))
+
+
+def _correlate(u, cholesky):
+    """가우시안 코퓰라로 균등 난수에 상관관계 부여"""
+    from scipy.special import ndtr, ndtri
+    z = ndtri(np.clip(u, 1e-12, 1 - 1e-12))
+    return ndtr(z @ cholesky.T)
+
+
+def _simulate_chunk(task):
+    """한 청크의 영업권 가치 계산 (프로세스 풀에서도 실행되도록 최상위 함수로 정의)"""
+    u = _draw_uniforms(task['n'], len(task['names']), task['chunk_index'], task['chunk_size'],
+                       task['seed'], task['sobol'])
+    if task['cholesky'] is not None:
+        u = _correlate(u, task['cholesky'])
+
+    overrides = {
+        name: Distribution(**spec).from_uniform(u[:, column])
+        for column, (name, spec) in enumerate(zip(task['names'], task['distributions']))
+    }
+    base = task['base']
+    growth = overrides.pop('growth_rate', None)
+    growth_rates = np.asarray(base['growth_rates'], dtype=float)
+    if growth is not None:
+        growth_rates = shift_growth_rates(growth_rates, growth)
+
+    values = dict(base, **overrides)
+    return goodwill_batch(
+        task['base_revenue'],
+        growth_rates,
+        values['operating_margin'],
+        values['tax_rate'],
+        values['discount_rate'],
+        values['terminal_growth_rate'],
+        net_asset_value=task['net_asset_value'],
+        terminal_value_method=values['terminal_value_method'],
+        exit_multiple=values['exit_multiple'],
+        # 분포에서 뽑은 단일 값(예: 영업이익률)은 같은 항목의 연도별 일정보다 우선
+        schedules=yearly_schedules(base, len(base['growth_rates']), exclude=tuple(overrides)),
+        mid_year=base['mid_year']
+    )
+
+
+def _chunk_summary(task):
+    """청크를 계산해 히스토그램·통계량과 구간 밖 꼬리 값만 반환 (나머지 경로 값은 프로세스 밖으로 보내지 않음)"""
+    values = _simulate_chunk(task)
+    values = values[np.isfinite(values)]
+    edges = task['edges']
+    inside = (values >= edges[0]) & (values <= edges[-1])
+    counts, _ = np.histogram(values[inside], bins=edges)
+    tails = values[~inside]
+    if values.size == 0:
+        return counts, tails, 0, 0.0, 0.0, np.inf, -np.inf
+    return counts, tails, values.size, values.sum(), np.square(values).sum(), values.min(), values.max()
+
+
+def _histogram_percentile(counts, edges, q, underflow=(), overflow=()):
+    """누적 히스토그램에서 백분위 값을 선형 보간 (구간 밖 꼬리 값은 정렬해 그 순위의 값을 그대로 사용)"""
+    underflow, overflow = np.sort(np.asarray(underflow, dtype=float)), np.sort(np.asarray(overflow, dtype=float))
+    cumulative = np.cumsum(counts)
+    total = cumulative[-1] + underflow.size + overflow.size
+    target = q / 100 * total
+    if target <= underflow.size and underflow.size:
+        return underflow[max(int(np.ceil(target)) - 1, 0)]
+    if target > total - overflow.size:
+        return overflow[min(int(np.ceil(target - (total - overflow.size))) - 1, overflow.size - 1)]
+
+    target -= underflow.size
+    index = int(np.searchsorted(cumulative, target))
+    index = min(index, len(counts) - 1)
+    previous = cumulative[index - 1] if index > 0 else 0
+    fraction = (target - previous) / counts[index] if counts[index] else 0.0
+    return edges[index] + fraction * (edges[index + 1] - edges[index])
+
+
+def simulate_dcf(financial_data: pd.DataFrame, params: DCFInput, distributions: Dict[str, Distribution],
+                 n_paths=100_000, correlation=None, sobol=False, seed=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, workers=None, percentiles=(5, 50, 95)) -> MonteCarloResult:
+    """DCF 매개변수를 분포에서 추출해 영업권 가치 분포를 계산
+
+    distributions에 없는 매개변수는 params 값을 그대로 사용합니다.
+    correlation은 SIMULATION_PARAMETERS 중 지정한 매개변수 순서에 맞춘 상관계수 행렬이며, sobol=True이면 준난수(Sobol)를 사용합니다.
+    workers가 2 이상이고 청크가 여러 개면 첫 청크 이후를 프로세스 풀에서 병렬로 계산합니다.
+    """
+    started = time.perf_counter()
+    names = [name for name in SIMULATION_PARAMETERS if name in distributions]
+    if not names:
+        raise ValueError("시뮬레이션할 매개변수를 하나 이상 지정해야 합니다.")
+
+    cholesky = None
+    if correlation is not None:
+        correlation = np.asarray(correlation, dtype=float)
+        if correlation.shape != (len(names), len(names)):
+            raise ValueError("상관계수 행렬의 크기가 매개변수 수와 맞지 않습니다.")
+        try:
+            cholesky = np.linalg.cholesky(correlation)
+        except np.linalg.LinAlgError:
+            raise ValueError("상관계수 행렬이 양의 정부호가 아닙니다.")
+
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % (2 ** 32))
+
+    latest_data = latest_financials(financial_data)
+    nav = None
+    if '총자산' in latest_data and '총부채' in latest_data:
+        nav = float(net_asset_value(latest_data, 0))
+
+    chunk_size = max(1, min(chunk_size, n_paths))
+    chunk_sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        chunk_sizes.append(n_paths % chunk_size)
+
+    tasks = [{
+        'n': n,
+        'chunk_index': chunk_index,
+        'chunk_size': chunk_size,
+        'seed': seed,
+        'sobol': sobol,
+        'cholesky': cholesky,
+        'names': names,
+        'distributions': [asdict(distributions[name]) for name in names],
+        'base': asdict(params),
+        'base_revenue': float(latest_data['매출액']),
+        'net_asset_value': nav,
+    } for chunk_index, n in enumerate(chunk_sizes)]
+
+    # 첫 청크의 분위수로 히스토그램 구간을 정한 뒤 나머지 청크는 같은 구간에 누적 (구간 밖 값은 따로 모음)
+    first = _simulate_chunk(tasks[0])
+    first = first[np.isfinite(first)]
+    if first.size == 0:
+        raise ValueError("유효한 시뮬레이션 결과가 없습니다. 할인율이 영구 성장률보다 크도록 분포를 조정해주세요.")
+    low, high = np.quantile(first, HISTOGRAM_RANGE_QUANTILES)
+    span = (high - low) or abs(high) or 1.0
+    edges = np.linspace(low - span * 0.1, high + span * 0.1, HISTOGRAM_BINS + 1)
+
+    inside = (first >= edges[0]) & (first <= edges[-1])
+    counts, _ = np.histogram(first[inside], bins=edges)
+    tails = [first[~inside]]
+    n_valid, total, total_sq = first.size, first.sum(), np.square(first).sum()
+    minimum, maximum = first.min(), first.max()
+
+    for task in tasks[1:]:
+        task['edges'] = edges
+
+    workers = workers or os.cpu_count() or 1
+    remaining = tasks[1:]
+    if workers > 1 and len(remaining) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(remaining))) as executor:
+            summaries = list(executor.map(_chunk_summary, remaining))
+    else:
+        summaries = map(_chunk_summary, remaining)
+
+    for chunk_counts, chunk_tails, chunk_valid, chunk_sum, chunk_sq, chunk_min, chunk_max in summaries:
+        counts += chunk_counts
+        tails.append(chunk_tails)
+        n_valid += chunk_valid
+        total += chunk_sum
+        total_sq += chunk_sq
+        minimum = min(minimum, chunk_min)
+        maximum = max(maximum, chunk_max)
+
+    tails = np.concatenate(tails)
+    underflow, overflow = tails[tails < edges[0]], tails[tails > edges[-1]]
+    mean = total / n_valid
+    variance = max(total_sq / n_valid - mean ** 2, 0.0)
+
+    return MonteCarloResult(
+        n_paths=n_paths,
+        n_valid=int(n_valid),
+        mean=float(mean),
+        std=float(np.sqrt(variance)),
+        min=float(minimum),
+        max=float(maximum),
+        percentiles={q: float(_histogram_percentile(counts, edges, q, underflow, overflow)) for q in percentiles},
+        histogram_counts=counts.tolist(),
+        histogram_edges=edges.tolist(),
+        elapsed=time.perf_counter() - started,
+        underflow=int(underflow.size),
+        overflow=int(overflow.size)
+    )
+
+
+def display_histogram(result: MonteCarloResult, bins=100):
+    """값이 있는 구간만 잘라 bins개 이하의 막대로 다시 묶은 (구간 중앙값, 개수)"""
+    counts = np.asarray(result.histogram_counts)
+    edges = np.asarray(result.histogram_edges)
+    nonzero = np.flatnonzero(counts)
+    counts = counts[nonzero[0]:nonzero[-1] + 1]
+    edges = edges[nonzero[0]:nonzero[-1] + 2]
+
+    group = max(1, int(np.ceil(len(counts) / bins)))
+    grouped = np.pad(counts, (0, (-len(counts)) % group)).reshape(-1, group).sum(axis=1)
+    width = (edges[1] - edges[0]) * group
+    centers = edges[0] + width * (np.arange(len(grouped)) + 0.5)
+    return centers, grouped
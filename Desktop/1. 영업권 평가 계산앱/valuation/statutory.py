@@ -0,0 +1,122 @@
+"""상속세및증여세법 보충적 평가방법에 의한 영업권 (시행령 제59조 제2항)
+
+    영업권 = Σ(t=1..5) [최근 3년 순손익 가중평균 × 50% - 자기자본 × 10%] / (1 + 10%)^t
+
+순손익 가중평균은 최근 연도부터 3:2:1 가중치를 적용하며, 3년이 안 되는 기업은 있는 연도만 같은 순서의 가중치로 평균합니다.
+초과이익이 0 이하이면 영업권은 0원입니다. 비율은 모두 % 단위이며 기본값은 법령(기획재정부령 이자율 10%)을 따릅니다.
+"""
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from valuation.base import RECENT_WEIGHTS, ValuationError, ValuationResult, latest_financials, recency_weighted_earnings
+from valuation.excess_earnings import annuity_factor
+from valuation.ingest import COMPANY_COLUMN
+
+METHOD_NAME = '상증법 보충적 평가'
+
+# 포트폴리오 결과 컬럼
+STATUTORY_COLUMNS = ['순손익 가중평균', '자기자본', '초과이익', METHOD_NAME]
+
+
+@dataclass
+class StatutoryGoodwillInput:
+    """상증법 보충적 평가 매개변수 (비율은 % 단위)"""
+    earnings_ratio: float = 50.0
+    normal_return_rate: float = 10.0
+    discount_rate: float = 10.0
+    years: int = 5
+
+
+def statutory_goodwill_batch(earnings, equity, earnings_ratio=50.0, normal_return_rate=10.0,
+                             discount_rate=10.0, years=5):
+    """여러 기업(또는 매개변수 조합)의 영업권을 한 번에 계산
+
+    earnings는 (..., 연도 수) 최근 연도부터의 순손익, equity는 자기자본이며 나머지 인자와 브로드캐스팅됩니다.
+    순손익이나 자기자본이 없는 행은 NaN입니다.
+    """
+    excess_profit = (recency_weighted_earnings(earnings) * np.asarray(earnings_ratio, dtype=float) / 100
+                     - np.asarray(equity, dtype=float) * np.asarray(normal_return_rate, dtype=float) / 100)
+    value = np.maximum(excess_profit, 0.0) * annuity_factor(discount_rate, years)
+    return np.where(np.isnan(excess_profit), np.nan, value)
+
+
+def statutory_inputs(data: pd.DataFrame, keys):
+    """행별 기업 구분값 keys로 묶어 (기업 목록, 최근 3년 순손익 행렬, 최근 연도 자기자본)을 반환
+
+    기업 목록은 처음 나온 순서이며, 순손익 행렬은 최근 연도부터 채우고 없는 연도는 NaN입니다.
+    """
+    codes, names = pd.factorize(np.asarray(keys))
+    valid = codes >= 0
+    codes = codes[valid]
+    years = data['연도'].to_numpy(dtype=float)[valid]
+    net_income = data['당기순이익'].to_numpy(dtype=float)[valid]
+    equity_column = data['자본'].to_numpy(dtype=float)[valid]
+
+    # 기업 순, 같은 기업 안에서는 최근 연도부터 정렬해 기업 안 순위를 구함
+    order = np.lexsort((-years, codes))
+    codes, net_income, equity_column = codes[order], net_income[order], equity_column[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    rank = np.arange(len(codes)) - np.repeat(starts, np.diff(np.r_[starts, len(codes)]))
+
+    earnings = np.full((len(names), len(RECENT_WEIGHTS)), np.nan)
+    recent = rank < len(RECENT_WEIGHTS)
+    earnings[codes[recent], rank[recent]] = net_income[recent]
+    equity = np.full(len(names), np.nan)
+    equity[codes[starts]] = equity_column[starts]
+    return names, earnings, equity
+
+
+def statutory_goodwill_frame(data: pd.DataFrame, params: StatutoryGoodwillInput, company_column=COMPANY_COLUMN):
+    """기업·연도별 긴 형식 데이터 전체의 영업권을 한 번에 계산 (기업당 한 행, 입력에 처음 나온 순서)"""
+    names, earnings, equity = statutory_inputs(data, data[company_column])
+    weighted = recency_weighted_earnings(earnings)
+    excess_profit = weighted * params.earnings_ratio / 100 - equity * params.normal_return_rate / 100
+    return pd.DataFrame({
+        company_column: names,
+        STATUTORY_COLUMNS[0]: weighted,
+        STATUTORY_COLUMNS[1]: equity,
+        STATUTORY_COLUMNS[2]: excess_profit,
+        STATUTORY_COLUMNS[3]: statutory_goodwill_batch(earnings, equity, **asdict(params)),
+    })
+
+
+def value_statutory_goodwill(financial_data: pd.DataFrame, params: StatutoryGoodwillInput) -> ValuationResult:
+    """최근 3년 순손익 가중평균의 일정 비율에서 자기자본 정상이익을 뺀 초과이익을 법정 기간·이자율로 환산"""
+    latest = latest_financials(financial_data)
+    if pd.isna(latest.get('자본')):
+        raise ValuationError("자기자본(자본) 자료가 없습니다.")
+
+    recent = financial_data.sort_values('연도', ascending=False).head(len(RECENT_WEIGHTS))
+    earnings = recent['당기순이익'].to_numpy(dtype=float)
+    weights = list(RECENT_WEIGHTS[:len(earnings)])
+    weighted_earnings = float(recency_weighted_earnings(earnings))
+    if np.isnan(weighted_earnings):
+        raise ValuationError("최근 3년 당기순이익 자료가 없습니다.")
+    equity = float(latest['자본'])
+
+    earnings_portion = weighted_earnings * params.earnings_ratio / 100
+    normal_return = equity * params.normal_return_rate / 100
+    excess_profit = earnings_portion - normal_return
+    factor = float(annuity_factor(params.discount_rate, params.years))
+    periods = np.arange(1, params.years + 1)
+    yearly_present_values = max(excess_profit, 0.0) * (1 + params.discount_rate / 100) ** -periods
+
+    return ValuationResult(
+        method=METHOD_NAME,
+        value=float(statutory_goodwill_batch(earnings, equity, **asdict(params))),
+        parameters=asdict(params),
+        details={
+            'years': [int(year) for year in recent['연도']],
+            'earnings': earnings.tolist(),
+            'weights': weights,
+            'weighted_earnings': weighted_earnings,
+            'equity': equity,
+            'earnings_portion': earnings_portion,
+            'normal_return': normal_return,
+            'excess_profit': excess_profit,
+            'annuity_factor': factor,
+            'yearly_present_values': yearly_present_values.tolist()
+        }
+    )
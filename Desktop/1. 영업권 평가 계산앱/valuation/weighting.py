@@ -0,0 +1,98 @@
+"""평가 방법별 영업권 가치의 가중평균
+
+가중치의 마지막 축이 평가 방법이며, 앞쪽 축으로 여러 가중치 조합을 한 번에 계산할 수 있습니다.
+가중치 단체(simplex, 합이 1인 모든 가중치) 전체를 격자나 디리클레 표본으로 덮어
+가중평균의 범위·분포와 목표 가치에 맞는 가중치 영역을 한 번의 행렬 곱으로 구할 수도 있습니다.
+"""
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from valuation.base import ValuationError
+
+SIMPLEX_MODES = {'grid': '격자', 'dirichlet': '디리클레 표본'}
+MAX_SIMPLEX_POINTS = 1_000_000
+EXPLORATION_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def normalize_weights(weights):
+    """가중치 합이 1이 되도록 정규화 (합이 0이면 그대로 반환)"""
+    weights = np.asarray(weights, dtype=float)
+    total = weights.sum(axis=-1, keepdims=True)
+    return np.divide(weights, total, out=weights.copy(), where=total > 0)
+
+
+def weighted_goodwill(values, weights):
+    """방법별 가치 values(방법 수)와 가중치 weights(..., 방법 수)의 가중평균 (가중치는 정규화 후 적용)"""
+    return normalize_weights(weights) @ np.asarray(values, dtype=float)
+
+
+def simplex_grid(n_methods, step=0.01):
+    """간격 step의 가중치 격자 (각 가중치가 step의 배수이고 합이 1인 모든 조합, (점 수, 방법 수))"""
+    divisions = int(round(1 / step))
+    if divisions < 1 or not math.isclose(divisions * step, 1.0, abs_tol=1e-9):
+        raise ValuationError("격자 간격은 1을 나누어떨어지게 하는 값이어야 합니다 (예: 0.1, 0.05, 0.01).")
+    points = math.comb(divisions + n_methods - 1, n_methods - 1)
+    if points > MAX_SIMPLEX_POINTS:
+        raise ValuationError(f"격자 점이 {points:,}개로 너무 많습니다. 간격을 늘리거나 디리클레 표본을 사용하세요.")
+
+    # 칸막이 위치(조합)의 간격이 각 방법에 배분된 칸 수
+    bars = np.array(list(itertools.combinations(range(divisions + n_methods - 1), n_methods - 1)), dtype=int)
+    bars = bars.reshape(points, n_methods - 1)
+    edges = np.column_stack([np.full(points, -1), bars, np.full(points, divisions + n_methods - 1)])
+    return (np.diff(edges, axis=1) - 1) / divisions
+
+
+def dirichlet_weights(n_methods, samples=100_000, alpha=1.0, seed=None):
+    """디리클레 분포에서 추출한 가중치 (alpha=1이면 단체 위 균등 분포, (표본 수, 방법 수))"""
+    if samples > MAX_SIMPLEX_POINTS:
+        raise ValuationError(f"표본 수는 {MAX_SIMPLEX_POINTS:,}개 이하여야 합니다.")
+    return np.random.default_rng(seed).dirichlet(np.full(n_methods, float(alpha)), size=samples)
+
+
+@dataclass
+class WeightExploration:
+    """가중치 단체 탐색 결과 (weights와 values의 행이 서로 대응, hits는 목표 범위 안의 행)"""
+    weights: np.ndarray
+    values: np.ndarray
+    percentiles: Dict[int, float]
+    target: Optional[float] = None
+    tolerance: float = 0.0
+    hits: Optional[np.ndarray] = None
+
+    @property
+    def min(self):
+        return float(self.values.min())
+
+    @property
+    def max(self):
+        return float(self.values.max())
+
+    @property
+    def hit_share(self):
+        """목표 범위에 드는 가중치 조합 비율"""
+        return float(self.hits.mean()) if self.hits is not None else 0.0
+
+    def hit_weight_ranges(self):
+        """방법별로 목표 범위에 드는 가중치의 (최소, 최대), 해당 조합이 없으면 None"""
+        if self.hits is None or not self.hits.any():
+            return None
+        hit_weights = self.weights[self.hits]
+        return list(zip(hit_weights.min(axis=0).tolist(), hit_weights.max(axis=0).tolist()))
+
+
+def explore_weights(values, weights, target=None, tolerance=0.05):
+    """가중치 조합 weights(점 수, 방법 수) 전체의 가중평균을 한 번에 계산
+
+    target이 있으면 가중평균이 target × (1 ± tolerance) 안에 드는 조합을 hits로 표시합니다.
+    """
+    weights = np.asarray(weights, dtype=float)
+    blended = weighted_goodwill(values, weights)
+    percentiles = dict(zip(EXPLORATION_PERCENTILES, np.percentile(blended, EXPLORATION_PERCENTILES).tolist()))
+    hits = None
+    if target is not None:
+        hits = np.abs(blended - target) <= abs(target) * tolerance
+    return WeightExploration(weights, blended, percentiles, target, tolerance, hits)
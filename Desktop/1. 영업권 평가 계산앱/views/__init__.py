@@ -0,0 +1,4 @@
+"""화면(페이지) 모듈
+
+페이지마다 모듈 하나를 두고, 각 모듈은 그 페이지를 처음 열 때 가져옵니다 (views.navigation 참고).
+"""
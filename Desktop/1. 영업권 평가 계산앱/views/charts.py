@@ -0,0 +1,121 @@
+"""차트 도우미: plotly.graph_objects로 그림을 만들고 데이터 내용 해시별로 보관
+
+plotly.express는 호출할 때마다 수십 ms가 걸리므로 graph_objects로 직접 만들고,
+같은 데이터의 그림은 다시 만들지 않도록 프로세스 전역 캐시(모든 세션 공유)에 둡니다.
+st.plotly_chart는 JSON·사전을 받으면 다시 검증하므로, 캐시에는 직렬화 비용이 작은 Figure 객체를 보관합니다.
+캐시에서 받은 그림은 여러 세션이 함께 쓰므로 수정하지 말고 그대로 표시해야 합니다.
+"""
+import functools
+
+import plotly.graph_objects as go
+
+from valuation import ResultCache, stable_hash
+
+# 업종 내 배수 비교 막대 색상 (plotly Pastel 팔레트)
+PASTEL = ['rgb(102, 197, 204)', 'rgb(246, 207, 113)', 'rgb(248, 156, 116)', 'rgb(220, 176, 242)',
+          'rgb(135, 197, 95)', 'rgb(158, 185, 243)', 'rgb(254, 136, 177)', 'rgb(201, 219, 116)',
+          'rgb(139, 224, 164)', 'rgb(180, 151, 231)', 'rgb(179, 179, 179)']
+
+# 그림 캐시 (데이터 내용 해시 → Figure)
+FIGURE_CACHE = ResultCache(max_entries=256)
+
+
+def cached_figure(build):
+    """인자 내용이 같으면 build를 다시 호출하지 않고 캐시된 그림을 반환"""
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        # numpy 배열·pandas Series는 목록으로 바꿔 해시
+        args = [arg.tolist() if hasattr(arg, 'tolist') else arg for arg in args]
+        kwargs = {name: value.tolist() if hasattr(value, 'tolist') else value for name, value in kwargs.items()}
+        key = stable_hash('figure', build.__name__, args, kwargs)
+        return FIGURE_CACHE.get_or_compute(key, lambda: build(*args, **kwargs))
+
+    return wrapper
+
+
+@cached_figure
+def bar_figure(x, y, title, x_title, y_title):
+    """막대 차트"""
+    return go.Figure(go.Bar(x=x, y=y), layout=dict(title=title, xaxis_title=x_title, yaxis_title=y_title))
+
+
+@cached_figure
+def line_figure(x, series, title, x_title, y_title, legend_title):
+    """꺾은선 차트 (계열 이름 → 값 목록)"""
+    figure = go.Figure([go.Scatter(x=x, y=values, mode='lines', name=name) for name, values in series.items()])
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, legend_title_text=legend_title)
+    return figure
+
+
+@cached_figure
+def pie_figure(names, values, title):
+    """파이 차트"""
+    return go.Figure(go.Pie(labels=names, values=values), layout=dict(title=title))
+
+
+@cached_figure
+def labeled_bar_figure(x, y, title, x_title, y_title):
+    """막대마다 색과 값(소수 둘째 자리)을 표시하는 막대 차트"""
+    figure = go.Figure(go.Bar(
+        x=x, y=y, text=y, texttemplate='%{text:.2f}', textposition='outside',
+        marker_color=[PASTEL[index % len(PASTEL)] for index in range(len(x))],
+    ))
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title,
+                         uniformtext_minsize=8, uniformtext_mode='hide')
+    return figure
+
+
+@cached_figure
+def histogram_figure(centers, counts, title, x_title, y_title, markers):
+    """구간별 개수 막대와 세로 기준선 (기준선 이름 → x 값)"""
+    figure = go.Figure(go.Bar(x=centers, y=counts, marker_color='#636EFA'))
+    for (name, x), color in zip(markers.items(), ['red', 'black', 'green']):
+        figure.add_vline(x=x, line_dash='dash', line_color=color, annotation_text=name)
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0)
+    return figure
+
+
+@cached_figure
+def heatmap_figure(z, x, y, title, x_title, y_title, value_title):
+    """두 매개변수 격자의 값 히트맵 (z는 y 행 × x 열, 빈 칸은 NaN)"""
+    figure = go.Figure(go.Heatmap(
+        z=z, x=x, y=y, colorscale='RdYlGn', colorbar={'title': value_title},
+        hovertemplate=f"{x_title}: %{{x:.2f}}<br>{y_title}: %{{y:.2f}}<br>{value_title}: %{{z:,.0f}}원<extra></extra>"
+    ))
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return figure
+
+
+@cached_figure
+def ternary_figure(weights, hits, labels, title):
+    """방법 3개의 가중치 조합을 삼각도에 표시 (목표 범위에 드는 조합은 다른 색)"""
+    weights = list(zip(*weights)) if weights else [[], [], []]
+    figure = go.Figure(go.Scatterternary(
+        a=weights[0], b=weights[1], c=weights[2], mode='markers',
+        marker=dict(size=4, color=['#E45756' if hit else '#C7CED9' for hit in hits]),
+    ))
+    figure.update_layout(title=title, ternary=dict(
+        aaxis_title=labels[0], baxis_title=labels[1], caxis_title=labels[2]
+    ))
+    return figure
+
+
+@cached_figure
+def tornado_figure(labels, low_changes, high_changes, title, x_title, flex):
+    """매개변수 하향·상향 시 영업권 변화량 가로 막대 (labels 순서대로 위에서부터)"""
+    figure = go.Figure([
+        go.Bar(y=labels, x=low_changes, orientation='h', name=f'-{flex:g}%', marker_color='#E45756'),
+        go.Bar(y=labels, x=high_changes, orientation='h', name=f'+{flex:g}%', marker_color='#4C78A8'),
+    ])
+    figure.update_layout(title=title, xaxis_title=x_title, barmode='overlay', legend_title_text='매개변수 변화',
+                         yaxis=dict(autorange='reversed'), height=max(300, 28 * len(labels) + 120))
+    return figure
+
+
+@cached_figure
+def grouped_bar_figure(x, series, title, x_title, y_title, legend_title):
+    """묶은 막대 차트 (계열 이름 → 값 목록)"""
+    figure = go.Figure([go.Bar(x=x, y=values, name=name) for name, values in series.items()])
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, legend_title_text=legend_title,
+                         barmode='group')
+    return figure
@@ -0,0 +1,44 @@
+"""공통 도우미: 숫자 형식 변환, 정적 파일 경로, 프로세스 단위로 공유하는 벤치마크 자원"""
+import streamlit as st
+import os
+
+from valuation import PeerIndex, open_benchmark_store
+
+# 앱에 포함된 이미지 등 정적 파일 위치 (외부 네트워크 요청 없이 표시)
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+def asset_path(name):
+    """assets 폴더의 파일 경로"""
+    return os.path.join(ASSETS_DIR, name)
+
+def format_number(value):
+    """숫자를 콤마가 포함된 문자열로 변환"""
+    try:
+        return f"{int(float(value)):,}"
+    except (ValueError, TypeError):
+        return ""
+
+
+def parse_number(value):
+    """콤마가 포함된 문자열을 숫자로 변환"""
+    try:
+        return float(value.replace(",", ""))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def parse_numbers(text):
+    """한 줄에 하나씩 입력한 숫자(콤마 허용) 목록 (빈 줄은 제외)"""
+    return [parse_number(line.strip()) for line in (text or '').splitlines() if line.strip()]
+
+
+# 업종 벤치마크 저장소 (프로세스당 한 번만 로드, 모든 세션 공유)
+@st.cache_resource
+def load_benchmark_store():
+    return open_benchmark_store(os.environ.get('BENCHMARK_DB_PATH'))
+
+
+# 유사 기업 특성 색인 (프로세스당 한 번만 생성)
+@st.cache_resource
+def load_peer_index():
+    return PeerIndex.from_store(load_benchmark_store())
@@ -0,0 +1,125 @@
+"""기업 정보 입력 페이지"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from valuation import (
+    SUPPORTED_EXTENSIONS,
+    ValuationError,
+    load_financial_data,
+    scan_financial_file,
+)
+from views.metrics import record_upload, timed_page
+from views.session import autosave
+
+# 업로드 파일 검증·적재 (파일이 바뀔 때만 다시 읽음, 파일 객체는 해시하지 않음)
+@st.cache_data(max_entries=4, show_spinner="파일을 검증하는 중...")
+def scan_upload(upload_key, _uploaded_file):
+    record_upload('financial_data', _uploaded_file.size)
+    return scan_financial_file(_uploaded_file, _uploaded_file.name)
+
+
+@st.cache_data(max_entries=16, show_spinner="재무 데이터를 불러오는 중...")
+def load_upload(upload_key, company, _uploaded_file):
+    return load_financial_data(_uploaded_file, _uploaded_file.name, company=company)
+
+
+# 기업 정보 입력 페이지
+@st.fragment
+@timed_page
+@autosave
+def company_info_page():
+    st.title("기업 정보 입력")
+    
+    with st.form("company_info_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            company_name = st.text_input("회사명", value=st.session_state.company_data.get('name', ''))
+            business_number = st.text_input("사업자등록번호", value=st.session_state.company_data.get('business_number', ''))
+        
+        with col2:
+            industries = ["제조업", "서비스업", "도소매업", "IT/소프트웨어", "금융업", "건설업", "기타"]
+            industry = st.selectbox("산업군", options=industries, index=0 if not st.session_state.company_data.get('industry') else industries.index(st.session_state.company_data.get('industry')))
+        
+        st.subheader("재무 데이터 입력")
+        
+        # 샘플 데이터 생성 또는 기존 데이터 불러오기
+        if not isinstance(st.session_state.company_data.get('financial_data'), pd.DataFrame) or st.session_state.company_data.get('financial_data').empty:
+            years = [datetime.now().year - i for i in range(1, 6)]
+            sample_data = {
+                '연도': years,
+                '매출액': [0] * 5,
+                '영업이익': [0] * 5,
+                '당기순이익': [0] * 5,
+                '총자산': [0] * 5,
+                '총부채': [0] * 5,
+                '자본': [0] * 5
+            }
+            financial_data = pd.DataFrame(sample_data)
+        else:
+            financial_data = st.session_state.company_data.get('financial_data')
+        
+        # 편집 가능한 데이터프레임 (단순화된 버전)
+        edited_df = st.data_editor(financial_data, use_container_width=True)
+        
+        submit_button = st.form_submit_button("저장")
+        
+        if submit_button:
+            # 데이터 유효성 검사
+            if not company_name:
+                st.warning("회사명을 입력해주세요.")
+            else:
+                # 데이터 저장
+                st.session_state.company_data = {
+                    'name': company_name,
+                    'industry': industry,
+                    'business_number': business_number,
+                    'financial_data': edited_df
+                }
+                st.success("기업 정보가 저장되었습니다!")
+    
+    # 데이터 업로드/다운로드 기능
+    st.divider()
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("데이터 업로드")
+        uploaded_file = st.file_uploader("재무 데이터 파일 업로드 (CSV, Excel, Parquet)", type=SUPPORTED_EXTENSIONS)
+        
+        if uploaded_file is not None:
+            try:
+                upload_key = (getattr(uploaded_file, 'file_id', uploaded_file.name), uploaded_file.size)
+                summary = scan_upload(upload_key, uploaded_file)
+                
+                # 여러 기업이 섞인 파일은 불러올 기업 선택
+                company = None
+                if summary.companies:
+                    st.caption(f"총 {summary.rows:,}행, {len(summary.companies):,}개 기업")
+                    company = st.selectbox(
+                        "불러올 기업",
+                        options=list(summary.companies),
+                        format_func=lambda name: f"{name} ({summary.companies[name]}개 연도)"
+                    )
+                
+                df = load_upload(upload_key, company, uploaded_file)
+                st.dataframe(df.head())
+                if st.button("이 데이터로 사용하기"):
+                    st.session_state.company_data['financial_data'] = df
+                    st.success("데이터가 성공적으로 로드되었습니다!")
+                    st.rerun()
+            except ValuationError as e:
+                st.error(str(e))
+            except Exception as e:
+                st.error(f"파일 로딩 중 오류 발생: {e}")
+    
+    with col2:
+        st.subheader("데이터 다운로드")
+        if not st.session_state.company_data.get('financial_data').empty:
+            csv = st.session_state.company_data.get('financial_data').to_csv(index=False)
+            st.download_button(
+                label="CSV로 다운로드",
+                data=csv,
+                file_name=f"{st.session_state.company_data.get('name', 'company')}_financial_data.csv",
+                mime='text/csv'
+            )
@@ -0,0 +1,525 @@
+"""현금흐름할인법(DCF) 평가 페이지 (기본·고급 설정, 민감도 분석, 몬테카를로 시뮬레이션, 목표 영업권 역산)"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import time
+
+from valuation import (
+    DCF_SENSITIVITY_PARAMETERS,
+    DCF_STAGE_LABELS,
+    DISTRIBUTION_KINDS,
+    EXIT_MULTIPLE,
+    IMPLIED_DCF_PARAMETERS,
+    SIMULATION_PARAMETERS,
+    TERMINAL_VALUE_METHODS,
+    DCFInput,
+    DCFStage,
+    Distribution,
+    ValuationError,
+    dcf_sensitivity_grid,
+    display_histogram,
+    forecast_frame,
+    implied_dcf_parameter,
+    simulate_dcf,
+    value_dcf_incremental,
+    weighted_average_cost_of_capital,
+)
+from views.charts import heatmap_figure, histogram_figure, line_figure, pie_figure
+from views.common import format_number, parse_numbers
+from views.metrics import timed_page, timed_valuation
+from views.navigation import go_to
+from views.session import autosave
+
+# 고급 설정 단계 편집표 컬럼 (DCFStage 필드 → 표시명)
+STAGE_COLUMNS = {
+    'name': '단계',
+    'years': '기간(년)',
+    'growth_rate': '시작 성장률(%)',
+    'end_growth_rate': '종료 성장률(%)',
+    'operating_margin': '영업이익률(%)',
+    'depreciation_ratio': '감가상각비(매출 대비 %)',
+    'capex_ratio': '자본적지출(매출 대비 %)',
+    'working_capital_ratio': '운전자본(매출 증가분 대비 %)',
+}
+
+
+def default_stage_frame(operating_margin):
+    """고성장 5년 → 감속 10년 → 안정 35년의 50년 기본 단계표"""
+    stages = [
+        DCFStage(5, 8.0, operating_margin=operating_margin, name='고성장'),
+        DCFStage(10, 8.0, 3.0, operating_margin=operating_margin, name='감속'),
+        DCFStage(35, 3.0, operating_margin=operating_margin, name='안정'),
+    ]
+    return pd.DataFrame([{label: getattr(stage, field) for field, label in STAGE_COLUMNS.items()}
+                         for stage in stages])
+
+
+def stages_from_frame(stage_df):
+    """단계 편집표를 DCFStage 목록으로 변환 (기간이 비어 있는 행은 제외)"""
+    stages = []
+    for row in stage_df.rename(columns={label: field for field, label in STAGE_COLUMNS.items()}).to_dict('records'):
+        if pd.isna(row['years']) or pd.isna(row['growth_rate']):
+            continue
+        values = {field: value for field, value in row.items() if not pd.isna(value)}
+        values['years'] = int(values['years'])
+        values['name'] = str(values.get('name', ''))
+        stages.append(DCFStage(**values))
+    return stages
+
+
+# DCF 결과 표시 및 저장 (기본/고급 설정 공통)
+def render_dcf_result(result, success_message, trace=None):
+    details = result.details
+    forecast_df = forecast_frame(details['forecast'])
+    
+    # 결과 표시
+    st.success(success_message)
+    
+    # 증분 계산 현황 (바뀐 입력에 영향받는 단계만 재계산)
+    if trace:
+        recomputed = [DCF_STAGE_LABELS[name] for name, status in trace.items() if status == 'recomputed']
+        reused = [DCF_STAGE_LABELS[name] for name, status in trace.items() if status == 'reused']
+        st.caption(f"재계산: {', '.join(recomputed) or '없음'} | 재사용: {', '.join(reused) or '없음'}")
+    
+    # 예측 데이터 표시
+    st.subheader("미래 현금흐름 예측")
+    parameters = result.parameters
+    stage_text = ' → '.join(f"{stage['name'] or '단계'} {stage['years']}년" for stage in parameters.get('stages') or [])
+    st.caption(f"예측 기간 {len(parameters['growth_rates'])}년"
+               + (f" ({stage_text})" if stage_text else "")
+               + (" | 기중 할인(mid-year)" if parameters.get('mid_year') else ""))
+    st.dataframe(forecast_df, hide_index=True, use_container_width=True)
+    
+    # 결과 요약 표시
+    st.subheader("DCF 평가 결과")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("예측 기간 현금흐름 합계", f"{details['total_present_value']:,.0f}원")
+    with col2:
+        st.metric("잔존가치 현재가치", f"{details['terminal_value_present']:,.0f}원")
+    with col3:
+        st.metric("총 기업가치", f"{details['firm_value']:,.0f}원")
+    
+    # 영업권 가치 표시
+    st.metric("추정 영업권 가치", f"{result.value:,.0f}원")
+    
+    # 결과 저장
+    st.session_state.valuation_results['dcf'] = result.as_dict()
+    
+    # 차트 표시
+    st.subheader("현금흐름 분석")
+    
+    # 현금흐름 추이 차트
+    fig_fcf = line_figure(
+        forecast_df['연도'],
+        {'잉여현금흐름': forecast_df['잉여현금흐름'].tolist(), '현재가치': forecast_df['현재가치'].tolist()},
+        '예측 기간 현금흐름 추이', '연도', '금액', '구분'
+    )
+    st.plotly_chart(fig_fcf, use_container_width=True)
+    
+    # 기업가치 구성 파이 차트
+    fig_value = pie_figure(
+        ['예측기간 현재가치', '잔존가치 현재가치'],
+        [details['total_present_value'], details['terminal_value_present']],
+        '기업가치 구성'
+    )
+    st.plotly_chart(fig_value, use_container_width=True)
+
+
+# 단계별 성장률 일정 안내 (민감도·시뮬레이션·역산에서 성장률은 평균 기준으로 평행 이동)
+def growth_schedule_caption(params: DCFInput):
+    if len(set(params.growth_rates)) > 1:
+        st.caption(f"연도별 성장률이 달라 매출 성장률은 평균({np.mean(params.growth_rates):.2f}%) 기준으로 다룹니다. "
+                   "값을 바꾸면 단계별 성장률 일정 전체가 같은 폭으로 평행 이동합니다.")
+
+
+# DCF 민감도 분석 (두 매개변수 격자에 대한 영업권 가치 히트맵)
+def dcf_sensitivity_section(financial_data):
+    if 'dcf' not in st.session_state.valuation_results:
+        st.info("기본 또는 고급 DCF 계산을 먼저 실행하면, 그 매개변수를 기준으로 민감도 분석을 할 수 있습니다.")
+        return
+    
+    base_params = DCFInput(**st.session_state.valuation_results['dcf']['parameters'])
+    growth_schedule_caption(base_params)
+    parameter_names = list(DCF_SENSITIVITY_PARAMETERS.keys())
+    
+    def parameter_label(name):
+        return DCF_SENSITIVITY_PARAMETERS[name][0]
+    
+    st.subheader("민감도 분석 설정")
+    
+    # 매개변수 선택에 따라 기본 범위가 바뀌도록 폼 밖에서 선택
+    col1, col2 = st.columns(2)
+    with col1:
+        row_parameter = st.selectbox("세로축 매개변수", options=parameter_names, index=0, format_func=parameter_label)
+    with col2:
+        column_parameter = st.selectbox("가로축 매개변수", options=parameter_names, index=1, format_func=parameter_label)
+    
+    with st.form("dcf_sensitivity_params"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            _, row_min, row_max = DCF_SENSITIVITY_PARAMETERS[row_parameter]
+            row_range = st.slider("세로축 범위", min_value=-20.0, max_value=50.0, value=(row_min, row_max), step=0.5)
+            row_steps = st.slider("세로축 구간 수", min_value=5, max_value=200, value=50)
+        
+        with col2:
+            _, column_min, column_max = DCF_SENSITIVITY_PARAMETERS[column_parameter]
+            column_range = st.slider("가로축 범위", min_value=-20.0, max_value=50.0, value=(column_min, column_max), step=0.5)
+            column_steps = st.slider("가로축 구간 수", min_value=5, max_value=200, value=50)
+        
+        calculate_sensitivity_button = st.form_submit_button("민감도 분석 실행")
+    
+    if calculate_sensitivity_button:
+        try:
+            started = time.perf_counter()
+            grid = dcf_sensitivity_grid(
+                financial_data,
+                base_params,
+                row_parameter,
+                np.linspace(row_range[0], row_range[1], row_steps),
+                column_parameter,
+                np.linspace(column_range[0], column_range[1], column_steps)
+            )
+            elapsed = time.perf_counter() - started
+            
+            fig = heatmap_figure(grid.values, grid.columns, grid.index, '영업권 가치 민감도',
+                                 parameter_label(column_parameter), parameter_label(row_parameter), '영업권 가치')
+            st.plotly_chart(fig, use_container_width=True)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("최소 영업권 가치", f"{np.nanmin(grid.values):,.0f}원")
+            with col2:
+                st.metric("최대 영업권 가치", f"{np.nanmax(grid.values):,.0f}원")
+            with col3:
+                st.metric("계산 조합 수", f"{grid.size:,}개")
+            st.caption(f"{grid.shape[0]}×{grid.shape[1]} 격자 계산 시간: {elapsed * 1000:,.1f}ms "
+                       "(할인율이 영구 성장률 이하인 조합은 비어 있습니다)")
+        except Exception as e:
+            st.error(f"민감도 분석 중 오류가 발생했습니다: {e}")
+
+
+# DCF 몬테카를로 시뮬레이션 (매개변수 분포 → 영업권 가치 분포)
+def dcf_simulation_section(financial_data):
+    if 'dcf' not in st.session_state.valuation_results:
+        st.info("기본 또는 고급 DCF 계산을 먼저 실행하면, 그 매개변수를 중심으로 시뮬레이션할 수 있습니다.")
+        return
+    
+    base_params = DCFInput(**st.session_state.valuation_results['dcf']['parameters'])
+    growth_schedule_caption(base_params)
+    base_values = {
+        'growth_rate': float(np.mean(base_params.growth_rates)),
+        'operating_margin': base_params.operating_margin,
+        'discount_rate': base_params.discount_rate,
+        'terminal_growth_rate': base_params.terminal_growth_rate
+    }
+    kind_labels = {'normal': '정규분포', 'uniform': '균등분포', 'triangular': '삼각분포', 'fixed': '고정값'}
+    default_kinds = {'growth_rate': 'normal', 'operating_margin': 'triangular', 'discount_rate': 'uniform', 'terminal_growth_rate': 'fixed'}
+    
+    st.subheader("시뮬레이션 설정")
+    
+    # 분포 종류에 따라 입력 항목이 달라지므로 폼 밖에서 선택
+    kinds = {}
+    kind_columns = st.columns(len(SIMULATION_PARAMETERS))
+    for column, (name, label) in zip(kind_columns, SIMULATION_PARAMETERS.items()):
+        with column:
+            kinds[name] = st.selectbox(
+                label,
+                options=DISTRIBUTION_KINDS,
+                index=DISTRIBUTION_KINDS.index(default_kinds[name]),
+                format_func=lambda kind: kind_labels[kind],
+                key=f"mc_kind_{name}"
+            )
+    
+    with st.form("dcf_simulation_params"):
+        distributions = {}
+        value_columns = st.columns(len(SIMULATION_PARAMETERS))
+        for column, name in zip(value_columns, SIMULATION_PARAMETERS):
+            base = base_values[name]
+            with column:
+                if kinds[name] == 'normal':
+                    distributions[name] = Distribution.normal(
+                        st.number_input("평균", value=base, step=0.5, key=f"mc_mean_{name}"),
+                        st.number_input("표준편차", value=1.0, min_value=0.0, step=0.1, key=f"mc_std_{name}")
+                    )
+                elif kinds[name] == 'uniform':
+                    distributions[name] = Distribution.uniform(
+                        st.number_input("최솟값", value=base - 2.0, step=0.5, key=f"mc_low_{name}"),
+                        st.number_input("최댓값", value=base + 2.0, step=0.5, key=f"mc_high_{name}")
+                    )
+                elif kinds[name] == 'triangular':
+                    distributions[name] = Distribution.triangular(
+                        st.number_input("최솟값", value=base - 2.0, step=0.5, key=f"mc_low_{name}"),
+                        st.number_input("최빈값", value=base, step=0.5, key=f"mc_mode_{name}"),
+                        st.number_input("최댓값", value=base + 2.0, step=0.5, key=f"mc_high_{name}")
+                    )
+                else:
+                    distributions[name] = Distribution.fixed(
+                        st.number_input("값", value=base, step=0.5, key=f"mc_value_{name}")
+                    )
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            n_paths = st.select_slider("시뮬레이션 횟수", options=[10_000, 100_000, 1_000_000], value=100_000,
+                                       format_func=lambda n: f"{n:,}회")
+        with col2:
+            use_sobol = st.checkbox("준난수(Sobol) 사용", value=False,
+                                    help="같은 횟수에서 더 고르게 표본을 추출해 결과가 빨리 안정됩니다.")
+            seed = st.number_input("난수 시드", value=42, min_value=0, step=1)
+        with col3:
+            use_correlation = st.checkbox("매개변수 간 상관관계 적용", value=False)
+        
+        correlation_df = pd.DataFrame(
+            np.eye(len(SIMULATION_PARAMETERS)),
+            index=list(SIMULATION_PARAMETERS.values()),
+            columns=list(SIMULATION_PARAMETERS.values())
+        )
+        with st.expander("상관계수 행렬"):
+            correlation_df = st.data_editor(correlation_df, use_container_width=True, key="mc_correlation")
+        
+        run_simulation_button = st.form_submit_button("시뮬레이션 실행")
+    
+    if run_simulation_button:
+        try:
+            with st.spinner("시뮬레이션 중입니다..."):
+                result = simulate_dcf(
+                    financial_data,
+                    base_params,
+                    distributions,
+                    n_paths=n_paths,
+                    correlation=correlation_df.values if use_correlation else None,
+                    sobol=use_sobol,
+                    seed=int(seed)
+                )
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("P5 영업권 가치", f"{result.percentiles[5]:,.0f}원")
+            with col2:
+                st.metric("P50 영업권 가치", f"{result.percentiles[50]:,.0f}원")
+            with col3:
+                st.metric("P95 영업권 가치", f"{result.percentiles[95]:,.0f}원")
+            with col4:
+                st.metric("평균", f"{result.mean:,.0f}원")
+            
+            centers, counts = display_histogram(result)
+            fig = histogram_figure(centers, counts, '영업권 가치 분포', '영업권 가치', '빈도',
+                                   {f"P{q}": result.percentiles[q] for q in (5, 50, 95)})
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.caption(f"{result.n_paths:,}회 중 유효 {result.n_valid:,}회 | 계산 시간: {result.elapsed:,.2f}초 "
+                       "(할인율이 영구 성장률 이하인 경로는 제외됩니다)")
+        except Exception as e:
+            st.error(f"시뮬레이션 중 오류가 발생했습니다: {e}")
+
+
+# 목표 영업권 역산 (협상 가격 등을 재현하는 할인율·성장률·영업이익률·배수)
+def dcf_goal_seek_section(financial_data):
+    if 'dcf' not in st.session_state.valuation_results:
+        st.info("기본 또는 고급 DCF 계산을 먼저 실행하면, 그 매개변수를 기준으로 목표 영업권에 맞는 값을 역산할 수 있습니다.")
+        return
+    
+    current = st.session_state.valuation_results['dcf']
+    base_params = DCFInput(**current['parameters'])
+    growth_schedule_caption(base_params)
+    parameter_names = [name for name in IMPLIED_DCF_PARAMETERS
+                       if name != 'exit_multiple' or base_params.terminal_value_method == EXIT_MULTIPLE]
+    
+    st.subheader("목표 영업권 역산")
+    st.caption("다른 매개변수는 마지막 DCF 계산 값을 그대로 두고, 선택한 매개변수 하나만 바꿔 목표 영업권이 나오는 값을 찾습니다.")
+    
+    with st.form("dcf_goal_seek"):
+        parameter = st.selectbox("역산할 매개변수", options=parameter_names,
+                                 format_func=lambda name: IMPLIED_DCF_PARAMETERS[name][0])
+        targets_text = st.text_area("목표 영업권 (원, 여러 개는 한 줄에 하나씩)", value=format_number(current['value']))
+        solve_button = st.form_submit_button("역산 실행")
+    
+    if solve_button:
+        targets = parse_numbers(targets_text)
+        if not targets:
+            st.warning("목표 영업권을 하나 이상 입력하세요.")
+            return
+        try:
+            result = implied_dcf_parameter(financial_data, base_params, parameter, targets)
+        except ValuationError as e:
+            st.error(str(e))
+            return
+        
+        label = IMPLIED_DCF_PARAMETERS[parameter][0]
+        current_value = (float(np.mean(base_params.growth_rates)) if parameter == 'growth_rate'
+                         else getattr(base_params, parameter))
+        result_df = pd.DataFrame({
+            '목표 영업권(원)': [f"{target:,.0f}" for target in result.targets],
+            label: [f"{value:.4f}" if ok else "해 없음" for value, ok in zip(result.values, result.converged)],
+            '현재 값 대비(%p)': [f"{value - current_value:+.4f}" if ok else "-"
+                              for value, ok in zip(result.values, result.converged)],
+        })
+        st.dataframe(result_df, hide_index=True, use_container_width=True)
+        st.caption(f"현재 {label}: {current_value:.4f} | 반복 {result.iterations}회, 계산 시간 {result.elapsed * 1000:,.1f}ms "
+                   f"(탐색 구간 {IMPLIED_DCF_PARAMETERS[parameter][1]:g}~{IMPLIED_DCF_PARAMETERS[parameter][2]:g} 안에 해가 없으면 '해 없음')")
+
+
+# 현금흐름할인법 페이지 (간소화된 버전)
+@st.fragment
+@timed_page
+@autosave
+def dcf_page():
+    st.title("현금흐름할인법(DCF) 평가")
+    
+    # 기업 데이터 확인
+    if st.session_state.company_data.get('name') == '':
+        st.warning("기업 정보가 입력되지 않았습니다. 먼저 기업 정보를 입력해주세요.")
+        if st.button("기업 정보 입력으로 이동"):
+            go_to('company_info')
+        return
+    
+    st.subheader(f"{st.session_state.company_data.get('name')} - 현금흐름할인법(DCF) 평가")
+    
+    # 초기 재무 데이터 가져오기
+    financial_data = st.session_state.company_data.get('financial_data')
+    
+    # 마지막 연도 선택 (가장 최근 데이터)
+    if not financial_data.empty:
+        latest_year = financial_data['연도'].max()
+        latest_data = financial_data[financial_data['연도'] == latest_year].iloc[0]
+    else:
+        st.warning("재무 데이터가 없습니다. 기업 정보 페이지에서 재무 데이터를 입력해주세요.")
+        return
+    
+    # 탭 생성 (기본 설정 / 고급 설정 / 민감도 분석 / 시뮬레이션 / 역산)
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["기본 예측 설정", "고급 설정", "민감도 분석", "몬테카를로 시뮬레이션", "목표 영업권 역산"])
+    
+    with tab1:
+        # 기본 DCF 파라미터 설정
+        with st.form("dcf_basic_params"):
+            st.subheader("기본 예측 설정")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # 성장률 및 예측 기간 설정
+                growth_rate = st.slider("연간 매출 성장률 (%)", min_value=-20.0, max_value=50.0, value=5.0, step=0.5)
+                forecast_period = st.slider("예측 기간 (년)", min_value=3, max_value=10, value=5)
+                
+                # 영업이익률 설정
+                operating_margin = st.slider("영업이익률 (%)", 
+                                           min_value=0.0, 
+                                           max_value=50.0, 
+                                           value=float(latest_data['영업이익'] / latest_data['매출액'] * 100) if latest_data['매출액'] > 0 else 10.0,
+                                           step=0.5)
+            
+            with col2:
+                # 할인율 설정
+                discount_rate = st.slider("할인율 (WACC, %)", min_value=5.0, max_value=30.0, value=12.0, step=0.5)
+                
+                # 영구 성장률 설정
+                terminal_growth_rate = st.slider("영구 성장률 (%)", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
+                                              help="영구 성장률은 일반적으로 장기 GDP 성장률과 인플레이션을 고려하여 1-3% 사이로 설정합니다.")
+                
+                # 법인세율 설정
+                tax_rate = st.slider("법인세율 (%)", min_value=10.0, max_value=30.0, value=22.0, step=0.5)
+            
+            calculate_basic_button = st.form_submit_button("기본 DCF 계산")
+            
+            if calculate_basic_button:
+                # DCF 계산 로직
+                try:
+                    params = DCFInput.constant_growth(
+                        growth_rate,
+                        forecast_period,
+                        operating_margin=operating_margin,
+                        discount_rate=discount_rate,
+                        terminal_growth_rate=terminal_growth_rate,
+                        tax_rate=tax_rate
+                    )
+                    with timed_valuation('dcf'):
+                        result, trace = value_dcf_incremental(financial_data, params)
+                    render_dcf_result(result, "DCF 평가가 완료되었습니다!", trace)
+                    
+                except ValuationError as e:
+                    st.error(str(e))
+                except Exception as e:
+                    st.error(f"DCF 계산 중 오류가 발생했습니다: {e}")
+    
+    with tab2:
+        # 고급 DCF 설정
+        with st.form("dcf_advanced_params"):
+            st.subheader("고급 DCF 설정")
+            
+            # 단계별 장기 예측 설정 (단계 길이는 자유, 성장률은 단계 안에서 시작→종료로 선형 변화)
+            st.markdown("#### 단계별 예측 설정")
+            st.caption("고성장·감속·안정 등 단계를 원하는 만큼 추가하고 기간을 정하세요. "
+                       "종료 성장률을 비워 두면 단계 내내 시작 성장률을 적용합니다.")
+            stage_df = st.data_editor(
+                default_stage_frame(operating_margin),
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                key="dcf_stages",
+                column_config={
+                    STAGE_COLUMNS['years']: st.column_config.NumberColumn(min_value=1, max_value=200, step=1),
+                }
+            )
+            mid_year = st.checkbox("기중 할인(mid-year) 적용", value=False,
+                                   help="현금흐름이 연중 고르게 발생한다고 보고 각 연도를 반년 덜 할인합니다.")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # 자본 구조 설정
+                st.markdown("#### 자본 구조 및 비용")
+                debt_ratio = st.slider("부채 비율 (%)", min_value=0.0, max_value=80.0, value=30.0, step=1.0)
+                cost_of_debt = st.slider("부채 비용 (%)", min_value=1.0, max_value=15.0, value=5.0, step=0.5)
+                cost_of_equity = st.slider("자기자본 비용 (%)", min_value=5.0, max_value=30.0, value=15.0, step=0.5)
+                
+                # WACC 자동 계산
+                wacc = weighted_average_cost_of_capital(debt_ratio, cost_of_debt, cost_of_equity)
+                st.metric("계산된 WACC (%)", f"{wacc:.2f}%")
+            
+            with col2:
+                # 고급 영구가치 설정
+                st.markdown("#### 영구가치 설정")
+                terminal_value_method = st.selectbox("영구가치 계산 방법", 
+                                                options=TERMINAL_VALUE_METHODS)
+                
+                exit_multiple = 6.0
+                if terminal_value_method == EXIT_MULTIPLE:
+                    exit_multiple = st.slider("Exit Multiple (EBITDA 배수)", min_value=3.0, max_value=15.0, value=6.0, step=0.5)
+            
+            calculate_advanced_button = st.form_submit_button("고급 DCF 계산")
+            
+            if calculate_advanced_button:
+                # 고급 DCF 계산 로직 (단계별 장기 예측)
+                try:
+                    params = DCFInput.from_stages(
+                        stages_from_frame(stage_df),
+                        discount_rate=wacc,
+                        terminal_growth_rate=terminal_growth_rate,
+                        tax_rate=tax_rate,
+                        terminal_value_method=terminal_value_method,
+                        exit_multiple=exit_multiple,
+                        mid_year=mid_year
+                    )
+                    with timed_valuation('dcf'):
+                        result, trace = value_dcf_incremental(financial_data, params)
+                    render_dcf_result(result, "고급 DCF 평가가 완료되었습니다!", trace)
+                    
+                except ValuationError as e:
+                    st.error(str(e))
+                except Exception as e:
+                    st.error(f"고급 DCF 계산 중 오류가 발생했습니다: {e}")
+    
+    with tab3:
+        dcf_sensitivity_section(financial_data)
+    
+    with tab4:
+        dcf_simulation_section(financial_data)
+    
+    with tab5:
+        dcf_goal_seek_section(financial_data)
+    
+    # 결과가 계산되었다면 종합 결과 페이지로 이동 버튼 표시
+    if 'dcf' in st.session_state.valuation_results:
+        if st.button("종합 결과 페이지로 이동"):
+            go_to('results')
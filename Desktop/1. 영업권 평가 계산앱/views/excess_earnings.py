@@ -0,0 +1,157 @@
+"""초과이익법 평가 페이지"""
+import streamlit as st
+import pandas as pd
+
+from valuation import (
+    ExcessEarningsInput,
+    ValuationError,
+    cached_valuation,
+    earnings_basis,
+    value_excess_earnings,
+)
+from views.charts import bar_figure
+from views.common import format_number, parse_number
+from views.metrics import timed_page, timed_valuation
+from views.navigation import go_to
+from views.session import autosave
+
+# 초과이익법 페이지
+@st.fragment
+@timed_page
+@autosave
+def excess_earnings_page():
+    st.title("초과이익법 평가")
+    
+    # 기업 데이터 확인
+    if st.session_state.company_data.get('name') == '':
+        st.warning("기업 정보가 입력되지 않았습니다. 먼저 기업 정보를 입력해주세요.")
+        if st.button("기업 정보 입력으로 이동"):
+            go_to('company_info')
+        return
+    
+    st.subheader(f"{st.session_state.company_data.get('name')} - 초과이익법 평가")
+    
+    # 초과이익법 파라미터 설정
+    defaults = ExcessEarningsInput()
+    with st.form("excess_earnings_params"):
+        st.subheader("평가 매개변수 설정")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # 정상 자본수익률 입력
+            normal_roi = defaults.normal_roi
+            normal_roi_input = st.text_input("정상 자본수익률 (%)", value=format_number(normal_roi))
+            if normal_roi_input:
+                normal_roi = parse_number(normal_roi_input)
+            excess_years = defaults.excess_years
+            excess_years_input = st.text_input("초과이익 인정연수", value=format_number(excess_years))
+            if excess_years_input:
+                excess_years = int(parse_number(excess_years_input))
+            discount_rate = st.slider("할인율 (%)", min_value=5.0, max_value=30.0, value=defaults.discount_rate, step=0.5)
+            weight_recent = st.checkbox("최근 연도에 가중치 부여", value=defaults.weight_recent,
+                                        help="평균 당기순이익 대신 최근 3년 당기순이익을 3:2:1(최근 연도부터)로 가중평균합니다.")
+        
+        with col2:
+            # 산업 프리미엄 입력
+            industry_premium = defaults.industry_premium
+            industry_premium_input = st.text_input("산업 프리미엄 (%)", value=format_number(industry_premium))
+            if industry_premium_input:
+                industry_premium = parse_number(industry_premium_input)
+            
+            # 고급 설정
+            with st.expander("고급 설정"):
+                adjustment_factor = st.slider("조정 계수", min_value=0.5, max_value=1.5, value=defaults.adjustment_factor, step=0.1)
+            
+        calculate_button = st.form_submit_button("평가 계산")
+        
+        if calculate_button:
+            try:
+                params = ExcessEarningsInput(
+                    normal_roi=normal_roi,
+                    excess_years=excess_years,
+                    discount_rate=discount_rate,
+                    adjustment_factor=adjustment_factor,
+                    industry_premium=industry_premium,
+                    weight_recent=weight_recent
+                )
+                with timed_valuation('excess_earnings'):
+                    result = cached_valuation('excess_earnings', value_excess_earnings, st.session_state.company_data.get('financial_data'), params)
+                
+                # 결과 저장
+                st.session_state.valuation_results['excess_earnings'] = result.as_dict()
+                
+                st.success("초과이익법 평가가 완료되었습니다!")
+                
+            except ValuationError as e:
+                st.error(str(e))
+                return
+            except Exception as e:
+                st.error(f"계산 중 오류가 발생했습니다: {e}")
+    
+    # 계산 결과 표시 (이미 계산된 경우)
+    if 'excess_earnings' in st.session_state.valuation_results:
+        result = st.session_state.valuation_results['excess_earnings']
+        
+        st.divider()
+        st.subheader("평가 결과")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("영업권 평가액", f"{result['value']:,.0f}원")
+            
+            st.subheader("주요 매개변수")
+            params_df = pd.DataFrame({
+                '매개변수': ['정상 자본수익률', '초과이익 인정연수', '할인율', '조정 계수', '산업 프리미엄', '기준 이익'],
+                '값': [
+                    f"{result['parameters']['normal_roi']}%",
+                    f"{result['parameters']['excess_years']}년",
+                    f"{result['parameters']['discount_rate']}%",
+                    f"{result['parameters']['adjustment_factor']}",
+                    f"{result['parameters']['industry_premium']}%",
+                    earnings_basis(result['parameters'])
+                ]
+            })
+            st.dataframe(params_df, hide_index=True)
+        
+        with col2:
+            # 계산 과정 표시
+            with st.expander("상세 계산 과정", expanded=True):
+                st.markdown(f"""
+                #### 1. 기초 데이터
+                - {earnings_basis(result['parameters'])}: {result['details']['avg_earnings']:,.0f}원
+                - 총자산: {result['details']['total_assets']:,.0f}원
+                
+                #### 2. 정상이익 계산
+                - 정상이익 = 총자산 × 정상수익률
+                - 정상이익 = {result['details']['total_assets']:,.0f} × {result['parameters']['normal_roi']}% = {result['details']['normal_profit']:,.0f}원
+                
+                #### 3. 초과이익 계산
+                - 초과이익 = 평균이익 - 정상이익
+                - 초과이익 = {result['details']['avg_earnings']:,.0f} - {result['details']['normal_profit']:,.0f} = {result['details']['excess_profit']:,.0f}원
+                
+                #### 4. 현재가치 계산
+                - {result['parameters']['excess_years']}년 동안 초과이익의 현재가치 합계
+                - 할인율: {result['parameters']['discount_rate']}%
+                - 연금현가계수: {result['details']['annuity_factor']:.4f}
+                - 현재가치 합계 = {result['details']['excess_profit']:,.0f} × {result['details']['annuity_factor']:.4f}
+                
+                #### 5. 조정
+                - 조정 계수: {result['parameters']['adjustment_factor']}
+                - 산업 프리미엄: {result['parameters']['industry_premium']}%
+                
+                #### 최종 영업권 가치
+                - **{result['value']:,.0f}원**
+                """)
+            
+            # 간단한 차트 (평가 시 저장된 연도별 현재가치 사용)
+            values = result['details']['yearly_present_values']
+            years = list(range(1, len(values) + 1))
+            
+            fig = bar_figure(years, values, '연도별 초과이익의 현재가치', '연도', '현재가치')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # 결과 페이지로 이동 버튼
+        if st.button("종합 결과 페이지로 이동"):
+            go_to('results')
@@ -0,0 +1,124 @@
+"""홈 페이지"""
+import streamlit as st
+
+from views.common import asset_path
+from views.metrics import timed_page
+from views.navigation import go_to
+
+# 홈 페이지
+@st.fragment
+@timed_page
+def home_page():
+    st.title("영업권 평가 시스템에 오신 것을 환영합니다")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ## 영업권이란?
+        영업권은 기업의 순자산가치를 초과하는 가치로, 기업의 브랜드, 고객 관계, 기술력 등 무형의 가치를 포함합니다.
+        기업 인수합병(M&A) 및 법인전환 과정에서 영업권의 가치 평가가 필수적입니다.
+        
+        ## 주요 평가 방법
+        - **초과이익법**: 정상이익을 초과하는 이익을 계산하여 영업권 가치를 평가
+        - **현금흐름할인법(DCF)**: 미래 예상 현금흐름을 현재가치화하여 평가
+        - **시장가치비교법**: 유사 기업 비교를 통한 가치 산출
+        - **상증법 보충적 평가**: 최근 3년 순손익 가중평균(3:2:1)으로 계산하는 세법상 법정 산식
+        """)
+        
+        # 추가 구현 예정 기능 홍보
+        st.info("""
+        ### 🚀 곧 출시될 기능
+        - **AI 분석 보조**: 재무 데이터 분석 및 맞춤형 추천
+        - **전문 PDF 보고서**: 전문가용 상세 보고서 자동 생성
+        - **산업별 데이터베이스**: 더 정확한 비교를 위한 확장된 업종 데이터
+        - **시계열 분석**: 영업권 가치 변동 추세 분석 및 예측
+        """)
+        
+        # 상세 사용법 - 기본적으로 접혀있는 expander 사용
+        with st.expander("📋 상세 사용 가이드", expanded=False):
+            st.markdown("""
+            ### 1. 기업 정보 입력
+            - **기본 정보**: 회사명, 사업자등록번호, 산업군 등 기본 정보를 입력합니다.
+            - **재무 데이터**: 최소 3년 이상의 재무제표 데이터를 입력합니다.
+            - **CSV 업로드**: 기존 데이터를 CSV 형식으로 업로드할 수 있습니다.
+            """)
+            
+            st.markdown("""
+            ### 2. 초과이익법 평가
+            - **정상 자본수익률**: 해당 업종의 평균 수익률을 설정합니다 (일반적으로 8-12%).
+            - **초과이익 인정연수**: 초과이익이 지속될 것으로 예상되는 기간을 설정합니다 (보통 3-5년).
+            - **할인율**: 미래 초과이익의 현재가치 계산에 사용됩니다 (10-15% 권장).
+            - **고급 설정**: 조정 계수와 산업 프리미엄으로 기업 특성을 반영합니다.
+            """)
+            
+            st.markdown("""
+                ▪ 조정 계수: 일반 기업은 0.8-1.2, 식당업 등은 0.7-1.1 범위 내에서 설정
+                ▪ 산업 프리미엄: 성장 산업은 높게, 쇠퇴 산업은 낮게 설정
+            """)
+            
+            st.markdown("""
+            ### 3. 현금흐름할인법(DCF) 평가
+            - **기본 예측 설정**: 매출 성장률, 예측 기간, 영업이익률, 할인율 등 기본 설정
+            - **고급 설정**: 연도별 맞춤 성장률, 자본 구조, 영구가치 계산 방법 등 설정
+            - 미래 지향적 평가로, 성장 가능성이 큰 기업에 적합합니다.
+            - 최소 2년의 재무제표로도 평가가 가능합니다.
+            
+            ### 4. 시장가치비교법 평가
+            - **비교 지표 선택**: 매출액, 영업이익, 당기순이익, 총자산, EBITDA 등 지표 선택
+            - **업종 평균 배수**: 선택된 지표에 적용할 업종 평균 배수 설정
+            - **유사 기업 데이터**: 업종 내 유사 기업과의 비교 분석
+            
+            ### 5. 종합 결과 확인
+            - 여러 방법의 평가 결과를 비교합니다.
+            - 각 방법에 가중치를 적용하여 최종 영업권 가치를 산출합니다.
+            - 차트와 그래프로 결과를 시각화합니다.
+            
+            ### 사용 팁
+            - **업종별 접근**: 제조업은 현금흐름할인법, 소상공인은 초과이익법 선호
+            - **데이터 품질**: 정확한 재무 데이터가 평가 결과의 품질을 좌우합니다
+            - **결과 해석**: 단일 방법보다 여러 방법의 결과를 종합적으로 검토하세요
+            - **법인 전환 시**: 세무사들이 주로 사용하는 초과이익법과 상증법 보충적 평가 결과를 중점적으로 검토하세요
+            """)
+        
+        # 전문가 자문 안내
+        st.warning("""
+        ### ⚠️ 중요 안내사항
+        이 앱은 영업권 평가를 위한 참고용 도구입니다. **실제 법적/세무적 목적의 영업권 평가는 반드시 세무사, 회계사, 또는 감정평가사의 전문적인 자문과 검토를 받으시기 바랍니다.**
+        
+        특히 다음의 경우 전문가 상담이 필수적입니다:
+        - 법인 전환 및 사업 양도 시 과세 관련 평가
+        - M&A 및 기업 인수 과정에서의 가치 평가
+        - 금융기관 제출용 자산 평가
+        - 법정 분쟁 및 소송 관련 감정 평가
+        """)
+        
+        if st.button("시작하기", key="start_button"):
+            go_to('company_info')
+    
+    with col2:
+        st.image(asset_path("valuation_example.svg"), width=300)
+        
+        st.info("영업권 가치 평가는 기업의 현재와 미래 가치를 정확히 파악하는 데 중요합니다.")
+        
+        # 평가 방법 선택 가이드
+        with st.expander("🔍 어떤 평가 방법이 적합할까요?", expanded=False):
+            st.markdown("""
+            ### 초과이익법 추천 대상
+            - **개인사업자의 법인전환**
+            - **소상공인/중소기업**
+            - **세무적 목적의 평가**
+            - **안정적인 수익 패턴을 가진 기업**
+            
+            ### 현금흐름할인법(DCF) 추천 대상
+            - **성장 단계의 기업**
+            - **미래 현금흐름 예측이 가능한 기업**
+            - **투자 유치나 M&A 준비 기업**
+            - **재무 구조 개선 중인 기업**
+            
+            ### 시장가치비교법 추천 대상
+            - **유사 기업이 많은 일반적인 업종**
+            - **상대 평가가 필요한 경우**
+            - **빠른 참고 평가가 필요한 경우**
+            - **시장 평균과의 비교가 중요한 경우**
+            """)
@@ -0,0 +1,239 @@
+"""시장가치비교법 평가 페이지"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import functools
+
+from valuation import (
+    METRIC_OPTIONS,
+    MarketComparisonInput,
+    ValuationError,
+    cached_valuation,
+    implied_market_multiple,
+    metric_value,
+    value_market_comparison,
+)
+from views.charts import labeled_bar_figure
+from views.common import format_number, parse_number, parse_numbers, load_benchmark_store, load_peer_index
+from views.metrics import timed_page, timed_valuation
+from views.navigation import go_to
+from views.session import autosave
+
+# 자동 선정할 유사 기업 수 (기본값)
+DEFAULT_PEER_COUNT = 5
+
+# 목표 영업권에 맞는 배수 역산 (마지막 계산의 지표·조정 계수 기준)
+def market_goal_seek_section(financial_data, industry, benchmark_store):
+    current = st.session_state.valuation_results['market_comparison']
+    params = MarketComparisonInput(**{name: current['parameters'][name]
+                                      for name in ('selected_metric', 'multiple', 'adjustment_factor')})
+    
+    with st.expander("목표 영업권에 맞는 배수 역산"):
+        with st.form("market_goal_seek"):
+            targets_text = st.text_area("목표 영업권 (원, 여러 개는 한 줄에 하나씩)", value=format_number(current['value']))
+            solve_button = st.form_submit_button("배수 역산")
+        
+        if solve_button:
+            targets = parse_numbers(targets_text)
+            if not targets:
+                st.warning("목표 영업권을 하나 이상 입력하세요.")
+                return
+            try:
+                result = implied_market_multiple(financial_data, params, targets)
+            except ValuationError as e:
+                st.error(str(e))
+                return
+            
+            average = benchmark_store.industry_multiple(industry, params.selected_metric)
+            result_df = pd.DataFrame({
+                '목표 영업권(원)': [f"{target:,.0f}" for target in result.targets],
+                f'{params.selected_metric} 배수': [f"{value:.2f}" if ok else "해 없음"
+                                                 for value, ok in zip(result.values, result.converged)],
+                '업종 평균 대비': [f"{value / average:.2f}배" if ok and average else "-"
+                              for value, ok in zip(result.values, result.converged)],
+            })
+            st.dataframe(result_df, hide_index=True, use_container_width=True)
+            st.caption(f"조정 계수 {params.adjustment_factor:.2f} 적용 | 업종({industry}) 평균 배수 {average:.2f} | "
+                       f"계산 시간 {result.elapsed * 1000:,.1f}ms")
+
+
+# 시장가치비교법 페이지 (간소화된 버전)
+@st.fragment
+@timed_page
+@autosave
+def market_comparison_page():
+    st.title("시장가치비교법 평가")
+    
+    # 기업 데이터 확인
+    if st.session_state.company_data.get('name') == '':
+        st.warning("기업 정보가 입력되지 않았습니다. 먼저 기업 정보를 입력해주세요.")
+        if st.button("기업 정보 입력으로 이동"):
+            go_to('company_info')
+        return
+    
+    st.subheader(f"{st.session_state.company_data.get('name')} - 시장가치비교법 평가")
+    
+    # 초기 재무 데이터 가져오기
+    financial_data = st.session_state.company_data.get('financial_data')
+    
+    # 마지막 연도 선택 (가장 최근 데이터)
+    if not financial_data.empty:
+        latest_year = financial_data['연도'].max()
+        latest_data = financial_data[financial_data['연도'] == latest_year].iloc[0]
+    else:
+        st.warning("재무 데이터가 없습니다. 기업 정보 페이지에서 재무 데이터를 입력해주세요.")
+        return
+    
+    # 업종 정보 확인 (배수 데이터에 없는 업종은 '기타' 사용)
+    benchmark_store = load_benchmark_store()
+    industry = benchmark_store.normalize_industry(st.session_state.company_data.get('industry', '일반'))
+    
+    # 시장가치비교법 파라미터 설정
+    with st.form("market_comparison_params"):
+        st.subheader("평가 매개변수 설정")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # 사용할 재무 지표 선택
+            selected_metric = st.selectbox("비교 지표 선택", options=METRIC_OPTIONS)
+            
+            # 선택된 지표의 값 표시
+            current_metric_value = metric_value(latest_data, selected_metric)
+            if selected_metric in latest_data:
+                st.info(f"선택한 지표의 최근 연도({latest_year}) 값: {current_metric_value:,.0f}원")
+            elif current_metric_value is not None:
+                st.info(f"계산된 EBITDA 값({latest_year}): {current_metric_value:,.0f}원")
+            else:
+                st.warning(f"선택한 지표 '{selected_metric}'의 데이터가 없습니다.")
+        
+        with col2:
+            # 선택된 지표의 업종 평균 배수 가져오기
+            multiple = benchmark_store.industry_multiple(industry, selected_metric)
+            
+            # 사용자 정의 배수 입력 허용
+            multiple_input = st.text_input("배수", value=f"{multiple:g}")
+            if multiple_input:
+                multiple = parse_number(multiple_input)
+            
+            # 조정 계수 설정
+            adjustment_factor = st.slider(
+                "조정 계수", 
+                min_value=0.5, 
+                max_value=1.5, 
+                value=1.0, 
+                step=0.05,
+                help="기업의 특성을 고려한 추가 조정 요소입니다. 1보다 작으면 가치를 낮추고, 1보다 크면 가치를 높입니다."
+            )
+        
+        # 유사 기업 데이터 (규모·수익성이 가까운 기업 자동 선정)
+        with st.expander("유사 기업 데이터"):
+            st.markdown("#### 업종 내 유사 기업 비교")
+            
+            peer_count = st.slider("유사 기업 수", min_value=3, max_value=20, value=DEFAULT_PEER_COUNT,
+                                   help="매출액·영업이익·총자산 규모와 영업이익률이 가장 가까운 기업을 선정합니다.")
+            peers = load_peer_index().nearest(
+                latest_data['매출액'],
+                latest_data['영업이익'],
+                latest_data.get('총자산', np.nan),
+                k=peer_count,
+                industry=industry,
+                metric=selected_metric
+            )
+            
+            # 유사 기업 테이블 표시
+            similar_df = peers[['name', 'multiple', 'revenue', 'operating_income', 'distance']].copy()
+            similar_df.columns = ['기업명', f'{selected_metric} 배수', '매출액', '영업이익', '유사도 거리']
+            # 금액 포맷팅
+            similar_df['매출액'] = similar_df['매출액'].apply(lambda x: f"{x:,.0f}원")
+            similar_df['영업이익'] = similar_df['영업이익'].apply(lambda x: f"{x:,.0f}원")
+            similar_df['유사도 거리'] = similar_df['유사도 거리'].round(3)
+            
+            st.dataframe(similar_df, hide_index=True)
+            
+            if peers.empty:
+                st.warning("선택한 지표의 배수가 있는 유사 기업이 없습니다.")
+            else:
+                st.info(f"유사 기업 {len(peers)}곳의 {selected_metric} 배수는 평균 {peers['multiple'].mean():.2f}, "
+                        f"중앙값 {peers['multiple'].median():.2f}입니다.")
+        
+        calculate_button = st.form_submit_button("평가 계산")
+        
+        if calculate_button:
+            try:
+                params = MarketComparisonInput(
+                    selected_metric=selected_metric,
+                    multiple=multiple,
+                    adjustment_factor=adjustment_factor
+                )
+                # 배수는 위에서 업종 평균이나 입력값으로 정해져 있으므로 캐시 키는 배수·업종으로 충분 (저장소 객체는 키에서 제외)
+                with timed_valuation('market_comparison'):
+                    result = cached_valuation('market_comparison',
+                                              functools.partial(value_market_comparison, store=benchmark_store),
+                                              financial_data, params, industry)
+                details = result.details
+                
+                # 결과 표시
+                st.success("시장가치비교법 평가가 완료되었습니다!")
+                
+                # 결과 요약 표시
+                st.subheader("평가 결과")
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric(f"{selected_metric} 기준 시장가치", f"{details['market_value']:,.0f}원")
+                
+                with col2:
+                    st.metric("조정된 시장가치", f"{details['adjusted_market_value']:,.0f}원")
+                
+                with col3:
+                    st.metric("추정 영업권 가치", f"{result.value:,.0f}원")
+                
+                # 계산 과정 표시
+                st.subheader("계산 과정")
+                calc_df = pd.DataFrame({
+                    '구분': [f"{selected_metric} 값", f"{selected_metric} 배수", "시장가치", "조정 계수", 
+                           "조정된 시장가치", "순자산가치", "영업권 가치"],
+                    '값': [f"{result.parameters['metric_value']:,.0f}원", f"{multiple:.2f}", f"{details['market_value']:,.0f}원", 
+                          f"{adjustment_factor:.2f}", f"{details['adjusted_market_value']:,.0f}원", 
+                          f"{details['net_asset_value']:,.0f}원", f"{result.value:,.0f}원"]
+                })
+                
+                st.dataframe(calc_df, hide_index=True, use_container_width=True)
+                
+                # 업종 내 위치 차트
+                st.subheader("업종 내 위치")
+                
+                # 비교 차트 데이터 준비 (유사 기업 + 현재 기업)
+                comparison_data = [
+                    {'기업명': name, f'{selected_metric} 배수': peer_multiple}
+                    for name, peer_multiple in zip(peers['name'], peers['multiple'])
+                ]
+                comparison_data.append({
+                    '기업명': st.session_state.company_data.get('name'),
+                    f'{selected_metric} 배수': multiple
+                })
+                
+                # 데이터프레임 생성
+                comparison_df = pd.DataFrame(comparison_data)
+                
+                # 막대 차트로 표시
+                fig = labeled_bar_figure(
+                    comparison_df['기업명'],
+                    comparison_df[f'{selected_metric} 배수'],
+                    f'업종 내 {selected_metric} 배수 비교', '기업명', f'{selected_metric} 배수'
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+                
+                # 결과 저장
+                st.session_state.valuation_results['market_comparison'] = result.as_dict()
+                
+            except Exception as e:
+                st.error(f"계산 중 오류가 발생했습니다: {e}")
+    
+    # 결과가 계산되었다면 배수 역산과 종합 결과 페이지로 이동 버튼 표시
+    if 'market_comparison' in st.session_state.valuation_results:
+        market_goal_seek_section(financial_data, industry, benchmark_store)
+        if st.button("종합 결과 페이지로 이동"):
+            go_to('results')
@@ -0,0 +1,109 @@
+"""Prometheus 지표
+
+페이지 함수 렌더링 시간, 평가 방법별 계산 시간, 결과 캐시 적중/미스, 업로드 건수·바이트, 활성 세션 수를
+METRICS_PORT(기본 9464) 포트의 /metrics로 내보냅니다 (기본 주소 127.0.0.1, METRICS_ADDR로 변경).
+prometheus_client가 설치되어 있지 않거나 METRICS_PORT=0이면 아무것도 기록하지 않습니다.
+"""
+import contextlib
+import functools
+import os
+import time
+
+import streamlit as st
+
+from valuation import RESULT_CACHE
+from views.session import load_session_store
+
+DEFAULT_METRICS_PORT = 9464
+# 초 단위 구간 (PRD 목표: 페이지 로딩 3초, 계산 5초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0)
+
+
+class _StateCollector:
+    """수집 시점에 결과 캐시와 세션 저장소의 누적 값을 읽어 오는 수집기"""
+
+    def collect(self):
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        cache = RESULT_CACHE.stats()
+        yield CounterMetricFamily('goodwill_result_cache_hits', '평가 결과 캐시 적중 횟수', value=cache['hits'])
+        yield CounterMetricFamily('goodwill_result_cache_misses', '평가 결과 캐시 미스 횟수', value=cache['misses'])
+        yield CounterMetricFamily('goodwill_result_cache_evictions', '평가 결과 캐시 제거 횟수', value=cache['evictions'])
+        yield GaugeMetricFamily('goodwill_result_cache_entries', '평가 결과 캐시 항목 수', value=cache['entries'])
+
+        sessions = load_session_store().stats()
+        yield GaugeMetricFamily('goodwill_active_sessions', '메모리에 올라와 있는 세션 수 (세션 TTL 이내 사용)',
+                                value=sessions['resident'])
+        yield CounterMetricFamily('goodwill_session_restores', '디스크에서 복원한 세션 수', value=sessions['loads'])
+        yield CounterMetricFamily('goodwill_session_writes', '디스크에 저장한 세션 수', value=sessions['writes'])
+
+
+class AppMetrics:
+    """앱에서 직접 기록하는 지표 묶음"""
+
+    def __init__(self, registry):
+        from prometheus_client import Counter, Histogram
+
+        self.registry = registry
+        self.page_seconds = Histogram('goodwill_page_render_seconds', '페이지 함수 렌더링 시간 (초)',
+                                      ['page'], buckets=LATENCY_BUCKETS, registry=registry)
+        self.valuation_seconds = Histogram('goodwill_valuation_seconds', '평가 방법별 계산 시간 (초)',
+                                           ['method'], buckets=LATENCY_BUCKETS, registry=registry)
+        self.uploads = Counter('goodwill_uploads', '처리한 업로드 파일 수', ['kind'], registry=registry)
+        self.upload_bytes = Counter('goodwill_upload_bytes', '처리한 업로드 파일 크기 (바이트)', ['kind'], registry=registry)
+        registry.register(_StateCollector())
+
+
+# 지표와 HTTP 서버 (프로세스당 한 번만 생성)
+@st.cache_resource
+def load_metrics():
+    port = int(os.environ.get('METRICS_PORT', DEFAULT_METRICS_PORT))
+    if not port:
+        return None
+    try:
+        from prometheus_client import CollectorRegistry, start_http_server
+    except ImportError:
+        return None
+
+    metrics = AppMetrics(CollectorRegistry())
+    try:
+        start_http_server(port, addr=os.environ.get('METRICS_ADDR', '127.0.0.1'), registry=metrics.registry)
+    except OSError:
+        # 포트를 이미 쓰고 있어도 앱은 계속 동작 (지표만 노출되지 않음)
+        pass
+    return metrics
+
+
+def timed_page(page_function):
+    """페이지 함수 렌더링 시간을 기록 (st.fragment 안쪽에 적용해 부분 재실행도 측정)"""
+    @functools.wraps(page_function)
+    def wrapper(*args, **kwargs):
+        metrics = load_metrics()
+        started = time.perf_counter()
+        try:
+            return page_function(*args, **kwargs)
+        finally:
+            if metrics is not None:
+                metrics.page_seconds.labels(page_function.__name__).observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def timed_valuation(method):
+    """with 블록의 평가 계산 시간을 기록"""
+    metrics = load_metrics()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.valuation_seconds.labels(method).observe(time.perf_counter() - started)
+
+
+def record_upload(kind, size):
+    """업로드 파일 처리 건수와 크기 기록"""
+    metrics = load_metrics()
+    if metrics is not None:
+        metrics.uploads.labels(kind).inc()
+        metrics.upload_bytes.labels(kind).inc(size or 0)
@@ -0,0 +1,45 @@
+"""페이지 목록과 이동
+
+st.navigation에 등록할 페이지를 만들고, 페이지 모듈은 처음 방문할 때만 가져옵니다.
+"""
+import importlib
+
+import streamlit as st
+
+# 페이지 ID(URL 경로) → (제목, 아이콘, 모듈, 함수)
+PAGES = {
+    'home': ('홈', '🏠', 'views.home', 'home_page'),
+    'company_info': ('기업 정보 입력', '📝', 'views.company_info', 'company_info_page'),
+    'excess_earnings': ('초과이익법', '📊', 'views.excess_earnings', 'excess_earnings_page'),
+    'dcf': ('현금흐름할인법', '💹', 'views.dcf', 'dcf_page'),
+    'market_comparison': ('시장가치비교법', '🔍', 'views.market_comparison', 'market_comparison_page'),
+    'statutory': ('상증법 보충적 평가', '⚖️', 'views.statutory', 'statutory_page'),
+    'portfolio': ('포트폴리오 평가', '🗂️', 'views.portfolio', 'portfolio_page'),
+    'scenarios': ('시나리오 비교', '🧭', 'views.scenarios', 'scenarios_page'),
+    'results': ('종합 결과', '📈', 'views.results', 'results_page'),
+    'report': ('보고서', '📑', 'views.report', 'report_page'),
+}
+DEFAULT_PAGE = 'home'
+
+
+def _lazy_page(page_id):
+    """호출될 때 페이지 모듈을 가져와 실행하는 함수 (이미 가져온 모듈은 재사용)"""
+    module_name, function_name = PAGES[page_id][2:]
+
+    def render():
+        getattr(importlib.import_module(module_name), function_name)()
+
+    render.__name__ = f"{page_id}_page"
+    return render
+
+
+def page(page_id) -> st.Page:
+    """페이지 ID에 해당하는 st.Page (URL 경로가 같으면 같은 페이지로 인식)"""
+    title, icon, _, _ = PAGES[page_id]
+    return st.Page(_lazy_page(page_id), title=title, icon=icon, url_path=page_id,
+                   default=page_id == DEFAULT_PAGE)
+
+
+def go_to(page_id):
+    """다른 페이지로 이동"""
+    st.switch_page(page(page_id))
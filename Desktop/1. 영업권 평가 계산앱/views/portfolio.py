@@ -0,0 +1,131 @@
+"""포트폴리오 일괄 평가 페이지"""
+import streamlit as st
+import pandas as pd
+import io
+import os
+import tempfile
+import time
+
+from valuation import (
+    METRIC_OPTIONS,
+    SUPPORTED_EXTENSIONS,
+    DCFInput,
+    ExcessEarningsInput,
+    MarketComparisonInput,
+    PortfolioInput,
+    PortfolioWriter,
+    StatutoryGoodwillInput,
+    ValuationError,
+    read_portfolio,
+    split_companies,
+    value_portfolio,
+)
+from views.common import load_benchmark_store
+from views.metrics import record_upload, timed_page, timed_valuation
+
+@st.cache_data(max_entries=4, show_spinner="포트폴리오 파일을 검증하는 중...")
+def load_portfolio_upload(upload_key, _uploaded_file):
+    record_upload('portfolio', _uploaded_file.size)
+    return read_portfolio(_uploaded_file, _uploaded_file.name)
+
+
+# 포트폴리오 일괄 평가 페이지
+@st.fragment
+@timed_page
+def portfolio_page():
+    st.title("포트폴리오 일괄 평가")
+    st.markdown("기업·연도별 재무 데이터가 담긴 파일(`회사명` 컬럼 포함)을 올리면 모든 기업을 네 가지 방법(상증법 보충적 평가 포함)으로 한 번에 평가합니다.")
+    
+    uploaded_file = st.file_uploader("포트폴리오 파일 업로드 (CSV, Excel, Parquet)", type=SUPPORTED_EXTENSIONS,
+                                     key="portfolio_upload")
+    if uploaded_file is None:
+        return
+    
+    try:
+        upload_key = (getattr(uploaded_file, 'file_id', uploaded_file.name), uploaded_file.size)
+        portfolio_data = load_portfolio_upload(upload_key, uploaded_file)
+    except ValuationError as e:
+        st.error(str(e))
+        return
+    
+    companies = split_companies(portfolio_data)
+    st.caption(f"총 {len(portfolio_data):,}행, {len(companies):,}개 기업")
+    
+    # 포트폴리오 공통 매개변수
+    with st.form("portfolio_params"):
+        st.subheader("평가 매개변수 설정")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**초과이익법**")
+            normal_roi = st.number_input("정상 자본수익률 (%)", value=10.0, step=0.5)
+            excess_years = st.number_input("초과이익 인정연수", min_value=1, max_value=20, value=5)
+            excess_discount_rate = st.slider("할인율 (%)", min_value=5.0, max_value=30.0, value=12.0, step=0.5,
+                                             key="portfolio_excess_discount")
+        
+        with col2:
+            st.markdown("**현금흐름할인법**")
+            growth_rate = st.number_input("연간 매출 성장률 (%)", value=5.0, step=0.5)
+            operating_margin = st.number_input("영업이익률 (%)", value=10.0, step=0.5)
+            discount_rate = st.slider("할인율 (WACC, %)", min_value=5.0, max_value=30.0, value=12.0, step=0.5,
+                                      key="portfolio_dcf_discount")
+            terminal_growth_rate = st.slider("영구 성장률 (%)", min_value=0.0, max_value=5.0, value=1.0, step=0.1)
+            forecast_period = st.number_input("예측 기간 (년)", min_value=1, max_value=20, value=5)
+        
+        with col3:
+            st.markdown("**시장가치비교법**")
+            selected_metric = st.selectbox("비교 지표", options=METRIC_OPTIONS, index=1)
+            industry = st.selectbox("업종", options=load_benchmark_store().industries())
+            output_format = st.radio("결과 파일 형식", options=['csv', 'parquet'], horizontal=True)
+        
+        run_button = st.form_submit_button("일괄 평가 실행")
+    
+    if run_button:
+        params = PortfolioInput(
+            excess_earnings=ExcessEarningsInput(normal_roi=normal_roi, excess_years=int(excess_years),
+                                                discount_rate=excess_discount_rate),
+            dcf=DCFInput.constant_growth(growth_rate, int(forecast_period), operating_margin=operating_margin,
+                                         discount_rate=discount_rate, terminal_growth_rate=terminal_growth_rate),
+            market=MarketComparisonInput(selected_metric=selected_metric),
+            statutory=StatutoryGoodwillInput(),
+            industry=industry
+        )
+        
+        # 끝난 묶음부터 임시 파일에 이어 쓰며 진행률(초당 기업 수) 표시
+        progress = st.progress(0.0, text="평가를 시작합니다...")
+        started = time.perf_counter()
+        done = 0
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"portfolio_results.{output_format}")
+            with PortfolioWriter(path, output_format) as writer, timed_valuation('portfolio'):
+                for rows in value_portfolio(companies, params):
+                    writer.write(rows)
+                    done += len(rows)
+                    rate = done / max(time.perf_counter() - started, 1e-9)
+                    progress.progress(done / len(companies),
+                                      text=f"{done:,}/{len(companies):,}개 기업 평가 완료 ({rate:,.0f}개/초)")
+            with open(path, 'rb') as handle:
+                output = handle.read()
+        
+        st.session_state.portfolio_output = {
+            'format': output_format,
+            'data': output,
+            'companies': done,
+            'elapsed': time.perf_counter() - started
+        }
+    
+    # 평가 결과 (다시 그려도 유지)
+    output = st.session_state.get('portfolio_output')
+    if output:
+        st.success(f"{output['companies']:,}개 기업 평가 완료 ({output['elapsed']:.1f}초)")
+        if output['format'] == 'csv':
+            preview = pd.read_csv(io.BytesIO(output['data']), nrows=100, encoding='utf-8-sig')
+        else:
+            preview = pd.read_parquet(io.BytesIO(output['data'])).head(100)
+        st.dataframe(preview, hide_index=True, use_container_width=True)
+        st.download_button(
+            label=f"결과 다운로드 ({output['format'].upper()})",
+            data=output['data'],
+            file_name=f"portfolio_results.{output['format']}",
+            mime='text/csv' if output['format'] == 'csv' else 'application/octet-stream'
+        )
@@ -0,0 +1,92 @@
+"""보고서 페이지"""
+import streamlit as st
+import pandas as pd
+from datetime import date
+
+from valuation.report import DISCLAIMER, DONE, FAILED, REPORT_JOBS, report_key
+from views.charts import bar_figure
+from views.metrics import timed_page
+from views.session import autosave
+
+
+# 보고서 생성이 끝날 때까지 1초마다 이 부분만 다시 확인
+@st.fragment(run_every=1.0)
+def report_progress(key):
+    state, _ = REPORT_JOBS.status(key)
+    if state != DONE and state != FAILED:
+        st.download_button(label="PDF 보고서 다운로드", data=b'', disabled=True)
+        st.caption("PDF 보고서를 만드는 중입니다. 그동안 미리보기를 확인하세요.")
+        return
+    # 완료되면 페이지 전체를 다시 실행해 다운로드 버튼을 표시
+    st.rerun()
+
+
+def report_download(key, file_name, generated_on):
+    """완성된 보고서는 다운로드 버튼, 생성 중이면 진행 표시"""
+    state, payload = REPORT_JOBS.status(key)
+    if state == DONE:
+        st.download_button(label="PDF 보고서 다운로드", data=payload, file_name=file_name, mime="application/pdf")
+        st.caption(f"PDF {len(payload) / 1024:,.0f}KB")
+    elif state == FAILED:
+        st.error(f"PDF 보고서를 만들지 못했습니다: {payload}")
+        if st.button("다시 시도"):
+            REPORT_JOBS.submit(key, st.session_state.company_data, st.session_state.valuation_results, generated_on)
+            st.rerun()
+    else:
+        report_progress(key)
+
+
+# 보고서 페이지
+@st.fragment
+@timed_page
+@autosave
+def report_page():
+    st.title("평가 보고서")
+
+    if not st.session_state.valuation_results:
+        st.warning("아직 평가된 결과가 없습니다. 먼저 평가 방법을 선택하여 계산해주세요.")
+        return
+
+    # 평가 결과와 평가일이 같으면 이미 만든 PDF를 그대로 사용 (백그라운드에서 생성하므로 페이지는 바로 표시)
+    today = date.today()
+    key = report_key(st.session_state.company_data, st.session_state.valuation_results, today)
+    REPORT_JOBS.submit(key, st.session_state.company_data, st.session_state.valuation_results, today)
+    report_download(key, f"{st.session_state.company_data.get('name')}_영업권평가보고서.pdf", today)
+
+    # 전문가 검토 안내
+    st.warning(f"""
+    ### ⚠️ 전문가 검토 필요
+    {DISCLAIMER}
+    """)
+
+    # 간단한 미리보기
+    st.subheader("보고서 미리보기")
+
+    # 회사 정보
+    st.markdown(f"""
+    ## 영업권 가치 평가 보고서
+
+    **회사명**: {st.session_state.company_data.get('name')}
+    **산업**: {st.session_state.company_data.get('industry')}
+    **사업자등록번호**: {st.session_state.company_data.get('business_number')}
+    **평가일**: {today.strftime('%Y-%m-%d')}
+
+    ### 평가 결과 요약
+    """)
+
+    # 결과 테이블
+    methods = list(st.session_state.valuation_results.keys())
+    values = [st.session_state.valuation_results[method]['value'] for method in methods]
+    methods_names = [st.session_state.valuation_results[method]['method'] for method in methods]
+
+    results_df = pd.DataFrame({
+        '평가 방법': methods_names,
+        '영업권 가치(원)': [f"{value:,.0f}" for value in values]
+    })
+    st.dataframe(results_df, hide_index=True, use_container_width=True)
+
+    # 차트
+    fig = bar_figure(methods_names, values, '평가 방법별 영업권 가치 비교', '평가 방법', '영업권 가치')
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.caption("PDF 보고서에는 초과이익법 상세 계산 과정, DCF 예측표, 시장가치비교법 내역과 차트가 함께 포함됩니다.")
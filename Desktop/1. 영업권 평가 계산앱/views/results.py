@@ -0,0 +1,195 @@
+"""종합 결과 페이지"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from valuation import (
+    MAX_SIMPLEX_POINTS,
+    SIMPLEX_MODES,
+    TORNADO_COLUMNS,
+    ValuationError,
+    dirichlet_weights,
+    explore_weights,
+    normalize_weights,
+    simplex_grid,
+    tornado_analysis,
+    weighted_goodwill,
+)
+from views.charts import bar_figure, histogram_figure, pie_figure, ternary_figure, tornado_figure
+from views.metrics import timed_page
+from views.navigation import go_to
+from views.session import autosave
+
+TERNARY_MAX_POINTS = 5000  # 삼각도에 그릴 최대 점 수 (브라우저 부담 제한)
+
+
+# 가중치 전체 범위 탐색 (슬라이더를 하나씩 움직이는 대신 모든 가중치 조합의 가중평균을 한 번에 계산)
+def weight_exploration_section(methods_names, values, current_value):
+    if not st.toggle("가중치 전체 범위 탐색", key="weight_exploration",
+                     help="합이 1인 모든 가중치 조합에 대한 가중평균의 범위와 목표 가치에 맞는 가중치 영역을 보여줍니다."):
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        mode = st.radio("탐색 방식", list(SIMPLEX_MODES), format_func=SIMPLEX_MODES.get, key="simplex_mode")
+    with col2:
+        if mode == 'grid':
+            step = st.select_slider("격자 간격", options=[0.1, 0.05, 0.02, 0.01], value=0.01, key="simplex_step")
+        else:
+            samples = st.number_input("표본 수", min_value=1000, max_value=MAX_SIMPLEX_POINTS, value=100_000,
+                                      step=10_000, key="simplex_samples")
+            alpha = st.number_input("집중도 (alpha)", min_value=0.1, max_value=10.0, value=1.0, step=0.1,
+                                    key="simplex_alpha", help="1이면 모든 조합이 고르게, 클수록 균등 가중치 근처에 집중됩니다.")
+    with col3:
+        target = st.number_input("목표 영업권 가치(원)", value=float(round(current_value)), step=10_000_000.0,
+                                 format="%.0f", key="simplex_target")
+        tolerance = st.slider("허용 오차 (%)", min_value=1, max_value=20, value=5, key="simplex_tolerance") / 100
+
+    try:
+        if mode == 'grid':
+            weights = simplex_grid(len(values), step)
+        else:
+            weights = dirichlet_weights(len(values), int(samples), alpha, seed=0)
+    except ValuationError as e:
+        st.error(str(e))
+        return
+    exploration = explore_weights(values, weights, target, tolerance)
+
+    cols = st.columns(5)
+    for col, (label, value) in zip(cols, [("최소", exploration.min), ("P5", exploration.percentiles[5]),
+                                          ("중앙값", exploration.percentiles[50]), ("P95", exploration.percentiles[95]),
+                                          ("최대", exploration.max)]):
+        col.metric(label, f"{value:,.0f}원")
+
+    counts, edges = np.histogram(exploration.values, bins=50)
+    fig = histogram_figure((edges[:-1] + edges[1:]) / 2, counts, '가중평균 영업권 가치 분포', '영업권 가치', '가중치 조합 수',
+                           {'목표': target, '현재 가중치': current_value})
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"가중치 조합 {len(weights):,}개 | 목표 ±{tolerance:.0%} 안에 드는 조합 {exploration.hit_share:.1%}")
+
+    ranges = exploration.hit_weight_ranges()
+    if ranges is None:
+        st.info(f"목표 범위에 드는 가중치 조합이 없습니다. 가능한 가중평균 범위는 "
+                f"{exploration.min:,.0f}원 ~ {exploration.max:,.0f}원입니다.")
+        return
+    st.dataframe(pd.DataFrame({
+        '평가 방법': methods_names,
+        '최소 가중치': [f"{low:.0%}" for low, _ in ranges],
+        '최대 가중치': [f"{high:.0%}" for _, high in ranges],
+    }), hide_index=True, use_container_width=True)
+
+    if len(values) == 3:
+        shown = np.linspace(0, len(weights) - 1, min(len(weights), TERNARY_MAX_POINTS)).astype(int)
+        fig = ternary_figure(weights[shown], exploration.hits[shown], methods_names, '목표 범위에 드는 가중치 영역 (빨간 점)')
+        st.plotly_chart(fig, use_container_width=True)
+
+
+# 토네이도 분석 (평가된 모든 방법의 매개변수를 하나씩 ±X% 바꿨을 때의 영업권 변화 순위)
+def tornado_section():
+    if not st.toggle("매개변수 토네이도 분석", key="tornado_analysis",
+                     help="각 평가 방법의 매개변수를 하나씩 위아래로 바꿔 영업권에 영향이 큰 순서로 보여줍니다."):
+        return
+
+    flex = st.slider("매개변수 변화 폭 (±%)", min_value=1, max_value=50, value=10, key="tornado_flex")
+    try:
+        tornado = tornado_analysis(st.session_state.company_data.get('financial_data'),
+                                   st.session_state.valuation_results, flex)
+    except Exception as e:
+        st.error(f"토네이도 분석 중 오류가 발생했습니다: {e}")
+        return
+    if tornado.empty:
+        st.info("토네이도 분석을 지원하는 평가 결과가 없습니다.")
+        return
+
+    method, parameter, base, low, high, span = TORNADO_COLUMNS
+    labels = (tornado[method] + ' · ' + tornado[parameter]).tolist()
+    fig = tornado_figure(labels, (tornado[low] - tornado[base]).tolist(), (tornado[high] - tornado[base]).tolist(),
+                         '매개변수별 영업권 영향 (기준 대비 변화)', '영업권 변화(원)', flex)
+    st.plotly_chart(fig, use_container_width=True)
+
+    table = tornado.copy()
+    for column in (base, low, high, span):
+        table[column] = table[column].map(lambda value: f"{value:,.0f}" if pd.notna(value) else "-")
+    st.dataframe(table, hide_index=True, use_container_width=True)
+    st.caption(f"매개변수 {len(tornado)}개 × 하향·상향 {flex}%를 방법별로 한 번에 계산했습니다. "
+               "초과이익 지속 연수는 ±1년, 매출 성장률은 연도별 일정 전체를 평행 이동하며, "
+               "기준값이 0인 매개변수는 변화가 없고, 영업권을 계산할 수 없는 경우는 '-'로 표시합니다.")
+
+
+# 종합 결과 페이지
+@st.fragment
+@timed_page
+@autosave
+def results_page():
+    st.title("종합 평가 결과")
+    
+    # 결과가 없는 경우
+    if not st.session_state.valuation_results:
+        st.warning("아직 평가된 결과가 없습니다. 먼저 평가 방법을 선택하여 계산해주세요.")
+        return
+    
+    # 회사 정보 표시
+    st.subheader(f"{st.session_state.company_data.get('name')} 영업권 평가 결과")
+    st.caption(f"산업: {st.session_state.company_data.get('industry')} | 평가일: {datetime.now().strftime('%Y-%m-%d')}")
+    
+    # 전문가 자문 안내
+    st.warning("""
+    ### ⚠️ 주의사항
+    본 평가 결과는 참고용이며, 실제 의사결정에는 세무사, 회계사, 감정평가사 등 전문가의 자문을 받으시기 바랍니다.
+    특히 법인 전환, M&A, 세무신고 등의 목적으로 사용할 경우 반드시 전문가의 검토가 필요합니다.
+    """)
+    
+    # 결과 요약
+    methods = list(st.session_state.valuation_results.keys())
+    values = [st.session_state.valuation_results[method]['value'] for method in methods]
+    methods_names = [st.session_state.valuation_results[method]['method'] for method in methods]
+    
+    # 차트로 결과 표시
+    fig = bar_figure(methods_names, values, '평가 방법별 영업권 가치 비교', '평가 방법', '영업권 가치')
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # 결과 테이블
+    results_df = pd.DataFrame({
+        '평가 방법': methods_names,
+        '영업권 가치(원)': [f"{value:,.0f}" for value in values]
+    })
+    st.dataframe(results_df, hide_index=True, use_container_width=True)
+    
+    # 가중평균 계산 (방법이 2개 이상인 경우)
+    if len(methods) > 1:
+        st.subheader("가중평균 영업권 가치")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            weights = {}
+            for method in methods:
+                weights[method] = st.slider(
+                    f"{st.session_state.valuation_results[method]['method']} 가중치",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=1.0/len(methods),
+                    step=0.05,
+                    key=f"weight_{method}"
+                )
+            
+            # 가중치 정규화 후 가중평균 계산
+            normalized = normalize_weights([weights[method] for method in methods])
+            weights = dict(zip(methods, normalized))
+            weighted_value = weighted_goodwill(values, normalized)
+            
+            st.metric("최종 영업권 가치", f"{weighted_value:,.0f}원")
+        
+        with col2:
+            # 가중치 파이 차트
+            fig = pie_figure(methods_names, list(weights.values()), '평가 방법 가중치')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        weight_exploration_section(methods_names, values, weighted_value)
+    
+    tornado_section()
+    
+    # 보고서 페이지로 이동
+    if st.button("보고서 생성하기"):
+        go_to('report')
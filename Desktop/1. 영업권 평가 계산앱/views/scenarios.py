@@ -0,0 +1,123 @@
+"""시나리오 비교 페이지 (이름 있는 매개변수 묶음 저장·편집·일괄 비교, Parquet 내보내기/가져오기)"""
+import streamlit as st
+import pandas as pd
+
+from valuation import (
+    SCENARIO_NAME,
+    ValuationError,
+    add_scenario,
+    compare_scenarios,
+    merge_scenarios,
+    normalize_scenarios,
+    read_scenarios,
+    scenarios_to_parquet,
+)
+from views.charts import grouped_bar_figure
+from views.common import load_benchmark_store
+from views.metrics import timed_page
+from views.navigation import go_to
+from views.session import autosave
+
+
+def replace_scenarios(scenarios):
+    """시나리오 표를 바꾸고 편집기·업로드 위젯을 새로 만들도록 버전을 올림"""
+    st.session_state.scenarios = normalize_scenarios(scenarios)
+    st.session_state.scenario_version = st.session_state.get('scenario_version', 0) + 1
+
+
+# 시나리오 비교 페이지
+@st.fragment
+@timed_page
+@autosave
+def scenarios_page():
+    st.title("시나리오 비교")
+    
+    # 기업 데이터 확인
+    if st.session_state.company_data.get('name') == '':
+        st.warning("기업 정보가 입력되지 않았습니다. 먼저 기업 정보를 입력해주세요.")
+        if st.button("기업 정보 입력으로 이동"):
+            go_to('company_info')
+        return
+    
+    st.markdown("""
+    기본·낙관·비관·인수자 관점처럼 이름을 붙인 매개변수 묶음을 저장해 두고, 모든 시나리오를 한 번에 다시 계산해 비교합니다.
+    각 평가 페이지에서 계산한 뒤 현재 평가를 시나리오로 저장하고, 아래 표에서 행을 추가하거나 값을 바꿔 변형 시나리오를 만드세요.
+    """)
+    
+    scenarios = normalize_scenarios(st.session_state.get('scenarios'))
+    version = st.session_state.get('scenario_version', 0)
+    
+    # 현재 평가 결과를 시나리오로 저장
+    with st.form("scenario_save"):
+        name = st.text_input("시나리오 이름", placeholder="예: 기본, 낙관, 비관, 인수자 관점")
+        save_button = st.form_submit_button("현재 평가를 시나리오로 저장")
+    
+    if save_button:
+        try:
+            replace_scenarios(add_scenario(scenarios, name, st.session_state.valuation_results))
+            st.rerun()
+        except ValuationError as e:
+            st.error(str(e))
+    
+    # Parquet 가져오기
+    uploaded_file = st.file_uploader("시나리오 가져오기 (Parquet)", type=['parquet'], key=f"scenario_upload_{version}")
+    if uploaded_file is not None:
+        try:
+            replace_scenarios(merge_scenarios(scenarios, read_scenarios(uploaded_file.getvalue())))
+            st.rerun()
+        except ValuationError as e:
+            st.error(str(e))
+    
+    if scenarios.empty:
+        st.info("저장된 시나리오가 없습니다. 평가 페이지에서 계산한 뒤 현재 평가를 시나리오로 저장하세요.")
+        return
+    
+    # 시나리오 매개변수 표 (열: '평가 방법.매개변수', 연도별 값은 JSON 목록)
+    st.subheader("시나리오 매개변수")
+    with st.form("scenario_table"):
+        edited = st.data_editor(
+            scenarios,
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key=f"scenario_editor_{version}",
+            column_config={SCENARIO_NAME: st.column_config.TextColumn("시나리오", required=True)}
+        )
+        apply_button = st.form_submit_button("표 변경 저장")
+    
+    if apply_button:
+        edited = edited[edited[SCENARIO_NAME].notna()]
+        if edited[SCENARIO_NAME].duplicated().any():
+            st.error("시나리오 이름이 중복되었습니다. 이름을 서로 다르게 입력하세요.")
+        else:
+            replace_scenarios(edited)
+            st.rerun()
+    
+    # 모든 시나리오를 방법별로 한 번에 다시 계산
+    st.subheader("시나리오별 영업권 가치")
+    store = load_benchmark_store()
+    industry = store.normalize_industry(st.session_state.company_data.get('industry', '일반'))
+    try:
+        comparison = compare_scenarios(st.session_state.company_data.get('financial_data'), scenarios, industry, store)
+    except Exception as e:
+        st.error(f"시나리오 계산 중 오류가 발생했습니다: {e}")
+        return
+    
+    st.dataframe(comparison.apply(lambda column: column.map(lambda value: f"{value:,.0f}" if pd.notna(value) else "-")),
+                 use_container_width=True)
+    st.caption(f"시나리오 {len(comparison)}개 × 평가 방법 {len(comparison.columns)}개 "
+               "(계산할 수 없거나 시나리오에 없는 방법은 '-')")
+    fig = grouped_bar_figure(
+        comparison.index.tolist(),
+        {method: comparison[method].tolist() for method in comparison.columns},
+        '시나리오별 영업권 가치', '시나리오', '영업권 가치', '평가 방법'
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Parquet 내보내기
+    st.download_button(
+        label="시나리오 내보내기 (Parquet)",
+        data=scenarios_to_parquet(scenarios),
+        file_name=f"{st.session_state.company_data.get('name')}_시나리오.parquet",
+        mime='application/octet-stream'
+    )
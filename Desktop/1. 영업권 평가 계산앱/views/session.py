@@ -0,0 +1,58 @@
+"""세션 자동 저장과 복원
+
+URL의 sid 쿼리 매개변수로 세션을 구분하므로, 같은 주소로 다시 접속하면
+서버가 재시작된 뒤에도 입력한 기업 정보와 평가 결과가 복원됩니다.
+sid는 추측할 수 없는 128비트 난수이지만 별도 인증 없이 세션 전체를 여는 열쇠(bearer token)이므로,
+sid가 들어 있는 주소는 다른 사람과 공유하지 말아야 합니다.
+"""
+import functools
+import os
+import re
+import uuid
+
+import streamlit as st
+
+from valuation import open_session_store
+from valuation.sessions import DEFAULT_SESSION_TTL
+
+SESSION_PARAM = 'sid'
+SESSION_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+
+# 세션 저장소 (프로세스당 하나, 모든 세션 공유)
+@st.cache_resource
+def load_session_store():
+    ttl = float(os.environ.get('SESSION_TTL', DEFAULT_SESSION_TTL))
+    return open_session_store(os.environ.get('SESSION_DB_PATH'), ttl=ttl)
+
+
+def session_id():
+    """현재 세션 ID (세션 상태 → URL → 새 ID 순으로 찾고 URL에도 표시)"""
+    sid = st.session_state.get('session_id')
+    if sid is None:
+        requested = st.query_params.get(SESSION_PARAM, '')
+        sid = requested if SESSION_ID_PATTERN.fullmatch(requested) else uuid.uuid4().hex
+        st.session_state.session_id = sid
+    if st.query_params.get(SESSION_PARAM) != sid:
+        st.query_params[SESSION_PARAM] = sid
+    return sid
+
+
+def restore_session():
+    """저장된 세션을 st.session_state에 채움 (이미 올라와 있으면 바로 반환)"""
+    load_session_store().restore(session_id(), st.session_state)
+
+
+def autosave(page_function):
+    """페이지 실행 후 바뀐 내용을 저장 (st.fragment 안쪽에 적용)
+
+    복원은 전체 실행마다 main.py에서 한 번만 합니다. 프래그먼트만 다시 실행될 때는 세션 상태가 그대로 남아 있습니다.
+    """
+    @functools.wraps(page_function)
+    def wrapper(*args, **kwargs):
+        try:
+            return page_function(*args, **kwargs)
+        finally:
+            load_session_store().save(session_id(), st.session_state)
+
+    return wrapper
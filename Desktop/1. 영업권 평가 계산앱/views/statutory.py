@@ -0,0 +1,125 @@
+"""상증법 보충적 평가 페이지 (상속세및증여세법 시행령 제59조 제2항)"""
+import streamlit as st
+import pandas as pd
+
+from valuation import (
+    StatutoryGoodwillInput,
+    ValuationError,
+    cached_valuation,
+    value_statutory_goodwill,
+)
+from views.charts import bar_figure
+from views.metrics import timed_page, timed_valuation
+from views.navigation import go_to
+from views.session import autosave
+
+# 상증법 보충적 평가 페이지
+@st.fragment
+@timed_page
+@autosave
+def statutory_page():
+    st.title("상증법 보충적 평가")
+
+    # 기업 데이터 확인
+    if st.session_state.company_data.get('name') == '':
+        st.warning("기업 정보가 입력되지 않았습니다. 먼저 기업 정보를 입력해주세요.")
+        if st.button("기업 정보 입력으로 이동"):
+            go_to('company_info')
+        return
+
+    st.subheader(f"{st.session_state.company_data.get('name')} - 상증법 보충적 평가")
+    st.markdown("""
+    법인전환·증여 신고에 쓰는 법정 산식입니다. 최근 3년 당기순이익을 3:2:1(최근 연도부터)로 가중평균한 금액의 50%에서
+    자기자본의 10%를 뺀 초과이익을 5년 동안 10%로 할인한 합계를 영업권으로 봅니다.
+    """)
+
+    # 매개변수 (기본값은 법령 기준)
+    defaults = StatutoryGoodwillInput()
+    with st.form("statutory_params"):
+        with st.expander("법정 비율 변경 (고급)"):
+            col1, col2 = st.columns(2)
+            with col1:
+                earnings_ratio = st.number_input("순손익 반영 비율 (%)", min_value=0.0, max_value=100.0,
+                                                 value=defaults.earnings_ratio, step=5.0)
+                normal_return_rate = st.number_input("자기자본 정상이익률 (%)", min_value=0.0, max_value=30.0,
+                                                     value=defaults.normal_return_rate, step=0.5)
+            with col2:
+                discount_rate = st.number_input("환산 이자율 (%)", min_value=0.0, max_value=30.0,
+                                                value=defaults.discount_rate, step=0.5)
+                years = st.number_input("환산 기간 (년)", min_value=1, max_value=20, value=defaults.years)
+
+        calculate_button = st.form_submit_button("평가 계산")
+
+        if calculate_button:
+            try:
+                params = StatutoryGoodwillInput(
+                    earnings_ratio=earnings_ratio,
+                    normal_return_rate=normal_return_rate,
+                    discount_rate=discount_rate,
+                    years=int(years)
+                )
+                with timed_valuation('statutory'):
+                    result = cached_valuation('statutory', value_statutory_goodwill, st.session_state.company_data.get('financial_data'), params)
+
+                # 결과 저장
+                st.session_state.valuation_results['statutory'] = result.as_dict()
+
+                st.success("상증법 보충적 평가가 완료되었습니다!")
+
+            except ValuationError as e:
+                st.error(str(e))
+                return
+            except Exception as e:
+                st.error(f"계산 중 오류가 발생했습니다: {e}")
+
+    # 계산 결과 표시 (이미 계산된 경우)
+    if 'statutory' in st.session_state.valuation_results:
+        result = st.session_state.valuation_results['statutory']
+        params, details = result['parameters'], result['details']
+
+        st.divider()
+        st.subheader("평가 결과")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric("영업권 평가액", f"{result['value']:,.0f}원")
+            if details['excess_profit'] <= 0:
+                st.info("초과이익이 0 이하이므로 영업권은 0원입니다.")
+
+            # 순손익 가중평균 내역
+            st.subheader("최근 3년 순손익")
+            earnings_df = pd.DataFrame({
+                '연도': details['years'],
+                '당기순이익(원)': [f"{value:,.0f}" for value in details['earnings']],
+                '가중치': details['weights']
+            })
+            st.dataframe(earnings_df, hide_index=True)
+
+        with col2:
+            # 계산 과정 표시
+            with st.expander("상세 계산 과정", expanded=True):
+                st.markdown(f"""
+                #### 1. 순손익 가중평균
+                - 가중평균 = Σ(당기순이익 × 가중치) / Σ가중치 = {details['weighted_earnings']:,.0f}원
+
+                #### 2. 초과이익 계산
+                - 순손익 반영액 = {details['weighted_earnings']:,.0f} × {params['earnings_ratio']}% = {details['earnings_portion']:,.0f}원
+                - 자기자본 정상이익 = {details['equity']:,.0f} × {params['normal_return_rate']}% = {details['normal_return']:,.0f}원
+                - 초과이익 = {details['earnings_portion']:,.0f} - {details['normal_return']:,.0f} = {details['excess_profit']:,.0f}원
+
+                #### 3. 현재가치 환산
+                - {params['years']}년, 이자율 {params['discount_rate']}%, 연금현가계수 {details['annuity_factor']:.4f}
+                - 영업권 = max(초과이익, 0) × {details['annuity_factor']:.4f}
+
+                #### 최종 영업권 가치
+                - **{result['value']:,.0f}원**
+                """)
+
+            values = details['yearly_present_values']
+            fig = bar_figure(list(range(1, len(values) + 1)), values, '연도별 초과이익의 현재가치', '연도', '현재가치')
+            st.plotly_chart(fig, use_container_width=True)
+
+        # 결과 페이지로 이동 버튼
+        if st.button("종합 결과 페이지로 이동"):
+            go_to('results')